@@ -0,0 +1,91 @@
+#!/usr/bin/python3
+"""Times gym name matching on a large synthetic gym list.
+
+Compares the full ``extractOne`` scan ``utils.get_match`` does with
+``meowth.matcher.Matcher`` on the same misspelled queries, and checks
+both pick the same gym. Run from the repository root:
+
+    python3 benchmarks/gym_match.py [--gyms 10000] [--queries 50]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fuzzywuzzy import fuzz, process
+
+from meowth.matcher import Matcher
+
+WORDS = ['Park', 'Church', 'Library', 'Memorial', 'Fountain', 'Statue',
+         'Mural', 'Garden', 'Station', 'Plaza', 'Trail', 'Bridge', 'Chapel',
+         'Playground', 'Sign', 'Monument', 'Gazebo', 'Tower', 'Museum', 'Hall']
+NAMES = ['Oak', 'Maple', 'Cedar', 'Lincoln', 'Washington', 'Riverside',
+         'Hillcrest', 'Lakeview', 'St. Mary', 'Grace', 'Union', 'Liberty',
+         'Pioneer', 'Heritage', 'Sunset', 'Meadow', 'Willow', 'Highland',
+         'Veterans', 'Harbor', 'Central', 'Mill', 'Pine', 'Elm', 'Victory']
+
+def gym_names(count, rng):
+    names = set()
+    while len(names) < count:
+        words = [rng.choice(NAMES), rng.choice(WORDS)]
+        if rng.random() < 0.5:
+            words.append(rng.choice(WORDS))
+        words.append(str(rng.randrange(1000)))
+        names.add(' '.join(words))
+    return sorted(names)
+
+def misspell(name, rng):
+    chars = list(name)
+    for __ in range(rng.randint(1, 3)):
+        i = rng.randrange(len(chars))
+        action = rng.randrange(3)
+        if action == 0:
+            del chars[i]
+        elif action == 1:
+            chars.insert(i, rng.choice('abcdefghijklmnopqrstuvwxyz'))
+        else:
+            chars[i] = rng.choice('abcdefghijklmnopqrstuvwxyz')
+    return ''.join(chars)
+
+def extract_one(names, query):
+    result = process.extractOne(query, names, scorer=fuzz.ratio, score_cutoff=60)
+    return result if result else (None, None)
+
+def timed(func, queries):
+    results = []
+    start = time.perf_counter()
+    for query in queries:
+        results.append(func(query))
+    return (time.perf_counter() - start) / len(queries), results
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--gyms', type=int, default=10000)
+    parser.add_argument('--queries', type=int, default=50)
+    parser.add_argument('--seed', type=int, default=1)
+    args = parser.parse_args()
+    rng = random.Random(args.seed)
+    names = gym_names(args.gyms, rng)
+    queries = [misspell(rng.choice(names), rng) for __ in range(args.queries)]
+
+    start = time.perf_counter()
+    matcher = Matcher(names)
+    build = time.perf_counter() - start
+    scan, expected = timed(lambda q: extract_one(names, q), queries)
+    matched, results = timed(matcher.match, queries)
+    cached, __ = timed(matcher.match, queries)
+
+    mismatches = sum(1 for a, b in zip(expected, results) if a[1] != b[1] or a[0] != b[0])
+    print(f'{len(names)} gyms, {len(queries)} queries')
+    print(f'extractOne:      {scan * 1000:8.2f} ms/query')
+    print(f'Matcher:         {matched * 1000:8.2f} ms/query ({scan / matched:.1f}x), built in {build * 1000:.0f} ms')
+    print(f'Matcher, cached: {cached * 1e6:8.2f} us/query')
+    print(f'Different results: {mismatches}')
+    return 1 if mismatches else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
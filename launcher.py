@@ -3,6 +3,7 @@
 import sys
 import os
 import time
+import asyncio
 import subprocess
 import argparse
 
@@ -19,6 +20,13 @@ def parse_cli_args():
         help=("Prevents output being sent to Discord DM, "
               "as restarting could occur often."),
         action="store_true")
+    parser.add_argument(
+        "--workers", "-w", type=int, default=1,
+        help="Runs Meowth as this many processes, splitting the shards.")
+    parser.add_argument(
+        "--shards", "-s", type=int,
+        help="Total number of shards when running several workers. "
+             "Defaults to one per worker.")
     return parser.parse_args()
 
 def run_meowth(autorestart):
@@ -65,6 +73,69 @@ def run_meowth(autorestart):
 
     print("Meowth has closed. Exit code: {exit_code}".format(exit_code=code))
 
+async def supervise_worker(config, autorestart):
+    """Runs one worker of a cluster, restarting it like run_meowth."""
+    cmd = [sys.executable, "-m", "meowth", "launcher"]
+    if args.debug:
+        cmd.append("debug")
+    env = dict(os.environ, **config.to_env())
+    name = "Worker {worker} (shards {first}-{last})".format(
+        worker=config.worker, first=config.shard_ids[0],
+        last=config.shard_ids[-1])
+
+    retries = 0
+
+    while True:
+        proc = await asyncio.create_subprocess_exec(*cmd, env=env)
+        code = await proc.wait()
+        if code == 0:
+            break
+        elif code == 26:
+            #standard restart
+            retries = 0
+            print("Restarting {name}".format(name=name))
+            continue
+        else:
+            if not autorestart:
+                break
+            retries += 1
+            wait_time = min([retries^2, 60])
+            print("{name} experienced a crash. Restarting in {wait}s".format(
+                name=name, wait=wait_time))
+            await asyncio.sleep(wait_time)
+
+    print("{name} has closed. Exit code: {exit_code}".format(
+        name=name, exit_code=code))
+    return code
+
+def run_cluster(workers, shard_count, autorestart):
+    """Runs Meowth as several worker processes, each connecting its own
+    range of shards, with a coordinator relaying owner commands between
+    them over a local socket."""
+    from meowth import storage
+    from meowth.cluster import ClusterConfig, Coordinator, shard_ranges
+
+    if shard_count < workers:
+        raise RuntimeError("Need at least one shard per worker")
+    storage.migrate()
+
+    loop = asyncio.get_event_loop()
+    coordinator = Coordinator()
+    address = loop.run_until_complete(coordinator.start())
+    supervisors = [
+        supervise_worker(
+            ClusterConfig(worker, shard_ids, shard_count, address), autorestart)
+        for worker, shard_ids in enumerate(shard_ranges(shard_count, workers))
+    ]
+    try:
+        loop.run_until_complete(asyncio.gather(*supervisors))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        loop.run_until_complete(coordinator.close())
+
+    print("Meowth has closed.")
+
 args = parse_cli_args()
 
 if __name__ == '__main__':
@@ -72,4 +143,9 @@ if __name__ == '__main__':
     dirname = os.path.dirname(abspath)
     os.chdir(dirname)
     print("Launching Meowth...")
-    run_meowth(autorestart=args.auto_restart)
+    if args.workers > 1:
+        run_cluster(
+            args.workers, args.shards or args.workers,
+            autorestart=args.auto_restart)
+    else:
+        run_meowth(autorestart=args.auto_restart)
@@ -7,10 +7,8 @@ import gettext
 import io
 import json
 import os
-import pickle
 import re
 import sys
-import tempfile
 import textwrap
 import time
 import traceback
@@ -20,7 +18,6 @@ from io import BytesIO
 from operator import itemgetter
 from time import strftime
 
-import aiohttp
 import dateparser
 import hastebin
 from dateutil import tz
@@ -31,59 +28,71 @@ from discord.ext import commands
 
 from meowth import checks
 from meowth import pkmn_match
+from meowth import storage
 from meowth import utils
+from meowth.archive import LogReplayer
 from meowth.bot import MeowthBot
+from meowth.classifier import MessageClassifier
+from meowth.cluster import ClusterConfig, WorkerLink
+from meowth.editor import MessageEditor
+from meowth.emojis import EmojiCache
 from meowth.errors import custom_error_handling
 from meowth.logs import init_loggers
+from meowth.messages import MessageCache
+from meowth.metrics import MetricsServer
+from meowth.pokebattler import PokebattlerClient
+from meowth.pokedex import Pokedex
+from meowth.reaper import MessageReaper
+from meowth.reactions import ReactionRouter, ReactionScheduler
+from meowth.roles import RoleIndex
+from meowth.scheduler import DeadlineScheduler, ExpiryIndex
+from meowth.settings import RaidData
+from meowth.timing import StageTimer
+from meowth.typechart import TypeMatrix
 
 logger = init_loggers()
+startup = StageTimer('Startup Timing')
 
 def _get_prefix(bot, message):
-    guild = message.guild
-    try:
-        prefix = bot.guild_dict[guild.id]['configure_dict']['settings']['prefix']
-    except (KeyError, AttributeError):
-        prefix = None
-    if not prefix:
-        prefix = bot.config['default_prefix']
-    return commands.when_mentioned_or(prefix)(bot, message)
+    return bot.prefixes.get(message.guild)
+
+# set by the launcher when it runs several workers
+cluster = ClusterConfig.from_env()
 
 Meowth = MeowthBot(
     command_prefix=_get_prefix, case_insensitive=True,
-    activity=discord.Game(name="Pokemon Go"))
+    activity=discord.Game(name="Pokemon Go"), **cluster.bot_options())
 
 custom_error_handling(Meowth, logger)
-try:
-    with open(os.path.join('data', 'serverdict'), 'rb') as fd:
-        Meowth.guild_dict = pickle.load(fd)
-    logger.info('Serverdict Loaded Successfully')
-except OSError:
-    logger.info('Serverdict Not Found - Looking for Backup')
-    try:
-        with open(os.path.join('data', 'serverdict_backup'), 'rb') as fd:
-            Meowth.guild_dict = pickle.load(fd)
-        logger.info('Serverdict Backup Loaded Successfully')
-    except OSError:
-        logger.info('Serverdict Backup Not Found - Creating New Serverdict')
-        Meowth.guild_dict = {
-
-        }
-        with open(os.path.join('data', 'serverdict'), 'wb') as fd:
-            pickle.dump(Meowth.guild_dict, fd, (- 1))
-        logger.info('Serverdict Created')
+Meowth.startup = startup
+Meowth.reaction_router = ReactionRouter()
+Meowth.messages = MessageCache()
+Meowth.cluster = cluster
+Meowth.cluster_link = WorkerLink(cluster)
+with startup.stage('serverdict'):
+    Meowth.guild_store = storage.open_store()
+    # guilds are unpickled on first use, not before connecting
+    Meowth.guild_dict = Meowth.guild_store.load(lazy=True, keep=cluster.owns)
+    Meowth.wild_reports = storage.WildReportStore(Meowth.guild_store)
+    Meowth.wild_reports.load(keep=cluster.owns)
+    if Meowth.wild_reports.needs_import:
+        count = Meowth.wild_reports.import_guilds(Meowth.guild_dict)
+        logger.info(f'Moved {count} wild reports out of the serverdict')
+logger.info('Serverdict Loaded Successfully')
 
 
 guild_dict = Meowth.guild_dict
+wild_reports = Meowth.wild_reports
 
 
 config = {}
 pkmn_info = {}
 type_chart = {}
 type_list = []
+type_matrix = None
 raid_info = {}
+pokedex = None
 
-active_raids = []
-active_wilds = []
 # Append path of this script to the path of
 # config files which we're loading.
 # Assumes that config files will always live in the same directory.
@@ -98,7 +107,9 @@ def load_config():
     global pkmn_info
     global type_chart
     global type_list
+    global type_matrix
     global raid_info
+    global pokedex
     # Load configuration
     with open('config.json', 'r') as fd:
         config = json.load(fd)
@@ -120,18 +131,26 @@ def load_config():
         type_chart = json.load(fd)
     with open(os.path.join('data', 'type_list.json'), 'r') as fd:
         type_list = json.load(fd)
-    # Set spelling dictionary to our list of Pokemon
-    pkmn_match.set_list(pkmn_info['pokemon_list'])
+    type_matrix = TypeMatrix(type_chart, type_list)
+    Meowth.type_matrix = type_matrix
+    # Index names and numbers so lookups don't scan the list
+    pokedex = Pokedex(pkmn_info['pokemon_list'])
+    # Spellcheck against the same matcher
+    pkmn_match.set_matcher(pokedex.matcher)
+    Meowth.pokedex = pokedex
+    # rebound on every load, so reload_json reaches the bot's copies
+    Meowth.config = config
+    Meowth.pkmn_info = pkmn_info
+    Meowth.raid_info = raid_info
+    Meowth.type_list = type_list
+    Meowth.type_chart = type_chart
+    # the default prefix may have changed
+    Meowth.prefixes.clear()
     return (pokemon_path_source, raid_path_source)
 
-pkmn_path, raid_path = load_config()
-
-Meowth.pkmn_info = pkmn_info
-Meowth.raid_info = raid_info
-Meowth.type_list = type_list
-Meowth.type_chart = type_chart
+with startup.stage('config'):
+    pkmn_path, raid_path = load_config()
 
-Meowth.config = config
 Meowth.pkmn_info_path = pkmn_path
 Meowth.raid_json_path = raid_path
 
@@ -139,7 +158,8 @@ default_exts = ['datahandler', 'tutorial', 'silph', 'utilities', 'pokemon', 'tra
 
 for ext in default_exts:
     try:
-        Meowth.load_extension(f"meowth.exts.{ext}")
+        with startup.stage(f'ext {ext}'):
+            Meowth.load_extension(f"meowth.exts.{ext}")
     except Exception as e:
         print(f'**Error when loading extension {ext}:**\n{type(e).__name__}: {e}')
     else:
@@ -174,26 +194,16 @@ async def _unload(ctx, *extensions):
 
 def get_type(guild, pkmn_number):
     pkmn_number = int(pkmn_number) - 1
-    types = type_list[pkmn_number]
-    ret = []
-    for type in types:
-        ret.append(parse_emoji(guild, config['type_id_dict'][type.lower()]))
-    return ret
+    def build():
+        types = type_list[pkmn_number]
+        return tuple(parse_emoji(guild, config['type_id_dict'][type.lower()]) for type in types)
+    return list(emoji_cache.string(guild, config['type_id_dict'], ('type', pkmn_number), build))
 
 def get_name(pkmn_number):
-    pkmn_number = int(pkmn_number) - 1
-    try:
-        name = pkmn_info['pokemon_list'][pkmn_number]
-    except IndexError:
-        name = None
-    return name
+    return pokedex.get_name(pkmn_number)
 
 def get_number(pkm_name):
-    try:
-        number = pkmn_info['pokemon_list'].index(pkm_name) + 1
-    except ValueError:
-        number = None
-    return number
+    return pokedex.get_number(pkm_name)
 
 def get_level(pkmn, max_lvl=5):
     if str(pkmn).isdigit():
@@ -220,25 +230,13 @@ def get_raidlist():
 
 def get_weaknesses(species):
     # Get the Pokemon's number
-    number = pkmn_info['pokemon_list'].index(species)
-    # Look up its type
-    pk_type = type_list[number]
-
-    # Calculate sum of its weaknesses
-    # and resistances.
-    # -2 == immune
-    # -1 == NVE
-    #  0 == neutral
+    number = pokedex.get_number(species)
+    # Sum of its weaknesses and resistances
+    # from the compiled type chart.
     #  1 == SE
     #  2 == double SE
-    type_eff = {}
-    for type in pk_type:
-        for atk_type in type_chart[type]:
-            if atk_type not in type_eff:
-                type_eff[atk_type] = 0
-            type_eff[atk_type] += type_chart[type][atk_type]
     ret = []
-    for (type, effectiveness) in sorted(type_eff.items(), key=(lambda x: x[1]), reverse=True):
+    for (type, effectiveness) in type_matrix.weaknesses(number):
         if effectiveness == 1:
             ret.append(type.lower())
         elif effectiveness == 2:
@@ -250,17 +248,19 @@ def get_weaknesses(species):
 # as defined in the type_id_dict
 
 def weakness_to_str(guild, weak_list):
-    ret = ''
-    for weakness in weak_list:
-
-        x2 = ''
-        if weakness[(- 2):] == 'x2':
-            weakness = weakness[:(- 2)]
-            x2 = 'x2'
-        # Append to string
-        ret += (parse_emoji(guild,
-                config['type_id_dict'][weakness]) + x2) + ' '
-    return ret
+    def build():
+        ret = ''
+        for weakness in weak_list:
+
+            x2 = ''
+            if weakness[(- 2):] == 'x2':
+                weakness = weakness[:(- 2)]
+                x2 = 'x2'
+            # Append to string
+            ret += (parse_emoji(guild,
+                    config['type_id_dict'][weakness]) + x2) + ' '
+        return ret
+    return emoji_cache.string(guild, config['type_id_dict'], ('weakness', tuple(weak_list)), build)
 
 # Convert an arbitrary string into something which
 # is acceptable as a Discord channel name.
@@ -279,11 +279,7 @@ def sanitize_channel_name(name):
 # just return the string unmodified.
 
 def parse_emoji(guild, emoji_string):
-    if (emoji_string[0] == ':') and (emoji_string[(- 1)] == ':'):
-        emoji = discord.utils.get(guild.emojis, name=emoji_string.strip(':'))
-        if emoji:
-            emoji_string = '<:{0}:{1}>'.format(emoji.name, emoji.id)
-    return emoji_string
+    return emoji_cache.parse(guild, emoji_string)
 
 def print_emoji_name(guild, emoji_string):
     # By default, just print the emoji_string
@@ -348,8 +344,9 @@ def spellcheck(word):
 
 async def autocorrect(entered_word, destination, author):
     msg = _("Meowth! **{word}** isn't a Pokemon!").format(word=entered_word.title())
-    if spellcheck(entered_word) and (spellcheck(entered_word) != entered_word):
-        msg += _(' Did you mean **{correction}**?').format(correction=spellcheck(entered_word).title())
+    correction = await Meowth.run_blocking(spellcheck, entered_word)
+    if correction and (correction != entered_word):
+        msg += _(' Did you mean **{correction}**?').format(correction=correction.title())
         question = await destination.send(msg)
         if author:
             try:
@@ -361,7 +358,7 @@ async def autocorrect(entered_word, destination, author):
             if timeout or res.emoji == '❎':
                 return None
             elif res.emoji == '✅':
-                return spellcheck(entered_word)
+                return correction
             else:
                 return None
         else:
@@ -406,7 +403,7 @@ def do_template(message, author, guild):
                 not_found.append(full_match)
             return channel.mention if channel else full_match
         elif match_type == '&':
-            role = discord.utils.get(guild.roles, name=match)
+            role = role_index.get(guild, match)
             if match.isdigit() and (not role):
                 role = discord.utils.get(guild.roles, id=int(match))
             if (not role):
@@ -424,9 +421,7 @@ async def ask(message, destination, user_list=None, *, react_list=['✅', '❎']
             return (user.id in user_list) and (reaction.message.id == message.id) and (reaction.emoji in react_list)
         elif not user_list:
             return (user.id != message.guild.me.id) and (reaction.message.id == message.id) and (reaction.emoji in react_list)
-    for r in react_list:
-        await asyncio.sleep(0.25)
-        await message.add_reaction(r)
+    Meowth.reactions.add(message, react_list)
     try:
         reaction, user = await Meowth.wait_for('reaction_add', check=check, timeout=60)
         return reaction, user
@@ -441,9 +436,34 @@ def get_gyms(guild_id):
     gyms = gym_matching_cog.get_gyms(guild_id)
     return gyms
 
-async def gym_match_prompt(channel, author_id, gym_name, gyms):
+def get_raid_state(channel):
+    """Returns the RaidData tracking RSVP totals for a raid channel."""
+    raid_dict = guild_dict[channel.guild.id]['raidchannel_dict'][channel.id]
+    state = raid_states.get(channel.id)
+    if not state or state.data is not raid_dict:
+        state = raid_states[channel.id] = RaidData(raid_dict)
+    return state
+
+async def _raid_messages(channel):
+    """Returns the raid channel message and the report message of a raid,
+    using the cached copies."""
+    raid_dict = guild_dict[channel.guild.id]['raidchannel_dict'].get(channel.id)
+    if not raid_dict:
+        return []
+    raidmsg = await raid_editor.fetch(channel, raid_dict.get('raidmessage'))
+    if not raidmsg:
+        async for message in channel.history(limit=500, reverse=True):
+            if message.author.id == channel.guild.me.id and _('Coordinate here') in message.content:
+                raidmsg = message
+                Meowth.messages.add(message)
+                break
+    reportchannel = Meowth.get_channel(raid_dict.get('reportcity'))
+    reportmsg = await raid_editor.fetch(reportchannel, raid_dict.get('raidreport'))
+    return [raidmsg, reportmsg]
+
+async def gym_match_prompt(channel, author_id, gym_name):
     gym_matching_cog = Meowth.cogs.get('GymMatching')
-    match, score = gym_matching_cog.gym_match(gym_name, gyms)
+    match, score = await Meowth.run_blocking(gym_matching_cog.gym_match, gym_name, channel.guild.id)
     if not match:
         return None
     if score < 80:
@@ -497,7 +517,7 @@ def get_category(channel, level, category_type="raid"):
 def get_raidtext(type, pkmn, level, member, channel):
     if type == "raid":
         roletest = ""
-        role = discord.utils.get(channel.guild.roles, name=pkmn)
+        role = role_index.get(channel.guild, pkmn)
         if role:
             roletest = _("{pokemon} - ").format(pokemon=role.mention)
             raidtext = _("{roletest}Meowth! {pkmn} raid reported by {member} in {channel}! Coordinate here!\n\nFor help, react to this message with the question mark and I will DM you a list of commands you can use!").format(roletest=roletest, pkmn=pkmn.title(), member=member.mention, channel=channel.mention)
@@ -550,6 +570,48 @@ async def create_raid_channel(type, pkmn, level, details, report_channel):
     ow = dict(raid_channel_overwrite_list)
     return await guild.create_text_channel(name, overwrites=ow, category=cat)
 
+async def _allow_send(raid_channel, target=None):
+    target = target or raid_channel.guild.default_role
+    ow = raid_channel.overwrites_for(target)
+    ow.send_messages = True
+    try:
+        await raid_channel.set_permissions(target, overwrite = ow)
+    except (discord.errors.Forbidden, discord.errors.HTTPException, discord.errors.InvalidArgument):
+        pass
+
+async def _send_raid_messages(timing, report_channel, raid_channel, report_content, raid_content, embed, *setup):
+    """Sends the report and raid channel messages of a new raid together
+    with any ``setup`` coroutines for the channel.
+
+    Returns a tuple of (raidreport, raidmessage)."""
+    raidreport, raidmessage, *__ = await asyncio.gather(
+        timing.run('report', report_channel.send(content=report_content, embed=embed)),
+        timing.run('raid message', raid_channel.send(content=raid_content, embed=embed)),
+        *setup)
+    Meowth.messages.add(raidreport)
+    Meowth.messages.add(raidmessage)
+    return (raidreport, raidmessage)
+
+def _fetch_auto_counters(timing, guild, pkmn, weather, level):
+    """Starts fetching the counters for a new raid if they're posted
+    automatically at its level, so they load while the channel is set up."""
+    if str(level) not in guild_dict[guild.id]['configure_dict']['counters']['auto_levels']:
+        return None
+    return Meowth.loop.create_task(timing.run('counters fetch', _get_generic_counters(guild, pkmn, weather)))
+
+async def _post_auto_counters(timing, raid_channel, ctrs_task, pkmn, weather):
+    """Posts the counters started by :func:`_fetch_auto_counters`.
+
+    Returns a tuple of (ctrs_key, ctrsmessage_id)."""
+    if not ctrs_task:
+        return (None, None)
+    ctrs_dict = await ctrs_task
+    ctrsmsg = "Here are the best counters for the raid boss in currently known weather conditions! Update weather with **!weather**. If you know the moveset of the boss, you can react to this message with the matching emoji and I will update the counters."
+    ctrsmessage = await timing.run('counters message', raid_channel.send(content=ctrsmsg,embed=ctrs_dict[0]['embed']))
+    Meowth.messages.add(ctrsmessage)
+    Meowth.reactions.add(ctrsmessage, [ctrs_dict[moveset]['emoji'] for moveset in ctrs_dict], pin=True)
+    return ((pkmn, weather), ctrsmessage.id)
+
 @Meowth.command(hidden=True)
 async def template(ctx, *, sample_message):
     """Sample template messages to see how they would appear."""
@@ -575,105 +637,128 @@ async def template(ctx, *, sample_message):
 Server Management
 """
 
-async def wild_expiry_check(message):
-    logger.info('Expiry_Check - ' + message.channel.name)
+def wild_expiry_check(message):
+    """Schedules the wild report ``message`` to expire at its ``exp``."""
     guild = message.channel.guild
-    global active_wilds
-    message = await message.channel.get_message(message.id)
-    if message not in active_wilds:
-        active_wilds.append(message)
-        logger.info(
-        'wild_expiry_check - Message added to watchlist - ' + message.channel.name
-        )
-        await asyncio.sleep(0.5)
-        while True:
-            try:
-                if guild_dict[guild.id]['wildreport_dict'][message.id]['exp'] <= time.time():
-                    await expire_wild(message)
-            except KeyError:
-                pass
-            await asyncio.sleep(30)
-            continue
+    report = wild_reports.get(guild.id, message.id)
+    if not report:
+        return
+    exp = report['exp']
+    Meowth.scheduler.schedule(('wild', message.id), exp, _wild_expiry_due,
+                              guild.id, message.channel.id, message.id)
+
+async def _wild_expiry_due(guild_id, channel_id, message_id):
+    report = wild_reports.get(guild_id, message_id)
+    if not report:
+        return
+    if report['exp'] > time.time():
+        Meowth.scheduler.schedule(('wild', message_id), report['exp'],
+                                  _wild_expiry_due, guild_id, channel_id, message_id)
+        return
+    channel = Meowth.get_channel(channel_id)
+    try:
+        message = await Meowth.messages.fetch(channel, message_id)
+    except (discord.errors.NotFound, discord.errors.Forbidden, AttributeError):
+        wild_reports.remove(guild_id, message_id)
+        return
+    logger.info('Expire_Wild - ' + channel.name)
+    await expire_wild(message)
 
 async def expire_wild(message):
     guild = message.channel.guild
     channel = message.channel
-    wild_dict = guild_dict[guild.id]['wildreport_dict']
+    report = wild_reports.get(guild.id, message.id)
+    if not report:
+        return
     try:
-        await message.edit(embed=discord.Embed(description=guild_dict[guild.id]['wildreport_dict'][message.id]['expedit']['embedcontent'], colour=message.embeds[0].colour.value))
+        await message.edit(embed=discord.Embed(description=report['expedit']['embedcontent'], colour=message.embeds[0].colour.value))
         await message.clear_reactions()
     except discord.errors.NotFound:
         pass
     try:
-        user_message = await channel.get_message(wild_dict[message.id]['reportmessage'])
+        user_message = await channel.get_message(report['reportmessage'])
         await user_message.delete()
     except (discord.errors.NotFound, discord.errors.Forbidden, discord.errors.HTTPException):
         pass
-    del guild_dict[guild.id]['wildreport_dict'][message.id]
+    Meowth.scheduler.cancel(('wild', message.id))
+    wild_reports.remove(guild.id, message.id)
 
-async def expiry_check(channel):
-    logger.info('Expiry_Check - ' + channel.name)
-    guild = channel.guild
-    global active_raids
-    channel = Meowth.get_channel(channel.id)
-    if channel not in active_raids:
-        active_raids.append(channel)
-        logger.info(
-            'Expire_Channel - Channel Added To Watchlist - ' + channel.name)
-        await asyncio.sleep(0.5)
-        while True:
-            try:
-                if guild_dict[guild.id]['raidchannel_dict'][channel.id].get('meetup',{}):
-                    now = datetime.datetime.utcnow() + datetime.timedelta(hours=guild_dict[guild.id]['configure_dict']['settings']['offset'])
-                    start = guild_dict[guild.id]['raidchannel_dict'][channel.id]['meetup'].get('start',False)
-                    end = guild_dict[guild.id]['raidchannel_dict'][channel.id]['meetup'].get('end',False)
-                    if start and guild_dict[guild.id]['raidchannel_dict'][channel.id]['type'] == 'egg':
-                        if start < now:
-                            pokemon = get_name(raid_info['raid_eggs']['EX']['pokemon'][0])
-                            await _eggtoraid(pokemon, channel, author=None)
-                    if end and end < now:
-                        event_loop.create_task(expire_channel(channel))
-                        try:
-                            active_raids.remove(channel)
-                        except ValueError:
-                            logger.info(
-                                'Expire_Channel - Channel Removal From Active Raid Failed - Not in List - ' + channel.name)
-                        logger.info(
-                            'Expire_Channel - Channel Expired And Removed From Watchlist - ' + channel.name)
-                        break
-                elif guild_dict[guild.id]['raidchannel_dict'][channel.id]['active']:
-                    if guild_dict[guild.id]['raidchannel_dict'][channel.id]['exp']:
-                        if guild_dict[guild.id]['raidchannel_dict'][channel.id]['exp'] <= time.time():
-                            if guild_dict[guild.id]['raidchannel_dict'][channel.id]['type'] == 'egg':
-                                pokemon = guild_dict[guild.id]['raidchannel_dict'][channel.id]['pokemon']
-                                egglevel = guild_dict[guild.id]['raidchannel_dict'][channel.id]['egglevel']
-                                if not pokemon and len(raid_info['raid_eggs'][egglevel]['pokemon']) == 1:
-                                    pokemon = get_name(raid_info['raid_eggs'][egglevel]['pokemon'][0])
-                                elif not pokemon and egglevel == "5" and guild_dict[channel.guild.id]['configure_dict']['settings'].get('regional',None) in raid_info['raid_eggs']["5"]['pokemon']:
-                                    pokemon = get_name(guild_dict[channel.guild.id]['configure_dict']['settings']['regional'])
-                                if pokemon:
-                                    logger.info(
-                                        'Expire_Channel - Egg Auto Hatched - ' + channel.name)
-                                    try:
-                                        active_raids.remove(channel)
-                                    except ValueError:
-                                        logger.info(
-                                            'Expire_Channel - Channel Removal From Active Raid Failed - Not in List - ' + channel.name)
-                                    await _eggtoraid(pokemon.lower(), channel, author=None)
-                                    break
-                            event_loop.create_task(expire_channel(channel))
-                            try:
-                                active_raids.remove(channel)
-                            except ValueError:
-                                logger.info(
-                                    'Expire_Channel - Channel Removal From Active Raid Failed - Not in List - ' + channel.name)
-                            logger.info(
-                                'Expire_Channel - Channel Expired And Removed From Watchlist - ' + channel.name)
-                            break
-            except:
-                pass
-            await asyncio.sleep(30)
-            continue
+def _raid_deadline(guild_id, channel_id):
+    """Returns the timestamp a raid channel next needs attention or None."""
+    raid_dict = guild_dict.peek(guild_id, {}).get('raidchannel_dict', {}).get(channel_id)
+    if not raid_dict:
+        return None
+    meetup = raid_dict.get('meetup', {})
+    if meetup:
+        start = meetup.get('start', False)
+        end = meetup.get('end', False)
+        if start and raid_dict['type'] == 'egg':
+            event = start
+        elif end:
+            event = end
+        else:
+            return None
+        now = datetime.datetime.utcnow() + datetime.timedelta(hours=guild_dict[guild_id]['configure_dict']['settings']['offset'])
+        return time.time() + (event - now).total_seconds()
+    if raid_dict['active'] and raid_dict['exp']:
+        return raid_dict['exp']
+    return None
+
+def expiry_check(channel):
+    """Schedules the raid channel to hatch or expire at its deadline.
+
+    Safe to call again whenever the channel's timer changes, the previous
+    deadline is replaced."""
+    deadline = _raid_deadline(channel.guild.id, channel.id)
+    if deadline is None:
+        Meowth.scheduler.cancel(('raid', channel.id))
+        return
+    Meowth.scheduler.schedule(('raid', channel.id), deadline, _raid_expiry_due,
+                              channel.guild.id, channel.id)
+    logger.info('Expiry_Check - Channel Scheduled - ' + channel.name)
+
+async def _raid_expiry_due(guild_id, channel_id):
+    channel = Meowth.get_channel(channel_id)
+    deadline = _raid_deadline(guild_id, channel_id)
+    if not channel or deadline is None:
+        return
+    if deadline > time.time() + 1:
+        Meowth.scheduler.schedule(('raid', channel_id), deadline,
+                                  _raid_expiry_due, guild_id, channel_id)
+        return
+    raid_dict = guild_dict[guild_id]['raidchannel_dict'][channel_id]
+    if raid_dict.get('meetup', {}):
+        if raid_dict['meetup'].get('start', False) and raid_dict['type'] == 'egg':
+            pokemon = get_name(raid_info['raid_eggs']['EX']['pokemon'][0])
+            await _eggtoraid(pokemon, channel, author=None)
+            return
+    elif raid_dict['type'] == 'egg':
+        pokemon = raid_dict['pokemon']
+        egglevel = raid_dict['egglevel']
+        if not pokemon and len(raid_info['raid_eggs'][egglevel]['pokemon']) == 1:
+            pokemon = get_name(raid_info['raid_eggs'][egglevel]['pokemon'][0])
+        elif not pokemon and egglevel == "5" and guild_dict[guild_id]['configure_dict']['settings'].get('regional',None) in raid_info['raid_eggs']["5"]['pokemon']:
+            pokemon = get_name(guild_dict[guild_id]['configure_dict']['settings']['regional'])
+        if pokemon:
+            logger.info(
+                'Expire_Channel - Egg Auto Hatched - ' + channel.name)
+            await _eggtoraid(pokemon.lower(), channel, author=None)
+            return
+    logger.info(
+        'Expire_Channel - Channel Expired - ' + channel.name)
+    await expire_channel(channel)
+
+def rebuild_expiry_schedule():
+    """Schedules every active raid channel and wild report in save data."""
+    for guild_id in list(guild_dict.keys()):
+        guild_data = guild_dict.peek(guild_id)
+        for channel_id in list(guild_data.get('raidchannel_dict', {})):
+            channel = Meowth.get_channel(channel_id)
+            if channel:
+                expiry_check(channel)
+        for message_id, report in list(wild_reports.reports(guild_id).items()):
+            Meowth.scheduler.schedule(('wild', message_id), report['exp'], _wild_expiry_due,
+                                      guild_id, report['reportchannel'], message_id)
 
 async def expire_channel(channel):
     guild = channel.guild
@@ -687,6 +772,8 @@ async def expire_channel(channel):
     if (channel_exists == None) and (not Meowth.is_closed()):
         try:
             del guild_dict[channel.guild.id]['raidchannel_dict'][channel.id]
+            raid_states.pop(channel.id, None)
+            raid_editor.forget(channel.id)
         except KeyError:
             pass
         return
@@ -712,12 +799,9 @@ async def expire_channel(channel):
                     await _eggtoraid(pkmn, channel)
                     return
                 maybe_list = []
-                trainer_dict = copy.deepcopy(
-                    guild_dict[channel.guild.id]['raidchannel_dict'][channel.id]['trainer_dict'])
-                for trainer in trainer_dict.keys():
-                    if trainer_dict[trainer]['status']['maybe']:
-                        user = channel.guild.get_member(trainer)
-                        maybe_list.append(user.mention)
+                for trainer in get_raid_state(channel).with_status('maybe'):
+                    user = channel.guild.get_member(trainer)
+                    maybe_list.append(user.mention)
                 h = _('hatched-')
                 new_name = h if h not in channel.name else ''
                 new_name += channel.name
@@ -747,7 +831,7 @@ async def expire_channel(channel):
                     try:
                         report_channel = Meowth.get_channel(
                             guild_dict[guild.id]['raidchannel_dict'][channel.id]['reportcity'])
-                        reportmsg = await report_channel.get_message(guild_dict[channel.guild.id]['raidchannel_dict'][channel.id]['raidreport'])
+                        reportmsg = await Meowth.messages.fetch(report_channel, guild_dict[channel.guild.id]['raidchannel_dict'][channel.id]['raidreport'])
                         await reportmsg.delete()
                     except:
                         pass
@@ -755,7 +839,7 @@ async def expire_channel(channel):
                     try:
                         report_channel = Meowth.get_channel(
                             guild_dict[guild.id]['raidchannel_dict'][channel.id]['reportcity'])
-                        reportmsg = await report_channel.get_message(guild_dict[channel.guild.id]['raidchannel_dict'][channel.id]['raidreport'])
+                        reportmsg = await Meowth.messages.fetch(report_channel, guild_dict[channel.guild.id]['raidchannel_dict'][channel.id]['raidreport'])
                         await reportmsg.edit(embed=discord.Embed(description=expiremsg, colour=channel.guild.me.colour))
                     except:
                         pass
@@ -768,6 +852,8 @@ async def expire_channel(channel):
                 elif not archive and not logs:
                     try:
                         del guild_dict[channel.guild.id]['raidchannel_dict'][channel.id]
+                        raid_states.pop(channel.id, None)
+                        raid_editor.forget(channel.id)
                     except KeyError:
                         pass
                     await channel_exists.delete()
@@ -803,29 +889,40 @@ async def expire_channel(channel):
                             newcat = channel.guild.get_channel(category)
                         await channel.edit(name=new_name, category=newcat)
                         await channel.send(_('-----------------------------------------------\n**The channel has been archived and removed from view for everybody but Meowth and those with Manage Channel permissions. Any messages that were deleted after the channel was marked for archival will be posted below. You will need to delete this channel manually.**\n-----------------------------------------------'))
-                        while logs:
-                            earliest = min(logs)
-                            embed = discord.Embed(colour=logs[earliest]['color_int'], description=logs[earliest]['content'], timestamp=logs[earliest]['created_at'])
-                            if logs[earliest]['author_nick']:
-                                embed.set_author(name="{name} [{nick}]".format(name=logs[earliest]['author_str'],nick=logs[earliest]['author_nick']), icon_url = logs[earliest]['author_avy'])
-                            else:
-                                embed.set_author(name=logs[earliest]['author_str'], icon_url = logs[earliest]['author_avy'])
-                            await channel.send(embed=embed)
-                            del logs[earliest]
-                            await asyncio.sleep(.25)
-                        del guild_dict[channel.guild.id]['raidchannel_dict'][channel.id]
+                    # once archived, channel_cleanup resumes the replay
+                    # instead of deleting the channel
+                    guild_dict[channel.guild.id]['raidchannel_dict'][channel.id]['replaying'] = True
+                    Meowth.log_replayer.start(channel)
         except:
             pass
 
 Meowth.expire_channel = expire_channel
 
+def _archive_replayed(channel):
+    guild_dict[channel.guild.id]['raidchannel_dict'].pop(channel.id, None)
+    raid_states.pop(channel.id, None)
+    raid_editor.forget(channel.id)
+
+Meowth.log_replayer = LogReplayer(Meowth, finished=_archive_replayed)
+
+def _record_pass(name, started, examined):
+    duration = time.monotonic() - started
+    Meowth.maintenance_stats[name] = {
+        'duration': duration,
+        'examined': examined,
+        'finished': time.time()
+    }
+    logger.info(f'{name} - {examined} items examined in {duration:.3f}s')
+
 async def channel_cleanup(loop=True):
     while (not Meowth.is_closed()):
-        global active_raids
-        guilddict_chtemp = copy.deepcopy(guild_dict)
+        started = time.monotonic()
+        examined = 0
         logger.info('Channel_Cleanup ------ BEGIN ------')
         # for every server in save data
-        for guildid in guilddict_chtemp.keys():
+        for guildid in list(guild_dict.keys()):
+            # give the gateway a turn between servers
+            await asyncio.sleep(0)
             guild = Meowth.get_guild(guildid)
             log_str = 'Channel_Cleanup - Server: ' + str(guildid)
             log_str = log_str + ' - CHECKING FOR SERVER'
@@ -837,26 +934,31 @@ async def channel_cleanup(loop=True):
             # clear channel lists
             dict_channel_delete = []
             discord_channel_delete = []
+            guild_data = guild_dict.peek(guildid)
+            if guild_data is None:
+                continue
             # check every raid channel data for each server
-            for channelid in guilddict_chtemp[guildid]['raidchannel_dict']:
+            for channelid, raid_dict in list(guild_data['raidchannel_dict'].items()):
+                examined += 1
                 channel = Meowth.get_channel(channelid)
                 log_str = 'Channel_Cleanup - Server: ' + guild.name
                 log_str = (log_str + ': Channel:') + str(channelid)
-                logger.info(log_str + ' - CHECKING')
-                channelmatch = Meowth.get_channel(channelid)
-                if channelmatch == None:
+                if channel == None:
                     # list channel for deletion from save data
                     dict_channel_delete.append(channelid)
                     logger.info(log_str + " - DOESN'T EXIST IN DISCORD")
                 # otherwise, if meowth can still see the channel in discord
                 else:
-                    logger.info(
-                        ((log_str + ' (') + channel.name) + ') - EXISTS IN DISCORD')
+                    # an archived channel whose deleted messages are still being posted
+                    if raid_dict.get('replaying', False):
+                        Meowth.log_replayer.start(channel)
+                        logger.info(log_str + ' - RESUMED ARCHIVE REPLAY')
+                        continue
                     # if the channel save data shows it's not an active raid
-                    if guilddict_chtemp[guildid]['raidchannel_dict'][channelid]['active'] == False:
-                        if guilddict_chtemp[guildid]['raidchannel_dict'][channelid]['type'] == 'egg':
+                    if raid_dict['active'] == False:
+                        if raid_dict['type'] == 'egg':
                             # and if it has been expired for longer than 45 minutes already
-                            if guilddict_chtemp[guildid]['raidchannel_dict'][channelid]['exp'] < (time.time() - (45 * 60)):
+                            if raid_dict['exp'] < (time.time() - (45 * 60)):
                                 # list the channel to be removed from save data
                                 dict_channel_delete.append(channelid)
                                 # and list the channel to be deleted in discord
@@ -865,7 +967,7 @@ async def channel_cleanup(loop=True):
                                     log_str + ' - 15+ MIN EXPIRY NONACTIVE EGG')
                                 continue
                             # and if it has been expired for longer than 5 minutes already
-                        elif guilddict_chtemp[guildid]['raidchannel_dict'][channelid]['exp'] < (time.time() - (5 * 60)):
+                        elif raid_dict['exp'] < (time.time() - (5 * 60)):
                                 # list the channel to be removed from save data
                             dict_channel_delete.append(channelid)
                                 # and list the channel to be deleted in discord
@@ -878,23 +980,22 @@ async def channel_cleanup(loop=True):
                             log_str + ' - = RECENTLY EXPIRED NONACTIVE RAID')
                         continue
                     # if the channel save data shows it as an active raid still
-                    elif guilddict_chtemp[guildid]['raidchannel_dict'][channelid]['active'] == True:
+                    elif raid_dict['active'] == True:
                         # if it's an exraid
-                        if guilddict_chtemp[guildid]['raidchannel_dict'][channelid]['type'] == 'exraid':
-                            logger.info(log_str + ' - EXRAID')
-
+                        if raid_dict['type'] == 'exraid':
                             continue
                         # or if the expiry time for the channel has already passed within 5 minutes
-                        elif guilddict_chtemp[guildid]['raidchannel_dict'][channelid]['exp'] <= time.time():
+                        elif raid_dict['exp'] <= time.time():
                             # list the channel to be sent to the channel expiry function
                             event_loop.create_task(expire_channel(channel))
                             logger.info(log_str + ' - RECENTLY EXPIRED')
 
                             continue
 
-                        if channel not in active_raids:
+                        # raids without a timer have nothing to schedule
+                        if ('raid', channel.id) not in Meowth.scheduler and _raid_deadline(guildid, channelid) is not None:
                             # if channel is still active, make sure it's expiry is being monitored
-                            event_loop.create_task(expiry_check(channel))
+                            expiry_check(channel)
                             logger.info(
                                 log_str + ' - MISSING FROM EXPIRY CHECK')
                             continue
@@ -903,6 +1004,8 @@ async def channel_cleanup(loop=True):
                 try:
                     # attempt to delete the channel from save data
                     del guild_dict[guildid]['raidchannel_dict'][c]
+                    raid_states.pop(c, None)
+                    raid_editor.forget(c)
                     logger.info(
                         'Channel_Cleanup - Channel Savedata Cleared - ' + str(c))
                 except KeyError:
@@ -918,6 +1021,7 @@ async def channel_cleanup(loop=True):
                     logger.info(
                         'Channel_Cleanup - Channel Deletion Failure - ' + c.name)
                     pass
+        _record_pass('Channel_Cleanup', started, examined)
         # save server_dict changes after cleanup
         logger.info('Channel_Cleanup - SAVING CHANGES')
         try:
@@ -930,19 +1034,10 @@ async def channel_cleanup(loop=True):
 
 async def guild_cleanup(loop=True):
     while (not Meowth.is_closed()):
-        guilddict_srvtemp = copy.deepcopy(guild_dict)
+        started = time.monotonic()
         logger.info('Server_Cleanup ------ BEGIN ------')
-        guilddict_srvtemp = guild_dict
-        dict_guild_list = []
-        bot_guild_list = []
-        dict_guild_delete = []
-        for guildid in guilddict_srvtemp.keys():
-            dict_guild_list.append(guildid)
-        for guild in Meowth.guilds:
-            bot_guild_list.append(guild.id)
-        guild_diff = set(dict_guild_list) - set(bot_guild_list)
-        for s in guild_diff:
-            dict_guild_delete.append(s)
+        bot_guild_list = set(guild.id for guild in Meowth.guilds)
+        dict_guild_delete = [s for s in list(guild_dict.keys()) if s not in bot_guild_list]
         for s in dict_guild_delete:
             try:
                 del guild_dict[s]
@@ -950,6 +1045,7 @@ async def guild_cleanup(loop=True):
                             ' from save data')
             except KeyError:
                 pass
+        _record_pass('Server_Cleanup', started, len(bot_guild_list))
         logger.info('Server_Cleanup - SAVING CHANGES')
         try:
             await _save()
@@ -959,48 +1055,75 @@ async def guild_cleanup(loop=True):
         await asyncio.sleep(7200)
         continue
 
+def index_report(guild_id, report_dict, report_id):
+    """Adds a quest report to the message_cleanup expiry index."""
+    report = guild_dict.peek(guild_id, {}).get(report_dict, {}).get(report_id)
+    if report:
+        report_index.add(report.get('exp', 0), (guild_id, report_dict, report_id))
+
+def _build_report_index():
+    report_index.clear()
+    for guildid in list(guild_dict.keys()):
+        guild_data = guild_dict.peek(guildid)
+        for reportid, report in list(guild_data.get('questreport_dict', {}).items()):
+            report_index.add(report.get('exp', 0), (guildid, 'questreport_dict', reportid))
+    report_index.built = True
+
 async def message_cleanup(loop=True):
     while (not Meowth.is_closed()):
+        started = time.monotonic()
         logger.info('message_cleanup ------ BEGIN ------')
-        guilddict_temp = copy.deepcopy(guild_dict)
-        for guildid in guilddict_temp.keys():
-            questreport_dict = guilddict_temp[guildid].get('questreport_dict',{})
-            wildreport_dict = guilddict_temp[guildid].get('wildreport_dict',{})
-            report_dict_dict = {
-                'questreport_dict':questreport_dict,
-                'wildreport_dict':wildreport_dict,
-            }
-            report_edit_dict = {}
-            report_delete_dict = {}
-            for report_dict in report_dict_dict:
-                for reportid in report_dict_dict[report_dict].keys():
-                    if report_dict_dict[report_dict][reportid].get('exp', 0) <= time.time():
-                        report_channel = Meowth.get_channel(report_dict_dict[report_dict][reportid].get('reportchannel'))
-                        if report_channel:
-                            user_report = report_dict_dict[report_dict][reportid].get('reportmessage',None)
-                            if user_report:
-                                report_delete_dict[user_report] = {"action":"delete","channel":report_channel}
-                            if report_dict_dict[report_dict][reportid].get('expedit') == "delete":
-                                report_delete_dict[reportid] = {"action":"delete","channel":report_channel}
-                            else:
-                                report_edit_dict[reportid] = {"action":report_dict_dict[report_dict][reportid]['expedit'],"channel":report_channel}
-                        try:
-                            del guild_dict[guildid][report_dict][reportid]
-                        except KeyError:
-                            pass
-            for messageid in report_delete_dict.keys():
-                try:
-                    report_message = await report_delete_dict[messageid]['channel'].get_message(messageid)
-                    await report_message.delete()
-                except (discord.errors.NotFound, discord.errors.Forbidden, discord.errors.HTTPException, KeyError):
-                    pass
-            for messageid in report_edit_dict.keys():
-                try:
-                    report_message = await report_edit_dict[messageid]['channel'].get_message(messageid)
-                    await report_message.edit(content=report_edit_dict[messageid]['action']['content'],embed=discord.Embed(description=report_edit_dict[messageid]['action'].get('embedcontent'), colour=report_message.embeds[0].colour.value))
-                    await report_message.clear_reactions()
-                except (discord.errors.NotFound, discord.errors.Forbidden, discord.errors.HTTPException, IndexError, KeyError):
-                    pass
+        if not report_index.built:
+            _build_report_index()
+        now = time.time()
+        due = report_index.pop_due(now)
+        due.extend((guildid, 'wildreport_dict', reportid) for guildid, reportid in wild_reports.pop_due(now))
+        report_edit_dict = {}
+        report_delete_dict = {}
+        for guildid, report_dict, reportid in due:
+            if report_dict == 'wildreport_dict':
+                report = wild_reports.get(guildid, reportid)
+            else:
+                report = guild_dict.peek(guildid, {}).get(report_dict, {}).get(reportid)
+            if not report:
+                continue
+            if report.get('exp', 0) > now:
+                # report was extended since it was indexed
+                report_index.add(report['exp'], (guildid, report_dict, reportid))
+                continue
+            report_channel = Meowth.get_channel(report.get('reportchannel'))
+            if report_channel:
+                user_report = report.get('reportmessage',None)
+                if user_report:
+                    report_delete_dict[user_report] = {"action":"delete","channel":report_channel}
+                if report.get('expedit') == "delete":
+                    report_delete_dict[reportid] = {"action":"delete","channel":report_channel}
+                else:
+                    report_edit_dict[reportid] = {"action":report['expedit'],"channel":report_channel}
+            if report_dict == 'wildreport_dict':
+                Meowth.scheduler.cancel(('wild', reportid))
+                wild_reports.remove(guildid, reportid)
+                continue
+            try:
+                del guild_dict[guildid][report_dict][reportid]
+            except KeyError:
+                pass
+        for messageid in report_delete_dict.keys():
+            await asyncio.sleep(0)
+            try:
+                report_message = await Meowth.messages.fetch(report_delete_dict[messageid]['channel'], messageid)
+                await report_message.delete()
+            except (discord.errors.NotFound, discord.errors.Forbidden, discord.errors.HTTPException, KeyError):
+                pass
+        for messageid in report_edit_dict.keys():
+            await asyncio.sleep(0)
+            try:
+                report_message = await Meowth.messages.fetch(report_edit_dict[messageid]['channel'], messageid)
+                await report_message.edit(content=report_edit_dict[messageid]['action']['content'],embed=discord.Embed(description=report_edit_dict[messageid]['action'].get('embedcontent'), colour=report_message.embeds[0].colour.value))
+                await report_message.clear_reactions()
+            except (discord.errors.NotFound, discord.errors.Forbidden, discord.errors.HTTPException, IndexError, KeyError):
+                pass
+        _record_pass('message_cleanup', started, len(due))
         # save server_dict changes after cleanup
         logger.info('message_cleanup - SAVING CHANGES')
         try:
@@ -1013,13 +1136,21 @@ async def message_cleanup(loop=True):
 
 async def _print(owner, message):
     if 'launcher' in sys.argv[1:]:
-        if 'debug' not in sys.argv[1:]:
+        if 'debug' not in sys.argv[1:] and owner:
             await owner.send(message)
     print(message)
     logger.info(message)
 
 async def maint_start():
     try:
+        Meowth.scheduler.start()
+        Meowth.lag_monitor.start()
+        if metrics_server:
+            try:
+                await metrics_server.start()
+            except OSError as e:
+                logger.warning(f'Metrics - Could not listen on port {metrics_server.port} - {e}')
+        rebuild_expiry_schedule()
 #        event_loop.create_task(guild_cleanup())
         event_loop.create_task(channel_cleanup())
         event_loop.create_task(message_cleanup())
@@ -1028,15 +1159,88 @@ async def maint_start():
         tasks.cancel()
 
 event_loop = asyncio.get_event_loop()
+save_lock = asyncio.Lock()
+Meowth.scheduler = DeadlineScheduler(event_loop)
+Meowth.reaper = MessageReaper(Meowth, Meowth.guild_store, Meowth.scheduler)
+Meowth.reaper.load(keep=cluster.owns)
+Meowth.pokebattler = PokebattlerClient.from_config(config, event_loop)
+counters_cache = {}
+raid_states = {}
+raid_editor = MessageEditor(_raid_messages, event_loop, messages=Meowth.messages)
+Meowth.role_index = role_index = RoleIndex()
+Meowth.emojis = emoji_cache = EmojiCache()
+Meowth.reactions = ReactionScheduler(event_loop)
+message_classifier = MessageClassifier(parse_emoji)
+report_index = ExpiryIndex()
+Meowth.maintenance_stats = {}
+
+def _hit_rate(hits, misses):
+    total = hits + misses
+    return hits / total if total else 0.0
+
+def _cache_hit_rates():
+    matcher = pokedex.matcher.cache_info()
+    return {
+        'messages': Meowth.messages.hit_rate(),
+        'pokebattler': _hit_rate(Meowth.pokebattler.hits, Meowth.pokebattler.misses),
+        'pokemon_matcher': _hit_rate(matcher.hits, matcher.misses)
+    }
+
+def _work_counts():
+    return {
+        'raid_edits': raid_editor.edits,
+        'raid_edits_coalesced': raid_editor.coalesced,
+        'reactions_routed': Meowth.reaction_router.routed,
+        'reactions_ignored': Meowth.reaction_router.ignored,
+        'reactions_added': Meowth.reactions.completed,
+        'reactions_failed': Meowth.reactions.failed,
+        'messages_reaped': Meowth.reaper.reaped,
+        'reap_requests': Meowth.reaper.requests,
+        'archive_messages_sent': Meowth.log_replayer.sent
+    }
+
+Meowth.metrics.register('loop_lag_seconds', 'How late the event loop woke a sleeping task.',
+    lambda: {'last': Meowth.lag_monitor.last, 'worst': Meowth.lag_monitor.worst}, label='kind')
+Meowth.metrics.register('loop_stalls_total', 'Times the event loop was blocked too long.',
+    lambda: Meowth.lag_monitor.stalls, kind='counter')
+Meowth.metrics.register('cleanup_seconds', 'Duration of the last maintenance pass.',
+    lambda: {name: stats['duration'] for name, stats in Meowth.maintenance_stats.items()}, label='task')
+Meowth.metrics.register('cleanup_examined', 'Items examined by the last maintenance pass.',
+    lambda: {name: stats['examined'] for name, stats in Meowth.maintenance_stats.items()}, label='task')
+Meowth.metrics.register('cache_hit_ratio', 'Share of lookups answered from a cache.',
+    _cache_hit_rates, label='cache')
+Meowth.metrics.register('work_total', 'Background work done.', _work_counts, label='kind', kind='counter')
+Meowth.metrics.register('guilds', 'Guilds this process handles.', lambda: len(Meowth.guilds))
+
+if config.get('metrics_port'):
+    # each worker of a cluster serves on its own port
+    metrics_server = MetricsServer(Meowth.metrics, host=config.get('metrics_host', '127.0.0.1'),
+                                   port=config['metrics_port'] + (cluster.worker or 0))
+else:
+    metrics_server = None
 
 """
 Events
 """
 @Meowth.event
 async def on_ready():
+    if not startup.reported:
+        startup.mark('gateway')
+    # a new READY replaces the member cache without member events
+    role_index.clear()
     Meowth.owner = discord.utils.get(
         Meowth.get_all_members(), id=config['master'])
-    await _print(Meowth.owner, _('Starting up...'))
+    if Meowth.owner is None:
+        # a cluster worker may share no guild with the owner
+        try:
+            Meowth.owner = await Meowth.get_user_info(config['master'])
+        except discord.errors.HTTPException:
+            pass
+    # only the first worker of a cluster reports startup to the owner
+    startup_owner = Meowth.owner if not cluster.worker else None
+    await _print(startup_owner, _('Starting up...'))
+    if cluster.enabled and not Meowth.cluster_link.connected:
+        await Meowth.cluster_link.connect()
     Meowth.uptime = datetime.datetime.now()
     msg_success = 0
     msg_fail = 0
@@ -1087,7 +1291,10 @@ async def on_ready():
                 'raidchannel_dict':{},
                 'trainers':{}
             }
-    await _print(Meowth.owner, _("Meowth! That's right!\n\n{server_count} servers connected.\n{member_count} members found.").format(server_count=guilds, member_count=users))
+    if not startup.reported:
+        startup.mark('guild setup')
+        startup.report()
+    await _print(startup_owner, _("Meowth! That's right!\n\n{server_count} servers connected.\n{member_count} members found.").format(server_count=guilds, member_count=users))
     await maint_start()
 
 @Meowth.event
@@ -1117,6 +1324,10 @@ async def on_guild_join(guild):
 
 @Meowth.event
 async def on_guild_remove(guild):
+    role_index.forget(guild.id)
+    message_classifier.forget(guild.id)
+    emoji_cache.forget(guild.id)
+    Meowth.prefixes.forget(guild.id)
     try:
         if guild.id in guild_dict:
             try:
@@ -1130,6 +1341,7 @@ async def on_guild_remove(guild):
 async def on_member_join(member):
     'Welcome message to the server and some basic instructions.'
     guild = member.guild
+    role_index.member_joined(member)
     team_msg = _(' or ').join(['**!team {0}**'.format(team)
                            for team in config['team_dict'].keys()])
     if not guild_dict[guild.id]['configure_dict']['welcome']['enabled']:
@@ -1159,95 +1371,92 @@ async def on_member_join(member):
     else:
         return
 
+@Meowth.event
+async def on_member_remove(member):
+    role_index.member_removed(member)
+
+@Meowth.event
+async def on_member_update(before, after):
+    role_index.member_updated(before, after)
+
+@Meowth.event
+async def on_guild_role_create(role):
+    role_index.roles_changed(role.guild)
+
+@Meowth.event
+async def on_guild_role_update(before, after):
+    role_index.roles_changed(after.guild)
+
+@Meowth.event
+async def on_guild_role_delete(role):
+    role_index.role_deleted(role)
+
+@Meowth.event
+async def on_guild_emojis_update(guild, before, after):
+    emoji_cache.emojis_changed(guild)
+    message_classifier.emojis_changed(guild)
+
 @Meowth.event
 async def on_message(message):
     if message.guild != None:
         if message.author == message.guild.me:
             return
-        raid_status = guild_dict[message.guild.id]['raidchannel_dict'].get(message.channel.id, None)
+        # read only lookups, so chatter doesn't mark the guild for saving
+        info = Meowth.message_info(message)
+        guild_data = info.guild_data
+        raid_status = info.raid_status
         if raid_status:
-            if guild_dict[message.guild.id]['configure_dict'].get('archive', {}).get('enabled', False) and guild_dict[message.guild.id]['configure_dict'].get('archive', {}).get('list', []):
-                content_words = message.content.split(' ')
-                phrase_matches = []
-                for phrase in guild_dict[message.guild.id]['configure_dict']['archive']['list']:
-                    phrase_len = len(phrase)
-                    if phrase_len == 1:
-                        if phrase in content_words:
-                            phrase_matches.append(phrase)
-                    else:
-                        try:
-                            match_idx = content_words.index(phrase.split(' ', 1)[0])
-                            if ' '.join(content_words[match_idx:phrase_len]) == phrase:
-                                phrase_matches.append(phrase)
-                        except ValueError:
-                            pass
+            archive = guild_data['configure_dict'].get('archive', {})
+            if archive.get('enabled', False) and archive.get('list', []):
+                phrase_matches = message_classifier.archive_matches(message.guild.id, archive['list'], message.content)
                 if phrase_matches:
                     logger.info(
                         f"Archived - Guild: {message.guild}, Channel: {message.channel}, Matches: {phrase_matches}")
                     await _archive(message.channel)
-            if guild_dict[message.guild.id]['raidchannel_dict'][message.channel.id]['active']:
-                trainer_dict = guild_dict[message.guild.id]['raidchannel_dict'][message.channel.id]['trainer_dict']
-                if message.author.id in trainer_dict:
-                    count = trainer_dict[message.author.id].get('count',1)
-                else:
-                    count = 1
-                omw_emoji = parse_emoji(message.guild, config['omw_id'])
+            if raid_status['active']:
+                omw_emoji, here_emoji = message_classifier.status_emojis(message.guild, config['omw_id'], config['here_id'])
                 if message.content.startswith(omw_emoji):
-                    try:
-                        if guild_dict[message.guild.id]['raidchannel_dict'][message.channel.id]['type'] == 'egg':
-                            if guild_dict[message.guild.id]['raidchannel_dict'][message.channel.id]['pokemon'] == '':
-                                await message.channel.send(_("Meowth! Please wait until the raid egg has hatched before announcing you're coming or present."))
-                                return
-                    except:
-                        pass
+                    if raid_status.get('type') == 'egg' and raid_status.get('pokemon') == '':
+                        await message.channel.send(_("Meowth! Please wait until the raid egg has hatched before announcing you're coming or present."))
+                        return
                     emoji_count = message.content.count(omw_emoji)
                     await _coming(message.channel, message.author, emoji_count, party=None)
                     return
-                here_emoji = parse_emoji(message.guild, config['here_id'])
                 if message.content.startswith(here_emoji):
-                    try:
-                        if guild_dict[message.guild.id]['raidchannel_dict'][message.channel.id]['type'] == 'egg':
-                            if guild_dict[message.guild.id]['raidchannel_dict'][message.channel.id]['pokemon'] == '':
-                                await message.channel.send(_("Meowth! Please wait until the raid egg has hatched before announcing you're coming or present."))
-                                return
-                    except:
-                        pass
+                    if raid_status.get('type') == 'egg' and raid_status.get('pokemon') == '':
+                        await message.channel.send(_("Meowth! Please wait until the raid egg has hatched before announcing you're coming or present."))
+                        return
                     emoji_count = message.content.count(here_emoji)
                     await _here(message.channel, message.author, emoji_count, party=None)
                     return
                 if "/maps" in message.content and "http" in message.content:
                     newcontent = message.content.replace("<","").replace(">","")
-                    newloc = create_gmaps_query(newcontent, message.channel, type=guild_dict[message.guild.id]['raidchannel_dict'][message.channel.id]['type'])
-                    oldraidmsg = await message.channel.get_message(guild_dict[message.guild.id]['raidchannel_dict'][message.channel.id]['raidmessage'])
-                    report_channel = Meowth.get_channel(guild_dict[message.guild.id]['raidchannel_dict'][message.channel.id]['reportcity'])
-                    oldreportmsg = await report_channel.get_message(guild_dict[message.guild.id]['raidchannel_dict'][message.channel.id]['raidreport'])
-                    oldembed = oldraidmsg.embeds[0]
-                    newembed = discord.Embed(title=oldembed.title, url=newloc, colour=message.guild.me.colour)
-                    for field in oldembed.fields:
-                        newembed.add_field(name=field.name, value=field.value, inline=field.inline)
-                    newembed.set_footer(text=oldembed.footer.text, icon_url=oldembed.footer.icon_url)
-                    newembed.set_thumbnail(url=oldembed.thumbnail.url)
-                    try:
-                        await oldraidmsg.edit(new_content=oldraidmsg.content, embed=newembed, content=oldraidmsg.content)
-                    except:
-                        pass
-                    try:
-                         await oldreportmsg.edit(new_content=oldreportmsg.content, embed=newembed, content=oldreportmsg.content)
-                    except:
-                        pass
-                    guild_dict[message.guild.id]['raidchannel_dict'][message.channel.id]['raidmessage'] = oldraidmsg.id
-                    guild_dict[message.guild.id]['raidchannel_dict'][message.channel.id]['raidreport'] = oldreportmsg.id
+                    newloc = create_gmaps_query(newcontent, message.channel, type=raid_status['type'])
+                    raid_editor.queue(message.channel, 'location', functools.partial(_location_embed, message.guild, newloc))
+                    newembed = await raid_editor.flush(message.channel)
                     otw_list = []
-                    trainer_dict = copy.deepcopy(guild_dict[message.guild.id]['raidchannel_dict'][message.channel.id]['trainer_dict'])
-                    for trainer in trainer_dict.keys():
-                        if trainer_dict[trainer]['status']['coming']:
-                            user = message.guild.get_member(trainer)
-                            otw_list.append(user.mention)
+                    for trainer in get_raid_state(message.channel).with_status('coming'):
+                        user = message.guild.get_member(trainer)
+                        otw_list.append(user.mention)
                     await message.channel.send(content=_('Meowth! Someone has suggested a different location for the raid! Trainers {trainer_list}: make sure you are headed to the right place!').format(trainer_list=', '.join(otw_list)), embed=newembed)
                     return
     if (not message.author.bot):
         await Meowth.process_commands(message)
 
+@Meowth.event
+async def on_message_edit(before, after):
+    if after.id in Meowth.messages:
+        Meowth.messages.add(after)
+
+@Meowth.event
+async def on_raw_message_delete(payload):
+    Meowth.messages.remove(payload.message_id)
+
+@Meowth.event
+async def on_raw_bulk_message_delete(payload):
+    for message_id in payload.message_ids:
+        Meowth.messages.remove(message_id)
+
 @Meowth.event
 async def on_message_delete(message):
     guild = message.guild
@@ -1261,55 +1470,103 @@ async def on_message_delete(message):
             logs[message.id] = {'author_id': message.author.id, 'author_str': str(message.author),'author_avy':message.author.avatar_url,'author_nick':message.author.nick,'color_int':message.author.color.value,'content': message.clean_content,'created_at':message.created_at}
             guild_dict[guild.id]['raidchannel_dict'][channel.id]['logs'] = logs
 
-@Meowth.event
-async def on_raw_reaction_add(payload):
+def _payload_guild(payload):
+    channel = Meowth.get_channel(payload.channel_id)
+    return getattr(channel, 'guild', None)
+
+def _raid_reaction_handler(payload):
+    guild = _payload_guild(payload)
+    if not guild:
+        return None
+    raid_data = guild_dict.peek(guild.id, {}).get('raidchannel_dict', {}).get(payload.channel_id)
+    if not raid_data:
+        return None
+    if payload.message_id == raid_data.get('ctrsmessage', None):
+        return _counters_reaction
+    if payload.message_id == raid_data.get('raidmessage', None):
+        return _raidmessage_reaction
+    return None
+
+def _wild_reaction_handler(payload):
+    guild = _payload_guild(payload)
+    if guild and wild_reports.get(guild.id, payload.message_id):
+        return _wild_reaction
+    return None
+
+async def _reaction_message(payload, fresh=False):
     channel = Meowth.get_channel(payload.channel_id)
     try:
-        message = await channel.get_message(payload.message_id)
+        if fresh:
+            message = await channel.get_message(payload.message_id)
+        else:
+            message = await Meowth.messages.fetch(channel, payload.message_id)
     except (discord.errors.NotFound, AttributeError, discord.Forbidden):
+        return (None, None)
+    user = message.guild.get_member(payload.user_id)
+    if not user:
+        return (None, None)
+    return (message, user)
+
+async def _counters_reaction(payload):
+    message, user = await _reaction_message(payload)
+    if not message:
         return
     guild = message.guild
-    try:
-        user = guild.get_member(payload.user_id)
-    except AttributeError:
+    channel = message.channel
+    ctrs_dict = await _raid_counters(guild, guild_dict[guild.id]['raidchannel_dict'][channel.id])
+    for i in ctrs_dict:
+        if ctrs_dict[i]['emoji'] == str(payload.emoji):
+            newembed = ctrs_dict[i]['embed']
+            moveset = i
+            break
+    else:
+        return
+    await message.edit(embed=newembed)
+    guild_dict[guild.id]['raidchannel_dict'][channel.id]['moveset'] = moveset
+    await message.remove_reaction(payload.emoji, user)
+
+async def _raidmessage_reaction(payload):
+    message, user = await _reaction_message(payload)
+    if not message:
         return
     guild = message.guild
-    if channel.id in guild_dict[guild.id]['raidchannel_dict'] and user.id != Meowth.user.id:
-        if message.id == guild_dict[guild.id]['raidchannel_dict'][channel.id].get('ctrsmessage',None):
-            ctrs_dict = guild_dict[guild.id]['raidchannel_dict'][channel.id]['ctrs_dict']
-            for i in ctrs_dict:
-                if ctrs_dict[i]['emoji'] == str(payload.emoji):
-                    newembed = ctrs_dict[i]['embed']
-                    moveset = i
-                    break
-            else:
-                return
-            await message.edit(embed=newembed)
-            guild_dict[guild.id]['raidchannel_dict'][channel.id]['moveset'] = moveset
-            await message.remove_reaction(payload.emoji, user)
-        elif message.id == guild_dict[guild.id]['raidchannel_dict'][channel.id].get('raidmessage',None):
-            if str(payload.emoji) == '\u2754':
-                prefix = guild_dict[guild.id]['configure_dict']['settings']['prefix']
-                prefix = prefix or Meowth.config['default_prefix']
-                avatar = Meowth.user.avatar_url
-                await utils.get_raid_help(prefix, avatar, user)
-            await message.remove_reaction(payload.emoji, user)
-    try:
-        wildreport_dict = guild_dict[guild.id]['wildreport_dict']
-    except KeyError:
-        wildreport_dict = []
-    if message.id in wildreport_dict and user.id != Meowth.user.id:
-        wild_dict = guild_dict[guild.id]['wildreport_dict'][message.id]
-        if str(payload.emoji) == '🏎':
-            wild_dict['omw'].append(user.mention)
-            guild_dict[guild.id]['wildreport_dict'][message.id] = wild_dict
-        elif str(payload.emoji) == '💨':
-            for reaction in message.reactions:
-                if reaction.emoji == '💨' and reaction.count >= 2:
-                    if wild_dict['omw']:
-                        despawn = _("has despawned")
-                        await channel.send(f"{', '.join(wild_dict['omw'])}: {wild_dict['pokemon'].title()} {despawn}!")
-                    await expire_wild(message)
+    if str(payload.emoji) == '\u2754':
+        prefix = guild_dict[guild.id]['configure_dict']['settings']['prefix']
+        prefix = prefix or Meowth.config['default_prefix']
+        avatar = Meowth.user.avatar_url
+        await utils.get_raid_help(prefix, avatar, user)
+    await message.remove_reaction(payload.emoji, user)
+
+async def _wild_reaction(payload):
+    guild = _payload_guild(payload)
+    wild_dict = wild_reports.get(guild.id, payload.message_id)
+    if not wild_dict:
+        return
+    if str(payload.emoji) == '🏎':
+        member = guild.get_member(payload.user_id)
+        if member:
+            wild_dict['omw'].append(member.mention)
+            wild_reports.touch(guild.id, payload.message_id)
+    elif str(payload.emoji) == '💨':
+        # needs the current reaction counts
+        message, user = await _reaction_message(payload, fresh=True)
+        if not message:
+            return
+        for reaction in message.reactions:
+            if reaction.emoji == '💨' and reaction.count >= 2:
+                if wild_dict['omw']:
+                    despawn = _("has despawned")
+                    await message.channel.send(f"{', '.join(wild_dict['omw'])}: {wild_dict['pokemon'].title()} {despawn}!")
+                await expire_wild(message)
+
+Meowth.reaction_router.add_resolver(_raid_reaction_handler)
+Meowth.reaction_router.add_resolver(_wild_reaction_handler)
+
+@Meowth.event
+async def on_raw_reaction_add(payload):
+    if payload.user_id == Meowth.user.id:
+        return
+    await Meowth.reaction_router.dispatch(payload)
 
 """
 Admin Commands
@@ -1378,21 +1635,42 @@ async def save(ctx):
     except Exception as err:
         await _print(Meowth.owner, _('Error occured while trying to save!'))
         await _print(Meowth.owner, err)
+    await Meowth.cluster_link.broadcast('save')
 
-async def _save():
-    with tempfile.NamedTemporaryFile('wb', dir=os.path.dirname(os.path.join('data', 'serverdict')), delete=False) as tf:
-        pickle.dump(guild_dict, tf, (- 1))
-        tempname = tf.name
+async def _write(store, *args):
+    # pickled on the loop, where the data is changed, and written in a
+    # thread, so nothing is mutated while it's being pickled
+    snapshot = store.snapshot(*args)
     try:
-        os.remove(os.path.join('data', 'serverdict_backup'))
-    except OSError as e:
-        pass
+        return await Meowth.run_blocking(store.write, snapshot)
+    except Exception:
+        store.restore(snapshot, *args)
+        raise
+
+async def _save():
+    # one save at a time
+    async with save_lock:
+        count = await _write(Meowth.guild_store, guild_dict)
+        wild_count = await _write(wild_reports)
+        await _write(Meowth.reaper)
+    logger.info(f'Saved {count} changed guild records and {wild_count} wild reports')
+
+async def _restart():
     try:
-        os.rename(os.path.join('data', 'serverdict'), os.path.join('data', 'serverdict_backup'))
-    except OSError as e:
-        if e.errno != errno.ENOENT:
-            raise
-    os.rename(tempname, os.path.join('data', 'serverdict'))
+        await _save()
+    except Exception as err:
+        await _print(Meowth.owner, _('Error occured while trying to save!'))
+        await _print(Meowth.owner, err)
+    Meowth._shutdown_mode = 26
+    await Meowth.logout()
+
+async def _reload_json():
+    load_config()
+
+# owner commands other workers broadcast
+Meowth.cluster_link.on('save', _save)
+Meowth.cluster_link.on('restart', _restart)
+Meowth.cluster_link.on('reload_json', _reload_json)
 
 @Meowth.command()
 @checks.is_owner()
@@ -1401,14 +1679,9 @@ async def restart(ctx):
 
     Usage: !restart.
     Calls the save function and restarts Meowth."""
-    try:
-        await _save()
-    except Exception as err:
-        await _print(Meowth.owner, _('Error occured while trying to save!'))
-        await _print(Meowth.owner, err)
     await ctx.channel.send(_('Restarting...'))
-    Meowth._shutdown_mode = 26
-    await Meowth.logout()
+    await Meowth.cluster_link.broadcast('restart')
+    await _restart()
 
 @Meowth.command()
 @checks.is_owner()
@@ -1426,6 +1699,51 @@ async def exit(ctx):
     Meowth._shutdown_mode = 0
     await Meowth.logout()
 
+@Meowth.command()
+@checks.is_owner()
+async def stats(ctx):
+    """Show where Meowth's time goes.
+
+    Usage: !stats
+    Lists the slowest commands with their Discord REST calls and rate
+    limit waits, event loop lag, maintenance passes and cache hit rates."""
+    metrics = Meowth.metrics
+    def field_value(lines):
+        value = ''
+        for line in lines:
+            if len(value) + len(line) + 1 > 1024:
+                break
+            value += line + '\n'
+        return value or _('Nothing yet')
+    slowest = sorted(metrics.commands.items(), key=lambda item: item[1].quantile(0.95), reverse=True)[:10]
+    command_lines = []
+    for name, histogram in slowest:
+        rest = metrics.command_rest[name] / histogram.count
+        command_lines.append(_('**{name}** - {count} runs, mean {mean:.0f}ms, p95 under {p95:.0f}ms, {rest:.1f} REST calls, {limits} rate limits').format(
+            name=name, count=histogram.count, mean=histogram.mean * 1000, p95=histogram.quantile(0.95) * 1000,
+            rest=rest, limits=metrics.command_rate_limits[name]))
+    lag = Meowth.lag_monitor
+    loop_lines = [_('Last {last:.0f}ms, worst {worst:.0f}ms, {stalls} stalls').format(
+        last=lag.last * 1000, worst=lag.worst * 1000, stalls=lag.stalls)]
+    cleanup_lines = [_('**{name}** - {duration:.0f}ms for {examined} items').format(
+        name=name, duration=stats['duration'] * 1000, examined=stats['examined'])
+        for name, stats in Meowth.maintenance_stats.items()]
+    cache_lines = [f'**{name}** - {rate:.0%}' for name, rate in _cache_hit_rates().items()]
+    rest_lines = [_('{calls} calls, {limits} rate limits').format(
+        calls=sum(metrics.routes.values()), limits=metrics.rate_limits)]
+    rest_lines += [f'{route} - {count}' for route, count in metrics.routes.most_common(5)]
+    request_lines = [_('**{name}** - {count} requests, mean {mean:.0f}ms').format(
+        name=name, count=histogram.count, mean=histogram.mean * 1000)
+        for name, histogram in metrics.timings.items()]
+    embed = discord.Embed(colour=ctx.guild.me.colour if ctx.guild else discord.Colour.lighter_grey(), title=_('Meowth Stats'))
+    embed.add_field(name=_('Slowest Commands'), value=field_value(command_lines), inline=False)
+    embed.add_field(name=_('Discord REST'), value=field_value(rest_lines), inline=False)
+    embed.add_field(name=_('Outside Requests'), value=field_value(request_lines), inline=False)
+    embed.add_field(name=_('Event Loop Lag'), value=field_value(loop_lines), inline=False)
+    embed.add_field(name=_('Maintenance'), value=field_value(cleanup_lines), inline=False)
+    embed.add_field(name=_('Cache Hit Rates'), value=field_value(cache_lines), inline=False)
+    await ctx.channel.send(embed=embed)
+
 @Meowth.group(name='set', case_insensitive=True)
 async def _set(ctx):
     """Changes a setting."""
@@ -1457,8 +1775,7 @@ async def regional(ctx, regional):
                 pass
             else:
                 return
-            guild_dict_copy = copy.deepcopy(guild_dict)
-            for guildid in guild_dict_copy.keys():
+            for guildid in list(guild_dict.keys()):
                 guild_dict[guildid]['configure_dict']['settings']['regional'] = None
             return
         elif regional == 'clear':
@@ -1514,6 +1831,7 @@ async def prefix(ctx, prefix=None):
 
 def _set_prefix(bot, guild, prefix):
     bot.guild_dict[guild.id]['configure_dict']['settings']['prefix'] = prefix
+    bot.prefixes.forget(guild.id)
 
 @_set.command()
 async def silph(ctx, silph_user: str = None):
@@ -1776,15 +2094,12 @@ async def announce(ctx, *, announce=None):
                 count += 1
             logger.info('Announcement sent to {} server owners: {} successful, {} failed.'.format(count, sent, failed))
             confirmation = await channel.send(_('Announcement sent to {} server owners: {} successful, {} failed.').format(count, sent, failed))
-        await asyncio.sleep(10)
-        await confirmation.delete()
+        Meowth.reaper.add(10, confirmation)
     else:
         await rusure.delete()
         confirmation = await channel.send(_('Announcement Timed Out.'))
-        await asyncio.sleep(10)
-        await confirmation.delete()
-    await asyncio.sleep(30)
-    await message.delete()
+        Meowth.reaper.add(10, confirmation)
+    Meowth.reaper.add(30, message)
 
 @Meowth.group(case_insensitive=True, invoke_without_command=True)
 @commands.has_permissions(manage_guild=True)
@@ -1984,7 +2299,7 @@ async def _configure_team(ctx):
                     guild_roles.append(role.name)
             lowercase_roles = [element.lower() for element in guild_roles]
             for team in config['team_dict'].keys():
-                temp_role = discord.utils.get(guild.roles, name=team)
+                temp_role = role_index.get(guild, team)
                 if temp_role == None:
                     try:
                         await guild.create_role(name=team, hoist=False, mentionable=True)
@@ -3384,6 +3699,7 @@ async def reload_json(ctx):
     Usage: !reload_json
     Useful to avoid a full restart if boss list changed"""
     load_config()
+    await Meowth.cluster_link.broadcast('reload_json')
     await ctx.message.add_reaction('☑')
 
 @Meowth.command()
@@ -3439,6 +3755,7 @@ async def raid_json(ctx, level=None, *, newlist=None):
             with open(os.path.join('data', 'raid_info.json'), 'w') as fd:
                 json.dump(data, fd, indent=2, separators=(', ', ': '))
             load_config()
+            await Meowth.cluster_link.broadcast('reload_json')
             await question.clear_reactions()
             await question.add_reaction('☑')
             return await ctx.channel.send(_("Meowth! Configuration successful!"))
@@ -3540,9 +3857,10 @@ async def changeraid(ctx, newraid):
             p_type = get_type(message.guild, p)
             boss_list.append((((p_name + ' (') + str(p)) + ') ') + ''.join(p_type))
         raid_img_url = 'https://raw.githubusercontent.com/FoglyOgly/Meowth/discordpy-v1/images/eggs/{}?cache=1'.format(str(egg_img))
-        raid_message = await channel.get_message(guild_dict[guild.id]['raidchannel_dict'][channel.id]['raidmessage'])
+        await raid_editor.flush(channel)
+        raid_message = await raid_editor.fetch(channel, guild_dict[guild.id]['raidchannel_dict'][channel.id]['raidmessage'])
         report_channel = Meowth.get_channel(raid_message.raw_channel_mentions[0])
-        report_message = await report_channel.get_message(guild_dict[guild.id]['raidchannel_dict'][channel.id]['raidreport'])
+        report_message = await raid_editor.fetch(report_channel, guild_dict[guild.id]['raidchannel_dict'][channel.id]['raidreport'])
         oldembed = raid_message.embeds[0]
         raid_embed = discord.Embed(title=oldembed.title, url=oldembed.url, colour=message.guild.me.colour)
         if len(raid_info['raid_eggs'][newraid]['pokemon']) > 1:
@@ -3633,10 +3951,12 @@ async def cleanroles(ctx):
 
     Usage: !cleanroles"""
     cleancount = 0
-    for role in copy.copy(ctx.guild.roles):
-        if role.members == [] and role.name in pkmn_info['pokemon_list']:
-            server_role = discord.utils.get(ctx.guild.roles, name=role.name)
-            await server_role.delete()
+    # recount from the member cache as it is now
+    role_index.forget(ctx.guild.id)
+    for role in role_index.empty_roles(ctx.guild):
+        # deleting can't be undone, so don't trust the counts alone
+        if role.name in pokedex and not role.members:
+            await role.delete()
             cleancount += 1
     await ctx.message.channel.send(_("Removed {cleancount} empty roles").format(cleancount=cleancount))
 
@@ -3764,15 +4084,15 @@ async def team(ctx,*,content):
     entered_team = ''.join([i for i in entered_team if i.isalpha()])
     if entered_team in lowercase_roles:
         index = lowercase_roles.index(entered_team)
-        role = discord.utils.get(ctx.guild.roles, name=guild_roles[index])
+        role = role_index.get(ctx.guild, guild_roles[index])
     if 'harmony' in lowercase_roles:
         index = lowercase_roles.index('harmony')
-        harmony = discord.utils.get(ctx.guild.roles, name=guild_roles[index])
+        harmony = role_index.get(ctx.guild, guild_roles[index])
     # Check if user already belongs to a team role by
     # getting the role objects of all teams in team_dict and
     # checking if the message author has any of them.    for team in guild_roles:
     for team in guild_roles:
-        temp_role = discord.utils.get(ctx.guild.roles, name=team)
+        temp_role = role_index.get(ctx.guild, team)
         if temp_role:
             # and the user has this role,
             if (temp_role in ctx.author.roles) and (harmony not in ctx.author.roles):
@@ -3934,8 +4254,7 @@ async def want(ctx,*,pokemon):
     for want in want_list:
         entered_want = want
         entered_want = get_name(entered_want).lower() if entered_want.isdigit() else entered_want
-        rgx = '[^a-zA-Z0-9]'
-        pkmn_match = next((p for p in pkmn_info['pokemon_list'] if re.sub(rgx, '', p) == re.sub(rgx, '', entered_want)), None)
+        pkmn_match = pokedex.match(entered_want)
         if pkmn_match:
             entered_want = pkmn_match
         elif len(want_list) == 1 and entered_want == "list":
@@ -3943,8 +4262,8 @@ async def want(ctx,*,pokemon):
             question = await message.channel.send(msg)
             return
         else:
-            entered_want = spellcheck(entered_want)
-            pkmn_match = next((p for p in pkmn_info['pokemon_list'] if re.sub(rgx, "", p) == re.sub(rgx, "", entered_want)), None)
+            entered_want = await Meowth.run_blocking(spellcheck, entered_want)
+            pkmn_match = pokedex.match(entered_want)
             if not pkmn_match:
                 if len(want_list) == 1:
                     msg = _("Meowth! **{word}** isn't a Pokemon!").format(word=entered_want.title())
@@ -3954,7 +4273,7 @@ async def want(ctx,*,pokemon):
                     spellcheck_list.append(entered_want)
                     spellcheck_dict[entered_want] = spellcheck(entered_want) if spellcheck(entered_want) != entered_want else None
                     continue
-        role = discord.utils.get(guild.roles, name=entered_want)
+        role = role_index.get(guild, entered_want)
         # Create role if it doesn't exist yet
         if role == None:
             try:
@@ -3977,7 +4296,7 @@ async def want(ctx,*,pokemon):
     if (len(want_list) == 1) and ((len(added_list) == 1) or (len(spellcheck_dict) == 1) or (len(already_want_list) == 1)):
         if len(added_list) == 1:
             #If you want Images
-            want_number = pkmn_info['pokemon_list'].index(added_list[0].lower()) + 1
+            want_number = pokedex.get_number(added_list[0].lower())
             want_img_url = 'https://raw.githubusercontent.com/FoglyOgly/Meowth/discordpy-v1/images/pkmn/{0}_.png?cache=2'.format(str(want_number).zfill(3))
             want_embed = discord.Embed(colour=guild.me.colour)
             want_embed.set_thumbnail(url=want_img_url)
@@ -4029,8 +4348,7 @@ async def unwant(ctx,*,pokemon):
         for unwant in unwant_list:
             entered_unwant = unwant
             entered_unwant = get_name(entered_unwant).lower() if entered_unwant.isdigit() else entered_unwant
-            rgx = '[^a-zA-Z0-9]'
-            pkmn_match = next((p for p in pkmn_info['pokemon_list'] if re.sub(rgx, '', p) == re.sub(rgx, '', entered_unwant)), None)
+            pkmn_match = pokedex.match(entered_unwant)
             if pkmn_match:
                 entered_unwant = pkmn_match
             else:
@@ -4039,12 +4357,12 @@ async def unwant(ctx,*,pokemon):
                 return
             # If user is not already wanting the Pokemon,
             # print a less noisy message
-            role = discord.utils.get(guild.roles, name=entered_unwant)
+            role = role_index.get(guild, entered_unwant)
             if role not in message.author.roles:
                 await message.add_reaction('☑')
             else:
                 await message.author.remove_roles(role)
-                unwant_number = pkmn_info['pokemon_list'].index(entered_unwant) + 1
+                unwant_number = pokedex.get_number(entered_unwant)
                 await message.add_reaction('☑')
 
 @unwant.command(name='all')
@@ -4066,7 +4384,7 @@ async def unwant_all(ctx):
     roles = author.roles
     remove_roles = []
     for role in roles:
-        if role.name in pkmn_info['pokemon_list']:
+        if role.name in pokedex:
             remove_roles.append(role)
             count += 1
         continue
@@ -4098,15 +4416,14 @@ async def _wild(message, content):
     if len(wild_split) <= 1:
         await message.channel.send(_('Meowth! Give more details when reporting! Usage: **!wild <pokemon name> <location>**'))
         return
-    rgx = '[^a-zA-Z0-9]'
     content = ' '.join(wild_split)
     entered_wild = content.split(' ', 1)[0]
     entered_wild = get_name(entered_wild).lower() if entered_wild.isdigit() else entered_wild.lower()
     wild_details = content.split(' ', 1)[1]
-    pkmn_match = next((p for p in pkmn_info['pokemon_list'] if re.sub(rgx, '', p) == re.sub(rgx, '', entered_wild)), None)
+    pkmn_match = pokedex.match(entered_wild)
     if (not pkmn_match):
         entered_wild2 = ' '.join([content.split(' ', 2)[0], content.split(' ', 2)[1]]).lower()
-        pkmn_match = next((p for p in pkmn_info['pokemon_list'] if re.sub(rgx, '', p) == re.sub(rgx, '', entered_wild2)), None)
+        pkmn_match = pokedex.match(entered_wild2)
         if pkmn_match:
             entered_wild = entered_wild2
             try:
@@ -4120,12 +4437,12 @@ async def _wild(message, content):
         entered_wild = await autocorrect(entered_wild, message.channel, message.author)
     if not entered_wild:
         return
-    wild = discord.utils.get(message.guild.roles, name=entered_wild)
+    wild = role_index.get(message.guild, entered_wild)
     if wild is None:
         roletest = ""
     else:
         roletest = _("{pokemon} - ").format(pokemon=wild.mention)
-    wild_number = pkmn_info['pokemon_list'].index(entered_wild) + 1
+    wild_number = pokedex.get_number(entered_wild)
     if wild_number == 25:
         wild_img_url = 'https://raw.githubusercontent.com/FoglyOgly/Meowth/discordpy-v1/images/pkmn/{0}witch_.png?cache=2'.format(str(wild_number).zfill(3))
     else:
@@ -4139,13 +4456,9 @@ async def _wild(message, content):
     wild_embed.add_field(name='\u200b', value=_("{emoji}: The Pokemon despawned!").format(emoji="💨"))
     wild_embed.set_footer(text=_('Reported by @{author} - {timestamp}').format(author=message.author.display_name, timestamp=timestamp), icon_url=message.author.avatar_url_as(format=None, static_format='jpg', size=32))
     wildreportmsg = await message.channel.send(content=_('{roletest}Meowth! Wild {pokemon} reported by {member}! Details: {location_details}').format(roletest=roletest,pokemon=entered_wild.title(), member=message.author.mention, location_details=wild_details), embed=wild_embed)
-    await asyncio.sleep(0.25)
-    await wildreportmsg.add_reaction('🏎')
-    await asyncio.sleep(0.25)
-    await wildreportmsg.add_reaction('💨')
-    await asyncio.sleep(0.25)
-    wild_dict = copy.deepcopy(guild_dict[message.guild.id].get('wildreport_dict',{}))
-    wild_dict[wildreportmsg.id] = {
+    Meowth.messages.add(wildreportmsg)
+    Meowth.reactions.add(wildreportmsg, ['🏎', '💨'])
+    wild_reports.add(message.guild.id, wildreportmsg.id, {
         'exp':time.time() + 3600,
         'expedit': {"content":wildreportmsg.content,"embedcontent":expiremsg},
         'reportmessage':message.id,
@@ -4155,10 +4468,10 @@ async def _wild(message, content):
         'url':wild_gmaps_link,
         'pokemon':entered_wild,
         'omw': []
-    }
-    guild_dict[message.guild.id]['wildreport_dict'] = wild_dict
-    wild_reports = guild_dict[message.guild.id].setdefault('trainers',{}).setdefault(message.author.id,{}).setdefault('wild_reports',0) + 1
-    guild_dict[message.guild.id]['trainers'][message.author.id]['wild_reports'] = wild_reports
+    })
+    wild_expiry_check(wildreportmsg)
+    wild_report_count = guild_dict[message.guild.id].setdefault('trainers',{}).setdefault(message.author.id,{}).setdefault('wild_reports',0) + 1
+    guild_dict[message.guild.id]['trainers'][message.author.id]['wild_reports'] = wild_report_count
 
 @Meowth.command(aliases=['r', 're', 'egg', 'regg', 'raidegg'])
 @checks.allowraidreport()
@@ -4233,7 +4546,7 @@ async def _raid(message, content):
     else:
         raidexp = False
     rgx = '[^a-zA-Z0-9]'
-    pkmn_match = next((p for p in pkmn_info['pokemon_list'] if re.sub(rgx, '', p) == re.sub(rgx, '', entered_raid)), None)
+    pkmn_match = pokedex.match(entered_raid)
     if pkmn_match:
         entered_raid = pkmn_match
     else:
@@ -4267,7 +4580,7 @@ async def _raid(message, content):
         return
     gyms = get_gyms(message.guild.id)
     if gyms:
-        match = await gym_match_prompt(message.channel, message.author.id, raid_details, gyms)
+        match = await gym_match_prompt(message.channel, message.author.id, raid_details)
         if not match:
             return await message.channel.send(_("Meowth! I couldn't find a gym named '{0}'.").format(raid_details))
         gym = gyms[match]
@@ -4279,54 +4592,45 @@ async def _raid(message, content):
         raid_gmaps_link = create_gmaps_query(raid_details, message.channel, type="raid")
     raid_channel_name = (entered_raid + '-') + sanitize_channel_name(raid_details)
     raid_channel_category = get_category(message.channel, get_level(entered_raid), category_type="raid")
-    raid_channel = await message.guild.create_text_channel(raid_channel_name, overwrites=dict(message.channel.overwrites), category=raid_channel_category)
-    ow = raid_channel.overwrites_for(raid_channel.guild.default_role)
-    ow.send_messages = True
-    try:
-        await raid_channel.set_permissions(raid_channel.guild.default_role, overwrite = ow)
-    except (discord.errors.Forbidden, discord.errors.HTTPException, discord.errors.InvalidArgument):
-        pass
-    raid = discord.utils.get(message.guild.roles, name=entered_raid)
-    if raid == None:
-        roletest = ""
-    else:
-        roletest = _("{pokemon} - ").format(pokemon=raid.mention)
-    raid_number = pkmn_info['pokemon_list'].index(entered_raid) + 1
-    raid_img_url = 'https://raw.githubusercontent.com/FoglyOgly/Meowth/discordpy-v1/images/pkmn/{0}_.png?cache=2'.format(str(raid_number).zfill(3))
-    raid_embed = discord.Embed(title=_('Meowth! Click here for directions to the raid!'), url=raid_gmaps_link, colour=message.guild.me.colour)
-    if gyms:
-        gym_info = _("**Name:** {0}\n**Notes:** {1}").format(raid_details, gym_note)
-        raid_embed.add_field(name=_('**Gym:**'), value=gym_info, inline=False)
-    raid_embed.add_field(name=_('**Details:**'), value=_('{pokemon} ({pokemonnumber}) {type}').format(pokemon=entered_raid.capitalize(), pokemonnumber=str(raid_number), type=''.join(get_type(message.guild, raid_number)), inline=True))
-    raid_embed.add_field(name=_('**Weaknesses:**'), value=_('{weakness_list}').format(weakness_list=weakness_to_str(message.guild, get_weaknesses(entered_raid))), inline=True)
-    raid_embed.add_field(name=_('**Next Group:**'), value=_('Set with **!starttime**'), inline=True)
-    raid_embed.add_field(name=_('**Expires:**'), value=_('Set with **!timerset**'), inline=True)
-    raid_embed.set_footer(text=_('Reported by @{author} - {timestamp}').format(author=message.author.display_name, timestamp=timestamp), icon_url=message.author.avatar_url_as(format=None, static_format='jpg', size=32))
-    raid_embed.set_thumbnail(url=raid_img_url)
-    report_embed = raid_embed
-    raidreport = await message.channel.send(content=_('Meowth! {pokemon} raid reported by {member}! Details: {location_details}. Coordinate in {raid_channel}').format(pokemon=entered_raid.capitalize(), member=message.author.mention, location_details=raid_details, raid_channel=raid_channel.mention), embed=report_embed)
-    await asyncio.sleep(1)
-    raidmsg = _("{roletest}Meowth! {pokemon} raid reported by {member} in {citychannel}! Details: {location_details}. Coordinate here!\n\nClick the question mark reaction to get help on the commands that work in here.\n\nThis channel will be deleted five minutes after the timer expires.").format(roletest=roletest, pokemon=entered_raid.title(), member=message.author.mention, citychannel=message.channel.mention, location_details=raid_details)
-    raidmessage = await raid_channel.send(content=raidmsg, embed=raid_embed)
-    await raidmessage.add_reaction('\u2754')
-    await raidmessage.pin()
     level = get_level(entered_raid)
-    if str(level) in guild_dict[message.guild.id]['configure_dict']['counters']['auto_levels']:
-        try:
-            ctrs_dict = await _get_generic_counters(message.guild, entered_raid, weather)
-            ctrsmsg = "Here are the best counters for the raid boss in currently known weather conditions! Update weather with **!weather**. If you know the moveset of the boss, you can react to this message with the matching emoji and I will update the counters."
-            ctrsmessage = await raid_channel.send(content=ctrsmsg,embed=ctrs_dict[0]['embed'])
-            ctrsmessage_id = ctrsmessage.id
-            await ctrsmessage.pin()
-            for moveset in ctrs_dict:
-                await ctrsmessage.add_reaction(ctrs_dict[moveset]['emoji'])
-                await asyncio.sleep(0.25)
-        except:
-            ctrs_dict = {}
-            ctrsmessage_id = None
-    else:
-        ctrs_dict = {}
+    timing = StageTimer(f'Raid Timing - {raid_channel_name}')
+    ctrs_task = _fetch_auto_counters(timing, message.guild, entered_raid, weather, level)
+    try:
+        raid_channel = await timing.run('channel', message.guild.create_text_channel(raid_channel_name, overwrites=dict(message.channel.overwrites), category=raid_channel_category))
+        raid = role_index.get(message.guild, entered_raid)
+        if raid == None:
+            roletest = ""
+        else:
+            roletest = _("{pokemon} - ").format(pokemon=raid.mention)
+        raid_number = pokedex.get_number(entered_raid)
+        raid_img_url = 'https://raw.githubusercontent.com/FoglyOgly/Meowth/discordpy-v1/images/pkmn/{0}_.png?cache=2'.format(str(raid_number).zfill(3))
+        raid_embed = discord.Embed(title=_('Meowth! Click here for directions to the raid!'), url=raid_gmaps_link, colour=message.guild.me.colour)
+        if gyms:
+            gym_info = _("**Name:** {0}\n**Notes:** {1}").format(raid_details, gym_note)
+            raid_embed.add_field(name=_('**Gym:**'), value=gym_info, inline=False)
+        raid_embed.add_field(name=_('**Details:**'), value=_('{pokemon} ({pokemonnumber}) {type}').format(pokemon=entered_raid.capitalize(), pokemonnumber=str(raid_number), type=''.join(get_type(message.guild, raid_number)), inline=True))
+        raid_embed.add_field(name=_('**Weaknesses:**'), value=_('{weakness_list}').format(weakness_list=weakness_to_str(message.guild, get_weaknesses(entered_raid))), inline=True)
+        raid_embed.add_field(name=_('**Next Group:**'), value=_('Set with **!starttime**'), inline=True)
+        raid_embed.add_field(name=_('**Expires:**'), value=_('Set with **!timerset**'), inline=True)
+        raid_embed.set_footer(text=_('Reported by @{author} - {timestamp}').format(author=message.author.display_name, timestamp=timestamp), icon_url=message.author.avatar_url_as(format=None, static_format='jpg', size=32))
+        raid_embed.set_thumbnail(url=raid_img_url)
+        reportmsg = _('Meowth! {pokemon} raid reported by {member}! Details: {location_details}. Coordinate in {raid_channel}').format(pokemon=entered_raid.capitalize(), member=message.author.mention, location_details=raid_details, raid_channel=raid_channel.mention)
+        raidmsg = _("{roletest}Meowth! {pokemon} raid reported by {member} in {citychannel}! Details: {location_details}. Coordinate here!\n\nClick the question mark reaction to get help on the commands that work in here.\n\nThis channel will be deleted five minutes after the timer expires.").format(roletest=roletest, pokemon=entered_raid.title(), member=message.author.mention, citychannel=message.channel.mention, location_details=raid_details)
+        raidreport, raidmessage = await _send_raid_messages(timing, message.channel, raid_channel, reportmsg, raidmsg, raid_embed,
+                                                            timing.run('permissions', _allow_send(raid_channel)))
+    except BaseException:
+        # don't leave the counters fetch running for a raid that failed
+        if ctrs_task:
+            ctrs_task.cancel()
+        raise
+    Meowth.reactions.add(raidmessage, ['\u2754'], pin=True)
+    try:
+        ctrs_key, ctrsmessage_id = await _post_auto_counters(timing, raid_channel, ctrs_task, entered_raid, weather)
+    except Exception:
+        logger.exception(f'Raid - Counters failed - {raid_channel.name}')
+        ctrs_key = None
         ctrsmessage_id = None
+    timing.report()
     guild_dict[message.guild.id]['raidchannel_dict'][raid_channel.id] = {
         'reportcity': message.channel.id,
         'trainer_dict': {},
@@ -4340,7 +4644,7 @@ async def _raid(message, content):
         'type': 'raid',
         'pokemon': entered_raid,
         'egglevel': '0',
-        'ctrs_dict': ctrs_dict,
+        'ctrs_key': ctrs_key,
         'moveset': 0,
         'weather': weather,
     }
@@ -4348,7 +4652,7 @@ async def _raid(message, content):
         await _timerset(raid_channel, raidexp)
     else:
         await raid_channel.send(content=_('Meowth! Hey {member}, if you can, set the time left on the raid using **!timerset <minutes>** so others can check it with **!timer**.').format(member=message.author.mention))
-    event_loop.create_task(expiry_check(raid_channel))
+    expiry_check(raid_channel)
     raid_reports = guild_dict[message.guild.id].setdefault('trainers',{}).setdefault(message.author.id,{}).setdefault('raid_reports',0) + 1
     guild_dict[message.guild.id]['trainers'][message.author.id]['raid_reports'] = raid_reports
     return raid_channel
@@ -4426,7 +4730,7 @@ async def _raidegg(message, content):
         return
     gyms = get_gyms(message.guild.id)
     if gyms:
-        match = await gym_match_prompt(message.channel, message.author.id, raid_details, gyms)
+        match = await gym_match_prompt(message.channel, message.author.id, raid_details)
         if not match:
             return await message.channel.send(_("Meowth! I couldn't find a gym named '{0}'.").format(raid_details))
         gym = gyms[match]
@@ -4461,13 +4765,8 @@ async def _raidegg(message, content):
         raid_channel_name = _('level-{egg_level}-egg-').format(egg_level=egg_level)
         raid_channel_name += sanitize_channel_name(raid_details)
         raid_channel_category = get_category(message.channel, egg_level, category_type="raid")
-        raid_channel = await message.guild.create_text_channel(raid_channel_name, overwrites=dict(message.channel.overwrites), category=raid_channel_category)
-        ow = raid_channel.overwrites_for(raid_channel.guild.default_role)
-        ow.send_messages = True
-        try:
-            await raid_channel.set_permissions(raid_channel.guild.default_role, overwrite = ow)
-        except (discord.errors.Forbidden, discord.errors.HTTPException, discord.errors.InvalidArgument):
-            pass
+        timing = StageTimer(f'Raid Timing - {raid_channel_name}')
+        raid_channel = await timing.run('channel', message.guild.create_text_channel(raid_channel_name, overwrites=dict(message.channel.overwrites), category=raid_channel_category))
         raid_img_url = 'https://raw.githubusercontent.com/FoglyOgly/Meowth/discordpy-v1/images/eggs/{}?cache=2'.format(str(egg_img))
         raid_embed = discord.Embed(title=_('Meowth! Click here for directions to the coming raid!'), url=raid_gmaps_link, colour=message.guild.me.colour)
         if gyms:
@@ -4483,12 +4782,12 @@ async def _raidegg(message, content):
         raid_embed.add_field(name=_('**Hatches:**'), value=_('Set with **!timerset**'), inline=True)
         raid_embed.set_footer(text=_('Reported by @{author} - {timestamp}').format(author=message.author.display_name, timestamp=timestamp), icon_url=message.author.avatar_url_as(format=None, static_format='jpg', size=32))
         raid_embed.set_thumbnail(url=raid_img_url)
-        raidreport = await message.channel.send(content=_('Meowth! Level {level} raid egg reported by {member}! Details: {location_details}. Coordinate in {raid_channel}').format(level=egg_level, member=message.author.mention, location_details=raid_details, raid_channel=raid_channel.mention), embed=raid_embed)
-        await asyncio.sleep(1)
+        reportmsg = _('Meowth! Level {level} raid egg reported by {member}! Details: {location_details}. Coordinate in {raid_channel}').format(level=egg_level, member=message.author.mention, location_details=raid_details, raid_channel=raid_channel.mention)
         raidmsg = _("Meowth! Level {level} raid egg reported by {member} in {citychannel}! Details: {location_details}. Coordinate here!\n\nClick the question mark reaction to get help on the commands that work in here.\n\nThis channel will be deleted five minutes after the timer expires.").format(level=egg_level, member=message.author.mention, citychannel=message.channel.mention, location_details=raid_details)
-        raidmessage = await raid_channel.send(content=raidmsg, embed=raid_embed)
-        await raidmessage.add_reaction('\u2754')
-        await raidmessage.pin()
+        raidreport, raidmessage = await _send_raid_messages(timing, message.channel, raid_channel, reportmsg, raidmsg, raid_embed,
+                                                            timing.run('permissions', _allow_send(raid_channel)))
+        Meowth.reactions.add(raidmessage, ['\u2754'], pin=True)
+        timing.report()
         guild_dict[message.guild.id]['raidchannel_dict'][raid_channel.id] = {
             'reportcity': message.channel.id,
             'trainer_dict': {
@@ -4514,7 +4813,7 @@ async def _raidegg(message, content):
             await _eggassume('assume ' + get_name(raid_info['raid_eggs'][egg_level]['pokemon'][0]), raid_channel)
         elif egg_level == "5" and guild_dict[raid_channel.guild.id]['configure_dict']['settings'].get('regional',None) in raid_info['raid_eggs']["5"]['pokemon']:
             await _eggassume('assume ' + get_name(guild_dict[raid_channel.guild.id]['configure_dict']['settings']['regional']), raid_channel)
-        event_loop.create_task(expiry_check(raid_channel))
+        expiry_check(raid_channel)
         egg_reports = guild_dict[message.guild.id].setdefault('trainers',{}).setdefault(message.author.id,{}).setdefault('egg_reports',0) + 1
         guild_dict[message.guild.id]['trainers'][message.author.id]['egg_reports'] = egg_reports
         return raid_channel
@@ -4525,12 +4824,12 @@ async def _eggassume(args, raid_channel, author=None):
     egglevel = eggdetails['egglevel']
     manual_timer = eggdetails['manual_timer']
     weather = eggdetails.get('weather', None)
-    egg_report = await report_channel.get_message(eggdetails['raidreport'])
-    raid_message = await raid_channel.get_message(eggdetails['raidmessage'])
+    await raid_editor.flush(raid_channel)
+    egg_report = await raid_editor.fetch(report_channel, eggdetails['raidreport'])
+    raid_message = await raid_editor.fetch(raid_channel, eggdetails['raidmessage'])
     entered_raid = re.sub('[\\@]', '', args.lower().lstrip('assume').lstrip(' '))
     entered_raid = get_name(entered_raid).lower() if entered_raid.isdigit() else entered_raid
-    rgx = '[^a-zA-Z0-9]'
-    pkmn_match = next((p for p in pkmn_info['pokemon_list'] if re.sub(rgx, '', p) == re.sub(rgx, '', entered_raid)), None)
+    pkmn_match = pokedex.match(entered_raid)
     if pkmn_match:
         entered_raid = pkmn_match
     else:
@@ -4547,12 +4846,12 @@ async def _eggassume(args, raid_channel, author=None):
     guild_dict[raid_channel.guild.id]['raidchannel_dict'][raid_channel.id]['pokemon'] = entered_raid
     oldembed = raid_message.embeds[0]
     raid_gmaps_link = oldembed.url
-    raidrole = discord.utils.get(raid_channel.guild.roles, name=entered_raid)
+    raidrole = role_index.get(raid_channel.guild, entered_raid)
     if raidrole == None:
         roletest = ""
     else:
         roletest = _("{pokemon} - ").format(pokemon=raidrole.mention)
-    raid_number = pkmn_info['pokemon_list'].index(entered_raid) + 1
+    raid_number = pokedex.get_number(entered_raid)
     raid_img_url = 'https://raw.githubusercontent.com/FoglyOgly/Meowth/discordpy-v1/images/pkmn/{0}_.png?cache=2'.format(str(raid_number).zfill(3))
     raid_embed = discord.Embed(title=_('Meowth! Click here for directions to the coming raid!'), url=raid_gmaps_link, colour=raid_channel.guild.me.colour)
     raid_embed.add_field(name=_('**Details:**'), value=_('{pokemon} ({pokemonnumber}) {type}').format(pokemon=entered_raid.capitalize(), pokemonnumber=str(raid_number), type=''.join(get_type(raid_channel.guild, raid_number)), inline=True))
@@ -4582,22 +4881,21 @@ async def _eggassume(args, raid_channel, author=None):
         ctrsmsg = "Here are the best counters for the raid boss in currently known weather conditions! Update weather with **!weather**. If you know the moveset of the boss, you can react to this message with the matching emoji and I will update the counters."
         ctrsmessage = await raid_channel.send(content=ctrsmsg,embed=ctrs_dict[0]['embed'])
         ctrsmessage_id = ctrsmessage.id
-        await ctrsmessage.pin()
-        for moveset in ctrs_dict:
-            await ctrsmessage.add_reaction(ctrs_dict[moveset]['emoji'])
-            await asyncio.sleep(0.25)
+        Meowth.messages.add(ctrsmessage)
+        Meowth.reactions.add(ctrsmessage, [ctrs_dict[moveset]['emoji'] for moveset in ctrs_dict], pin=True)
+        ctrs_key = (entered_raid, weather)
     else:
-        ctrs_dict = {}
+        ctrs_key = None
         ctrsmessage_id = eggdetails.get('ctrsmessage', None)
-    eggdetails['ctrs_dict'] = ctrs_dict
+    eggdetails.pop('ctrs_dict', None)
+    eggdetails['ctrs_key'] = ctrs_key
     eggdetails['ctrsmessage'] = ctrsmessage_id
     guild_dict[raid_channel.guild.id]['raidchannel_dict'][raid_channel.id] = eggdetails
     return
 
 async def _eggtoraid(entered_raid, raid_channel, author=None):
     entered_raid = get_name(entered_raid).lower() if entered_raid.isdigit() else entered_raid.lower()
-    rgx = '[^a-zA-Z0-9]'
-    pkmn_match = next((p for p in pkmn_info['pokemon_list'] if re.sub(rgx, '', p) == re.sub(rgx, '', entered_raid)), None)
+    pkmn_match = pokedex.match(entered_raid)
     if pkmn_match:
         entered_raid = pkmn_match
     else:
@@ -4617,7 +4915,8 @@ async def _eggtoraid(entered_raid, raid_channel, author=None):
     trainer_dict = eggdetails['trainer_dict']
     egg_address = eggdetails['address']
     weather = eggdetails.get('weather', None)
-    raid_message = await raid_channel.get_message(eggdetails['raidmessage'])
+    await raid_editor.flush(raid_channel)
+    raid_message = await raid_editor.fetch(raid_channel, eggdetails['raidmessage'])
     if not reportcitychannel:
         async for message in raid_channel.history(limit=500, reverse=True):
             if message.author.id == guild.me.id:
@@ -4626,10 +4925,7 @@ async def _eggtoraid(entered_raid, raid_channel, author=None):
                     reportcitychannel = message.raw_channel_mentions[0]
                     break
     if reportcitychannel:
-        try:
-            egg_report = await reportcitychannel.get_message(eggdetails['raidreport'])
-        except (discord.errors.NotFound, discord.errors.HTTPException):
-            egg_report = None
+        egg_report = await raid_editor.fetch(reportcitychannel, eggdetails['raidreport'])
     starttime = eggdetails.get('starttime',None)
     duplicate = eggdetails.get('duplicate',0)
     archive = eggdetails.get('archive',False)
@@ -4661,7 +4957,7 @@ async def _eggtoraid(entered_raid, raid_channel, author=None):
         guild_dict[raid_channel.guild.id]['raidchannel_dict'][raid_channel.id]['egglevel'] = '0'
         await raid_channel.send(_("The event has started!"), embed=oldembed)
         await raid_channel.edit(topic="")
-        event_loop.create_task(expiry_check(raid_channel))
+        expiry_check(raid_channel)
         return
     if egglevel.isdigit():
         hatchtype = 'raid'
@@ -4678,12 +4974,12 @@ async def _eggtoraid(entered_raid, raid_channel, author=None):
         raidreportcontent = _('Meowth! The EX egg has hatched into a {pokemon} raid! Details: {location_details}. {invitemsgstr} coordinate in {raid_channel}').format(pokemon=entered_raid.capitalize(), location_details=egg_address, invitemsgstr=invitemsgstr,raid_channel=raid_channel.mention)
         raidmsg = _("Meowth! {pokemon} EX raid reported by {member} in {citychannel}! Details: {location_details}. Coordinate here{invitemsgstr2}!\n\nClick the question mark reaction to get help on the commands that work in here.\n\nThis channel will be deleted five minutes after the timer expires.").format(pokemon=entered_raid.capitalize(), member=raid_messageauthor.mention, citychannel=reportcitychannel.mention, location_details=egg_address, invitemsgstr2=invitemsgstr2)
     raid_channel_name = (entered_raid + '-') + sanitize_channel_name(egg_address)
-    raid = discord.utils.get(raid_channel.guild.roles, name=entered_raid)
+    raid = role_index.get(raid_channel.guild, entered_raid)
     if raid == None:
         roletest = ""
     else:
         roletest = _("{pokemon} - ").format(pokemon=raid.mention)
-    raid_number = pkmn_info['pokemon_list'].index(entered_raid) + 1
+    raid_number = pokedex.get_number(entered_raid)
     raid_img_url = 'https://raw.githubusercontent.com/FoglyOgly/Meowth/discordpy-v1/images/pkmn/{0}_.png?cache=2'.format(str(raid_number).zfill(3))
     raid_embed = discord.Embed(title=_('Meowth! Click here for directions to the raid!'), url=raid_gmaps_link, colour=raid_channel.guild.me.colour)
     raid_embed.add_field(name=_('**Details:**'), value=_('{pokemon} ({pokemonnumber}) {type}').format(pokemon=entered_raid.capitalize(), pokemonnumber=str(raid_number), type=''.join(get_type(raid_channel.guild, raid_number)), inline=True))
@@ -4739,12 +5035,13 @@ async def _eggtoraid(entered_raid, raid_channel, author=None):
         ctrsmsg = "Here are the best counters for the raid boss in currently known weather conditions! Update weather with **!weather**. If you know the moveset of the boss, you can react to this message with the matching emoji and I will update the counters."
         ctrsmessage = await raid_channel.send(content=ctrsmsg,embed=ctrs_dict[0]['embed'])
         ctrsmessage_id = ctrsmessage.id
-        await ctrsmessage.pin()
-        for moveset in ctrs_dict:
-            await ctrsmessage.add_reaction(ctrs_dict[moveset]['emoji'])
-            await asyncio.sleep(0.25)
+        Meowth.messages.add(ctrsmessage)
+        Meowth.reactions.add(ctrsmessage, [ctrs_dict[moveset]['emoji'] for moveset in ctrs_dict], pin=True)
+        ctrs_key = (entered_raid, weather)
     else:
-        ctrs_dict = eggdetails.get('ctrs_dict',{})
+        ctrs_key = eggdetails.get('ctrs_key')
+        if not ctrs_key and eggdetails.get('ctrsmessage') and eggdetails.get('pokemon'):
+            ctrs_key = (eggdetails['pokemon'], eggdetails.get('weather'))
         ctrsmessage_id = eggdetails.get('ctrsmessage', None)
     guild_dict[raid_channel.guild.id]['raidchannel_dict'][raid_channel.id] = {
         'reportcity': reportcitychannel.id,
@@ -4758,7 +5055,7 @@ async def _eggtoraid(entered_raid, raid_channel, author=None):
         'type': hatchtype,
         'pokemon': entered_raid,
         'egglevel': '0',
-        'ctrs_dict': ctrs_dict,
+        'ctrs_key': ctrs_key,
         'ctrsmessage': ctrsmessage_id,
         'moveset': 0,
     }
@@ -4769,7 +5066,7 @@ async def _eggtoraid(entered_raid, raid_channel, author=None):
         raid_reports = guild_dict[raid_channel.guild.id].setdefault('trainers',{}).setdefault(author.id,{}).setdefault('raid_reports',0) + 1
         guild_dict[raid_channel.guild.id]['trainers'][author.id]['raid_reports'] = raid_reports
         await _edit_party(raid_channel, author)
-    event_loop.create_task(expiry_check(raid_channel))
+    expiry_check(raid_channel)
 
 @Meowth.command(aliases=['ex'])
 @checks.allowexraidreport()
@@ -4793,8 +5090,7 @@ async def _exraid(ctx, location):
     if len(exraid_split) <= 0:
         await channel.send(_('Meowth! Give more details when reporting! Usage: **!exraid <location>**'))
         return
-    rgx = '[^a-zA-Z0-9]'
-    pkmn_match = next((p for p in pkmn_info['pokemon_list'] if re.sub(rgx, '', p) == re.sub(rgx, '', exraid_split[0].lower())), None)
+    pkmn_match = pokedex.match(exraid_split[0].lower())
     if pkmn_match:
         del exraid_split[0]
     if len(exraid_split) <= 0:
@@ -4836,14 +5132,13 @@ async def _exraid(ctx, location):
     raid_channel_overwrite_list.append(meowth_overwrite)
     raid_channel_overwrites = dict(raid_channel_overwrite_list)
     raid_channel_category = get_category(message.channel,"EX", category_type="exraid")
-    raid_channel = await message.guild.create_text_channel(raid_channel_name, overwrites=raid_channel_overwrites,category=raid_channel_category)
+    timing = StageTimer(f'Raid Timing - {raid_channel_name}')
+    raid_channel = await timing.run('channel', message.guild.create_text_channel(raid_channel_name, overwrites=raid_channel_overwrites,category=raid_channel_category))
+    permissions = []
     if guild_dict[channel.guild.id]['configure_dict']['invite']['enabled']:
         for role in channel.guild.role_hierarchy:
             if role.permissions.manage_guild or role.permissions.manage_channels or role.permissions.manage_messages:
-                try:
-                    await raid_channel.set_permissions(role, send_messages=True)
-                except (discord.errors.Forbidden, discord.errors.HTTPException, discord.errors.InvalidArgument):
-                    pass
+                permissions.append(_allow_send(raid_channel, role))
     raid_img_url = 'https://raw.githubusercontent.com/FoglyOgly/Meowth/discordpy-v1/images/eggs/{}?cache=2'.format(str(egg_img))
     raid_embed = discord.Embed(title=_('Meowth! Click here for directions to the coming raid!'), url=raid_gmaps_link, colour=message.guild.me.colour)
     if len(egg_info['pokemon']) > 1:
@@ -4862,12 +5157,12 @@ async def _exraid(ctx, location):
     else:
         invitemsgstr = _("Coordinate")
         invitemsgstr2 = ""
-    raidreport = await channel.send(content=_('Meowth! EX raid egg reported by {member}! Details: {location_details}. {invitemsgstr} in {raid_channel}').format(member=message.author.mention, location_details=raid_details, invitemsgstr=invitemsgstr,raid_channel=raid_channel.mention), embed=raid_embed)
-    await asyncio.sleep(1)
+    reportmsg = _('Meowth! EX raid egg reported by {member}! Details: {location_details}. {invitemsgstr} in {raid_channel}').format(member=message.author.mention, location_details=raid_details, invitemsgstr=invitemsgstr,raid_channel=raid_channel.mention)
     raidmsg = _("Meowth! EX raid reported by {member} in {citychannel}! Details: {location_details}. Coordinate here{invitemsgstr2}!\n\nClick the question mark reaction to get help on the commands that work in here.\n\nThis channel will be deleted five minutes after the timer expires.").format(member=message.author.mention, citychannel=message.channel.mention, location_details=raid_details, invitemsgstr2=invitemsgstr2)
-    raidmessage = await raid_channel.send(content=raidmsg, embed=raid_embed)
-    await raidmessage.add_reaction('\u2754')
-    await raidmessage.pin()
+    raidreport, raidmessage = await _send_raid_messages(timing, channel, raid_channel, reportmsg, raidmsg, raid_embed,
+                                                        timing.run('permissions', asyncio.gather(*permissions)))
+    Meowth.reactions.add(raidmessage, ['\u2754'], pin=True)
+    timing.report()
     guild_dict[message.guild.id]['raidchannel_dict'][raid_channel.id] = {
         'reportcity': channel.id,
         'trainer_dict': {
@@ -4889,7 +5184,7 @@ async def _exraid(ctx, location):
     await raid_channel.send(content=_('Meowth! Hey {member}, if you can, set the time left until the egg hatches using **!timerset <date and time>** so others can check it with **!timer**. **<date and time>** can just be written exactly how it appears on your EX Raid Pass.').format(member=message.author.mention))
     ex_reports = guild_dict[message.guild.id].setdefault('trainers',{}).setdefault(message.author.id,{}).setdefault('ex_reports',0) + 1
     guild_dict[message.guild.id]['trainers'][message.author.id]['ex_reports'] = ex_reports
-    event_loop.create_task(expiry_check(raid_channel))
+    expiry_check(raid_channel)
 
 @Meowth.command()
 @checks.allowinvite()
@@ -4947,10 +5242,7 @@ async def _invite(ctx):
     else:
         await exraidchoice.delete()
         exraidmsg = await channel.send(_("Meowth! I couldn't understand your reply! Try the **!invite** command again!"))
-    await asyncio.sleep(30)
-    await ctx.message.delete()
-    await reply.delete()
-    await exraidmsg.delete()
+    Meowth.reaper.add(30, ctx.message, reply, exraidmsg)
 
 @Meowth.command(aliases=['res'])
 @checks.allowresearchreport()
@@ -5045,10 +5337,10 @@ async def research(ctx, *, details = None):
             research_embed.remove_field(0)
             break
     if not error:
-        pkmn_match = next((p for p in pkmn_info['pokemon_list'] if re.sub('[^a-zA-Z0-9]', '', p) == re.sub('[^a-zA-Z0-9]', '', reward.lower())), None)
+        pkmn_match = pokedex.match(reward.lower())
         roletest = ""
         if pkmn_match:
-            role = discord.utils.get(guild.roles, name=pkmn_match)
+            role = role_index.get(guild, pkmn_match)
             if role:
                 roletest = _("{pokemon} - ").format(pokemon=role.mention)
         research_msg = _("{roletest}Field Research reported by {author}").format(roletest=roletest,author=author.mention)
@@ -5069,15 +5361,14 @@ async def research(ctx, *, details = None):
             'reward':reward
         }
         guild_dict[guild.id]['questreport_dict'] = research_dict
+        index_report(guild.id, 'questreport_dict', confirmation.id)
         research_reports = guild_dict[ctx.guild.id].setdefault('trainers',{}).setdefault(author.id,{}).setdefault('research_reports',0) + 1
         guild_dict[ctx.guild.id]['trainers'][author.id]['research_reports'] = research_reports
     else:
         research_embed.clear_fields()
         research_embed.add_field(name=_('**Research Report Cancelled**'), value=_("Meowth! Your report has been cancelled because you {error}! Retry when you're ready.").format(error=error), inline=False)
         confirmation = await channel.send(embed=research_embed)
-        await asyncio.sleep(10)
-        await confirmation.delete()
-        await message.delete()
+        Meowth.reaper.add(10, confirmation, message)
 
 @Meowth.command(aliases=['event'])
 @checks.allowmeetupreport()
@@ -5106,13 +5397,8 @@ async def _meetup(ctx, location):
     raid_channel_name = _('meetup-')
     raid_channel_name += sanitize_channel_name(raid_details)
     raid_channel_category = get_category(message.channel,"EX", category_type="meetup")
-    raid_channel = await message.guild.create_text_channel(raid_channel_name, overwrites=dict(message.channel.overwrites), category=raid_channel_category)
-    ow = raid_channel.overwrites_for(raid_channel.guild.default_role)
-    ow.send_messages = True
-    try:
-        await raid_channel.set_permissions(raid_channel.guild.default_role, overwrite = ow)
-    except (discord.errors.Forbidden, discord.errors.HTTPException, discord.errors.InvalidArgument):
-        pass
+    timing = StageTimer(f'Raid Timing - {raid_channel_name}')
+    raid_channel = await timing.run('channel', message.guild.create_text_channel(raid_channel_name, overwrites=dict(message.channel.overwrites), category=raid_channel_category))
     raid_img_url = 'https://raw.githubusercontent.com/FoglyOgly/Meowth/discordpy-v1/images/misc/meetup.png?cache=2'
     raid_embed = discord.Embed(title=_('Meowth! Click here for directions to the event!'), url=raid_gmaps_link, colour=message.guild.me.colour)
     raid_embed.add_field(name=_('**Event Location:**'), value=raid_details, inline=True)
@@ -5121,11 +5407,12 @@ async def _meetup(ctx, location):
     raid_embed.add_field(name=_('**Event Ends:**'), value=_('Set with **!timerset**'), inline=True)
     raid_embed.set_footer(text=_('Reported by @{author} - {timestamp}').format(author=message.author.display_name, timestamp=timestamp), icon_url=message.author.avatar_url_as(format=None, static_format='jpg', size=32))
     raid_embed.set_thumbnail(url=raid_img_url)
-    raidreport = await channel.send(content=_('Meowth! Meetup reported by {member}! Details: {location_details}. Coordinate in {raid_channel}').format(member=message.author.mention, location_details=raid_details, raid_channel=raid_channel.mention), embed=raid_embed)
-    await asyncio.sleep(1)
+    reportmsg = _('Meowth! Meetup reported by {member}! Details: {location_details}. Coordinate in {raid_channel}').format(member=message.author.mention, location_details=raid_details, raid_channel=raid_channel.mention)
     raidmsg = _("Meowth! Meetup reported by {member} in {citychannel}! Details: {location_details}. Coordinate here!\n\nTo update your status, choose from the following commands: **!maybe**, **!coming**, **!here**, **!cancel**. If you are bringing more than one trainer/account, add in the number of accounts total, teams optional, on your first status update.\nExample: `!coming 5 2m 2v 1i`\n\nTo see the list of trainers who have given their status:\n**!list interested**, **!list coming**, **!list here** or use just **!list** to see all lists. Use **!list teams** to see team distribution.\n\nSometimes I'm not great at directions, but I'll correct my directions if anybody sends me a maps link or uses **!location new <address>**. You can see the location of the event by using **!location**\n\nYou can set the start time with **!starttime <MM/DD HH:MM AM/PM>** (you can also omit AM/PM and use 24-hour time) and access this with **!starttime**.\nYou can set the end time with **!timerset <MM/DD HH:MM AM/PM>** and access this with **!timer**.\n\nThis channel will be deleted five minutes after the timer expires.").format(member=message.author.mention, citychannel=message.channel.mention, location_details=raid_details)
-    raidmessage = await raid_channel.send(content=raidmsg, embed=raid_embed)
-    await raidmessage.pin()
+    raidreport, raidmessage = await _send_raid_messages(timing, channel, raid_channel, reportmsg, raidmsg, raid_embed,
+                                                        timing.run('permissions', _allow_send(raid_channel)))
+    Meowth.reactions.add(raidmessage, pin=True)
+    timing.report()
     guild_dict[message.guild.id]['raidchannel_dict'][raid_channel.id] = {
         'reportcity': channel.id,
         'trainer_dict': {},
@@ -5142,7 +5429,7 @@ async def _meetup(ctx, location):
     }
     now = datetime.datetime.utcnow() + datetime.timedelta(hours=guild_dict[raid_channel.guild.id]['configure_dict']['settings']['offset'])
     await raid_channel.send(content=_('Meowth! Hey {member}, if you can, set the time that the event starts with **!starttime <date and time>** and also set the time that the event ends using **!timerset <date and time>**.').format(member=message.author.mention))
-    event_loop.create_task(expiry_check(raid_channel))
+    expiry_check(raid_channel)
 
 """
 Raid Channel Management
@@ -5296,6 +5583,10 @@ async def timerset(ctx, *,timer):
 def _timercheck(time, maxtime):
     return time > maxtime
 
+def _field_embed(index, value, embed, name=None):
+    embed.set_field_at(index, name=name or embed.fields[index].name, value=value, inline=True)
+    return embed
+
 async def _timerset(raidchannel, exptime):
     guild = raidchannel.guild
     now = datetime.datetime.utcnow() + datetime.timedelta(hours=guild_dict[guild.id]['configure_dict']['settings']['offset'])
@@ -5323,21 +5614,9 @@ async def _timerset(raidchannel, exptime):
     timerstr = await print_raid_timer(raidchannel)
     await raidchannel.send(timerstr)
     await raidchannel.edit(topic=topicstr)
-    report_channel = Meowth.get_channel(guild_dict[guild.id]['raidchannel_dict'][raidchannel.id]['reportcity'])
-    raidmsg = await raidchannel.get_message(guild_dict[guild.id]['raidchannel_dict'][raidchannel.id]['raidmessage'])
-    reportmsg = await report_channel.get_message(guild_dict[guild.id]['raidchannel_dict'][raidchannel.id]['raidreport'])
-    embed = raidmsg.embeds[0]
-    embed.set_field_at(3, name=embed.fields[3].name, value=endtime, inline=True)
-    try:
-        await raidmsg.edit(content=raidmsg.content,embed=embed)
-    except discord.errors.NotFound:
-        pass
-    try:
-        await reportmsg.edit(content=reportmsg.content,embed=embed)
-    except discord.errors.NotFound:
-        pass
+    raid_editor.queue(raidchannel, 'timer', functools.partial(_field_embed, 3, endtime))
     raidchannel = Meowth.get_channel(raidchannel.id)
-    event_loop.create_task(expiry_check(raidchannel))
+    expiry_check(raidchannel)
 
 @Meowth.command()
 @checks.raidchannel()
@@ -5381,6 +5660,7 @@ async def starttime(ctx,*,start_time=""):
                 return
             timeset = True
             rc_d['meetup']['start'] = start
+            expiry_check(channel)
         except:
             pass
     if not timeset:
@@ -5430,8 +5710,7 @@ async def starttime(ctx,*,start_time=""):
                 if timeout or res.emoji == '❎':
                     await rusure.delete()
                     confirmation = await channel.send(_('Start time change cancelled.'))
-                    await asyncio.sleep(10)
-                    await confirmation.delete()
+                    Meowth.reaper.add(10, confirmation)
                     return
                 elif res.emoji == '✅':
                     await rusure.delete()
@@ -5445,19 +5724,7 @@ async def starttime(ctx,*,start_time=""):
         if rc_d.get('meetup',{}):
             nextgroup = start.strftime(_('%B %d at %I:%M %p (%H:%M)'))
         await channel.send(_('Meowth! The current start time has been set to: **{starttime}**').format(starttime=nextgroup))
-        report_channel = Meowth.get_channel(rc_d['reportcity'])
-        raidmsg = await channel.get_message(rc_d['raidmessage'])
-        reportmsg = await report_channel.get_message(rc_d['raidreport'])
-        embed = raidmsg.embeds[0]
-        embed.set_field_at(2, name=embed.fields[2].name, value=nextgroup, inline=True)
-        try:
-            await raidmsg.edit(content=raidmsg.content,embed=embed)
-        except discord.errors.NotFound:
-            pass
-        try:
-            await reportmsg.edit(content=reportmsg.content,embed=embed)
-        except discord.errors.NotFound:
-            pass
+        raid_editor.queue(channel, 'nextgroup', functools.partial(_field_embed, 2, nextgroup))
         return
     else:
         starttime = rc_d.get('starttime',None)
@@ -5481,7 +5748,7 @@ async def location(ctx):
         guild = message.guild
         channel = message.channel
         rc_d = guild_dict[guild.id]['raidchannel_dict']
-        raidmsg = await channel.get_message(rc_d[channel.id]['raidmessage'])
+        raidmsg = await Meowth.messages.fetch(channel, rc_d[channel.id]['raidmessage'])
         location = rc_d[channel.id]['address']
         report_channel = Meowth.get_channel(rc_d[channel.id]['reportcity'])
         oldembed = raidmsg.embeds[0]
@@ -5492,8 +5759,7 @@ async def location(ctx):
         newembed.set_footer(text=oldembed.footer.text, icon_url=oldembed.footer.icon_url)
         newembed.set_thumbnail(url=oldembed.thumbnail.url)
         locationmsg = await channel.send(content=_("Meowth! Here's the current location for the raid!\nDetails: {location}").format(location=location), embed=newembed)
-        await asyncio.sleep(60)
-        await locationmsg.delete()
+        Meowth.reaper.add(60, locationmsg)
 
 @location.command()
 @checks.activechannel()
@@ -5519,39 +5785,23 @@ async def new(ctx,*,content):
         report_city = report_channel.name
         details = ' '.join(location_split)
         newloc = create_gmaps_query(details, report_channel, type=guild_dict[message.guild.id]['raidchannel_dict'][message.channel.id]['type'])
-        oldraidmsg = await message.channel.get_message(guild_dict[message.guild.id]['raidchannel_dict'][message.channel.id]['raidmessage'])
-        oldreportmsg = await report_channel.get_message(guild_dict[message.guild.id]['raidchannel_dict'][message.channel.id]['raidreport'])
-        oldembed = oldraidmsg.embeds[0]
-        newembed = discord.Embed(title=oldembed.title, url=newloc, colour=message.guild.me.colour)
-        for field in oldembed.fields:
-            t = _('team')
-            s = _('status')
-            if (t not in field.name.lower()) and (s not in field.name.lower()):
-                newembed.add_field(name=field.name, value=field.value, inline=field.inline)
-        newembed.set_footer(text=oldembed.footer.text, icon_url=oldembed.footer.icon_url)
-        newembed.set_thumbnail(url=oldembed.thumbnail.url)
+        raid_editor.queue(message.channel, 'location', functools.partial(_location_embed, message.guild, newloc))
+        raidembed = await raid_editor.flush(message.channel)
+        newembed = None
+        if raidembed:
+            newembed = discord.Embed(title=raidembed.title, url=raidembed.url, colour=raidembed.colour)
+            for field in raidembed.fields:
+                t = _('team')
+                s = _('status')
+                if (t not in field.name.lower()) and (s not in field.name.lower()):
+                    newembed.add_field(name=field.name, value=field.value, inline=field.inline)
+            newembed.set_footer(text=raidembed.footer.text, icon_url=raidembed.footer.icon_url)
+            newembed.set_thumbnail(url=raidembed.thumbnail.url)
         otw_list = []
-        trainer_dict = copy.deepcopy(guild_dict[message.guild.id]['raidchannel_dict'][message.channel.id]['trainer_dict'])
-        for trainer in trainer_dict.keys():
-            if trainer_dict[trainer]['status']['coming']:
-                user = message.guild.get_member(trainer)
-                otw_list.append(user.mention)
+        for trainer in get_raid_state(message.channel).with_status('coming'):
+            user = message.guild.get_member(trainer)
+            otw_list.append(user.mention)
         await message.channel.send(content=_('Meowth! Someone has suggested a different location for the raid! Trainers {trainer_list}: make sure you are headed to the right place!').format(trainer_list=', '.join(otw_list)), embed=newembed)
-        for field in oldembed.fields:
-            t = _('team')
-            s = _('status')
-            if (t in field.name.lower()) or (s in field.name.lower()):
-                newembed.add_field(name=field.name, value=field.value, inline=field.inline)
-        try:
-            await oldraidmsg.edit(new_content=oldraidmsg.content, embed=newembed, content=oldraidmsg.content)
-        except:
-            pass
-        try:
-            await oldreportmsg.edit(new_content=oldreportmsg.content, embed=newembed, content=oldreportmsg.content)
-        except:
-            pass
-        guild_dict[message.guild.id]['raidchannel_dict'][message.channel.id]['raidmessage'] = oldraidmsg.id
-        guild_dict[message.guild.id]['raidchannel_dict'][message.channel.id]['raidreport'] = oldreportmsg.id
         return
 
 @Meowth.command()
@@ -5746,7 +5996,7 @@ async def recover(ctx):
             recovermsg += ('\n' + bulletpoint) + (await print_raid_timer(channel))
         await _edit_party(channel, ctx.message.author)
         await channel.send(recovermsg)
-        event_loop.create_task(expiry_check(channel))
+        expiry_check(channel)
 
 @Meowth.command()
 @checks.activechannel()
@@ -5767,22 +6017,16 @@ async def duplicate(ctx):
         dupecount = 2
         rc_d['duplicate'] = dupecount
     else:
+        if t_dict.get(author.id, {}).get('dupereporter', False):
+            dupeauthmsg = await channel.send(_("Meowth! You've already made a duplicate report for this {raidtype}!").format(raidtype=raidtype))
+            Meowth.reaper.add(10, dupeauthmsg)
+            return
+        # through RaidData so a new entry is counted in the RSVP totals
         if author.id in t_dict:
-            try:
-                if t_dict[author.id]['dupereporter']:
-                    dupeauthmsg = await channel.send(_("Meowth! You've already made a duplicate report for this {raidtype}!").format(raidtype=raidtype))
-                    await asyncio.sleep(10)
-                    await dupeauthmsg.delete()
-                    return
-                else:
-                    t_dict[author.id]['dupereporter'] = True
-            except KeyError:
-                t_dict[author.id]['dupereporter'] = True
+            get_raid_state(channel).set_trainer(author.id, dupereporter=True)
         else:
-            t_dict[author.id] = {
-                'status': {'maybe':0, 'coming':0, 'here':0, 'lobby':0},
-                'dupereporter': True,
-            }
+            get_raid_state(channel).set_trainer(
+                author.id, status={'maybe':0, 'coming':0, 'here':0, 'lobby':0}, dupereporter=True)
         try:
             dupecount = rc_d['duplicate']
         except KeyError:
@@ -5804,14 +6048,13 @@ async def duplicate(ctx):
                 logger.info((('Duplicate Report - Cancelled - ' + channel.name) + ' - Report by ') + author.name)
                 dupecount = 2
                 guild_dict[guild.id]['raidchannel_dict'][channel.id]['duplicate'] = dupecount
-                await asyncio.sleep(10)
-                await confirmation.delete()
+                Meowth.reaper.add(10, confirmation)
                 return
             elif res.emoji == '✅':
                 await rusure.delete()
                 await channel.send(_('Duplicate Confirmed'))
                 logger.info((('Duplicate Report - Channel Expired - ' + channel.name) + ' - Last Report by ') + author.name)
-                raidmsg = await channel.get_message(rc_d['raidmessage'])
+                raidmsg = await Meowth.messages.fetch(channel, rc_d['raidmessage'])
                 reporter = raidmsg.mentions[0]
                 if 'egg' in raidmsg.content:
                     egg_reports = guild_dict[guild.id]['trainers'][reporter.id]['egg_reports']
@@ -5830,8 +6073,7 @@ async def duplicate(ctx):
             logger.info((('Duplicate Report - Timeout - ' + channel.name) + ' - Report by ') + author.name)
             dupecount = 2
             guild_dict[guild.id]['raidchannel_dict'][channel.id]['duplicate'] = dupecount
-            await asyncio.sleep(10)
-            await confirmation.delete()
+            Meowth.reaper.add(10, confirmation)
     else:
         rc_d['duplicate'] = dupecount
         confirmation = await channel.send(_('Duplicate report #{duplicate_report_count} received.').format(duplicate_report_count=str(dupecount)))
@@ -5859,15 +6101,16 @@ async def counters(ctx, *, args = None):
                     user = arg
                     break
         try:
-            ctrsmessage = await channel.get_message(guild_dict[guild.id]['raidchannel_dict'][channel.id].get('ctrsmessage',None))
+            ctrsmessage = await Meowth.messages.fetch(channel, guild_dict[guild.id]['raidchannel_dict'][channel.id].get('ctrsmessage',None))
         except (discord.errors.NotFound, discord.errors.Forbidden, discord.errors.HTTPException):
             pass
         pkmn = guild_dict[guild.id]['raidchannel_dict'][channel.id].get('pokemon', None)
         if pkmn:
             if not user:
                 try:
-                    ctrsmessage = await channel.get_message(guild_dict[guild.id]['raidchannel_dict'][channel.id].get('ctrsmessage',None))
-                    ctrsembed = ctrsmessage.embeds[0]
+                    ctrsmessage = await Meowth.messages.fetch(channel, guild_dict[guild.id]['raidchannel_dict'][channel.id].get('ctrsmessage',None))
+                    # a copy, the cached message keeps its own embed
+                    ctrsembed = discord.Embed.from_data(ctrsmessage.embeds[0].to_dict())
                     ctrsembed.remove_field(6)
                     ctrsembed.remove_field(6)
                     await channel.send(content=ctrsmessage.content,embed=ctrsembed)
@@ -5875,7 +6118,8 @@ async def counters(ctx, *, args = None):
                 except (discord.errors.NotFound, discord.errors.Forbidden, discord.errors.HTTPException):
                     pass
             moveset = guild_dict[guild.id]['raidchannel_dict'][channel.id].get('moveset', 0)
-            movesetstr = guild_dict[guild.id]['raidchannel_dict'][channel.id]['ctrs_dict'].get(moveset,{}).get('moveset',"Unknown Moveset")
+            ctrs_dict = await _raid_counters(guild, guild_dict[guild.id]['raidchannel_dict'][channel.id])
+            movesetstr = ctrs_dict.get(moveset,{}).get('moveset',"Unknown Moveset")
             weather = guild_dict[guild.id]['raidchannel_dict'][channel.id].get('weather', None)
         else:
             pkmn = next((str(p) for p in get_raidlist() if not str(p).isdigit() and re.sub(rgx, '', str(p)) in re.sub(rgx, '', args.lower())), None)
@@ -5916,12 +6160,9 @@ async def _counters(ctx, pkmn, user = None, weather = None, movesetstr = "Unknow
     level = get_level(pkmn, max_lvl=6)
     if not level.isdigit():
         level = "5"
-    url = "https://fight.pokebattler.com/raids/defenders/{pkmn}/levels/RAID_LEVEL_{level}/attackers/".format(pkmn=pkmn.replace('-','_').upper(),level=level)
     if user:
-        url += "users/{user}/".format(user=user)
         userstr = _("user #{user}'s").format(user=user)
     else:
-        url += "levels/30/"
         userstr = _("Level 30")
     weather_list = [_('none'), _('extreme'), _('clear'), _('sunny'), _('rainy'),
                     _('partlycloudy'), _('cloudy'), _('windy'), _('snow'), _('fog')]
@@ -5932,12 +6173,9 @@ async def _counters(ctx, pkmn, user = None, weather = None, movesetstr = "Unknow
     else:
         index = weather_list.index(weather)
     weather = match_list[index]
-    url += "strategies/CINEMATIC_ATTACK_WHEN_POSSIBLE/DEFENSE_RANDOM_MC?sort=OVERALL&"
-    url += "weatherCondition={weather}&dodgeStrategy=DODGE_REACTION_TIME&aggregation=AVERAGE".format(weather=weather)
+    url = Meowth.pokebattler.raid_url(pkmn, level, weather, user)
     async with ctx.typing():
-        async with aiohttp.ClientSession() as sess:
-            async with sess.get(url) as resp:
-                data = await resp.json()
+        data = await Meowth.pokebattler.get_raid(pkmn, level, weather, user)
 
         title_url = url.replace('https://fight', 'https://www')
         colour = ctx.guild.me.colour
@@ -5991,6 +6229,33 @@ async def _counters(ctx, pkmn, user = None, weather = None, movesetstr = "Unknow
         await ctx.channel.send(embed=ctrs_embed)
 
 async def _get_generic_counters(guild, pkmn, weather=None):
+    """Returns the counters pages for ``pkmn`` in ``weather``.
+
+    Pages are built once per boss, weather, language and embed colour
+    and shared by every raid channel showing them.
+    """
+    key = (pkmn, weather, config['bot-language'], guild.me.colour.value)
+    cached = counters_cache.get(key)
+    if cached and cached[0] > time.time():
+        return cached[1]
+    ctrs_dict = await _build_generic_counters(guild, pkmn, weather)
+    now = time.time()
+    for old_key in [k for k, (exp, __) in counters_cache.items() if exp <= now]:
+        del counters_cache[old_key]
+    counters_cache[key] = (now + Meowth.pokebattler.ttl, ctrs_dict)
+    return ctrs_dict
+
+async def _raid_counters(guild, raid_dict):
+    """Returns the counters pages shown in a raid channel."""
+    key = raid_dict.get('ctrs_key')
+    if not key:
+        # raids saved before counters were shared only kept the pages
+        if not raid_dict.get('ctrsmessage') or not raid_dict.get('pokemon'):
+            return raid_dict.get('ctrs_dict', {})
+        key = (raid_dict['pokemon'], raid_dict.get('weather'))
+    return await _get_generic_counters(guild, *key)
+
+async def _build_generic_counters(guild, pkmn, weather=None):
     emoji_dict = {0: '0\u20e3', 1: '1\u20e3', 2: '2\u20e3', 3: '3\u20e3', 4: '4\u20e3', 5: '5\u20e3', 6: '6\u20e3', 7: '7\u20e3', 8: '8\u20e3', 9: '9\u20e3'}
     ctrs_dict = {}
     ctrs_index = 0
@@ -6001,8 +6266,6 @@ async def _get_generic_counters(guild, pkmn, weather=None):
     level = get_level(pkmn, max_lvl=6)
     if not level.isdigit():
         level = "5"
-    url = "https://fight.pokebattler.com/raids/defenders/{pkmn}/levels/RAID_LEVEL_{level}/attackers/".format(pkmn=pkmn.replace('-','_').upper(),level=level)
-    url += "levels/30/"
     weather_list = [_('none'), _('extreme'), _('clear'), _('sunny'), _('rainy'),
                     _('partlycloudy'), _('cloudy'), _('windy'), _('snow'), _('fog')]
     match_list = ['NO_WEATHER','NO_WEATHER','CLEAR','CLEAR','RAINY',
@@ -6012,14 +6275,11 @@ async def _get_generic_counters(guild, pkmn, weather=None):
     else:
         index = weather_list.index(weather)
     weather = match_list[index]
-    url += "strategies/CINEMATIC_ATTACK_WHEN_POSSIBLE/DEFENSE_RANDOM_MC?sort=OVERALL&"
-    url += "weatherCondition={weather}&dodgeStrategy=DODGE_REACTION_TIME&aggregation=AVERAGE".format(weather=weather)
+    url = Meowth.pokebattler.raid_url(pkmn, level, weather)
     title_url = url.replace('https://fight', 'https://www')
     hyperlink_icon = 'https://i.imgur.com/fn9E5nb.png'
     pbtlr_icon = 'https://www.pokebattler.com/favicon-32x32.png'
-    async with aiohttp.ClientSession() as sess:
-        async with sess.get(url) as resp:
-            data = await resp.json()
+    data = await Meowth.pokebattler.get_raid(pkmn, level, weather)
     data = data['attackers'][0]
     raid_cp = data['cp']
     atk_levels = '30'
@@ -6094,13 +6354,14 @@ async def weather(ctx, *, weather):
             if str(get_level(pkmn)) in guild_dict[ctx.guild.id]['configure_dict']['counters']['auto_levels']:
                 ctrs_dict = await _get_generic_counters(ctx.guild,pkmn,weather.lower())
                 try:
-                    ctrsmessage = await ctx.channel.get_message(guild_dict[ctx.guild.id]['raidchannel_dict'][ctx.channel.id]['ctrsmessage'])
+                    ctrsmessage = await Meowth.messages.fetch(ctx.channel, guild_dict[ctx.guild.id]['raidchannel_dict'][ctx.channel.id]['ctrsmessage'])
                     moveset = guild_dict[ctx.guild.id]['raidchannel_dict'][ctx.channel.id]['moveset']
                     newembed = ctrs_dict[moveset]['embed']
                     await ctrsmessage.edit(embed=newembed)
                 except (discord.errors.NotFound, discord.errors.Forbidden, discord.errors.HTTPException):
                     pass
-                guild_dict[ctx.guild.id]['raidchannel_dict'][ctx.channel.id]['ctrs_dict'] = ctrs_dict
+                guild_dict[ctx.guild.id]['raidchannel_dict'][ctx.channel.id].pop('ctrs_dict', None)
+                guild_dict[ctx.guild.id]['raidchannel_dict'][ctx.channel.id]['ctrs_key'] = (pkmn, weather.lower())
         return await ctx.channel.send(_("Meowth! Weather set to {}!").format(weather.lower()))
 
 """
@@ -6130,17 +6391,16 @@ async def interested(ctx, *, teamcounts: str=None):
             teamcounts = ((((str(trainer_dict[ctx.author.id]['count']) + ' ') + bluecount) + redcount) + yellowcount) + unknowncount
         else:
             teamcounts = '1'
-    rgx = '[^a-zA-Z0-9]'
     if teamcounts:
         if "all" in teamcounts.lower():
             # What a hack
             teamcounts = "{teamcounts} {bosslist}".format(teamcounts=teamcounts,bosslist=" ".join([get_name(s).title() for s in raid_info['raid_eggs'][egglevel]['pokemon']]))
             teamcounts = teamcounts.lower().replace("all","").strip()
-        pkmn_match = next((p for p in pkmn_info['pokemon_list'] if re.sub(rgx, '', p) in re.sub(rgx, '', teamcounts.lower())), None)
+        pkmn_match = pokedex.search(teamcounts.lower())
     if pkmn_match and guild_dict[ctx.guild.id]['raidchannel_dict'][ctx.channel.id]['type'] == "egg":
         entered_interest = []
         for word in re.split(' |,', teamcounts.lower()):
-            if word.lower() in pkmn_info['pokemon_list']:
+            if word.lower() in pokedex:
                 if get_number(word.lower()) in raid_info['raid_eggs'][egglevel]['pokemon']:
                     if word.lower() not in entered_interest:
                         entered_interest.append(word.lower())
@@ -6166,7 +6426,6 @@ async def interested(ctx, *, teamcounts: str=None):
         await _maybe(ctx.channel, ctx.author, count, partylist, entered_interest)
 
 async def _maybe(channel, author, count, party, entered_interest=None):
-    trainer_dict = guild_dict[channel.guild.id]['raidchannel_dict'][channel.id]['trainer_dict']
     allblue = 0
     allred = 0
     allyellow = 0
@@ -6195,17 +6454,11 @@ async def _maybe(channel, author, count, party, entered_interest=None):
     else:
         msg = _('Meowth! {member} is interested with a total of {trainer_count} trainers!').format(member=author.mention, trainer_count=count)
         await channel.send('{msg} {blue_emoji}: {mystic} | {red_emoji}: {valor} | {yellow_emoji}: {instinct} | ❔: {unknown}'.format(msg=msg, blue_emoji=parse_emoji(channel.guild, config['team_dict']['mystic']), mystic=party['mystic'], red_emoji=parse_emoji(channel.guild, config['team_dict']['valor']), valor=party['valor'], instinct=party['instinct'], yellow_emoji=parse_emoji(channel.guild, config['team_dict']['instinct']), unknown=party['unknown']))
-    if author.id not in guild_dict[channel.guild.id]['raidchannel_dict'][channel.id]['trainer_dict']:
-        trainer_dict[author.id] = {
-
-        }
-    trainer_dict[author.id]['status'] = {'maybe':count, 'coming':0, 'here':0, 'lobby':0}
+    rsvp = {'status': {'maybe':count, 'coming':0, 'here':0, 'lobby':0}, 'count': count, 'party': party}
     if entered_interest:
-        trainer_dict[author.id]['interest'] = entered_interest
-    trainer_dict[author.id]['count'] = count
-    trainer_dict[author.id]['party'] = party
+        rsvp['interest'] = entered_interest
+    get_raid_state(channel).set_trainer(author.id, **rsvp)
     await _edit_party(channel, author)
-    guild_dict[channel.guild.id]['raidchannel_dict'][channel.id]['trainer_dict'] = trainer_dict
 
 @Meowth.command(aliases=['c'])
 @checks.activechannel()
@@ -6221,7 +6474,6 @@ async def coming(ctx, *, teamcounts: str=None):
 
     Party is also optional. Format is #m #v #i #u to tell your party's teams."""
     trainer_dict = guild_dict[ctx.guild.id]['raidchannel_dict'][ctx.channel.id]['trainer_dict']
-    rgx = '[^a-zA-Z0-9]'
     entered_interest = trainer_dict.get(ctx.author.id, {}).get('interest', [])
     egglevel = guild_dict[ctx.guild.id]['raidchannel_dict'][ctx.channel.id]['egglevel']
     pkmn_match = None
@@ -6229,12 +6481,12 @@ async def coming(ctx, *, teamcounts: str=None):
         if "all" in teamcounts.lower():
             teamcounts = "{teamcounts} {bosslist}".format(teamcounts=teamcounts,bosslist=" ".join([get_name(s).title() for s in raid_info['raid_eggs'][egglevel]['pokemon']]))
             teamcounts = teamcounts.lower().replace("all","").strip()
-        pkmn_match = next((p for p in pkmn_info['pokemon_list'] if re.sub(rgx, '', p) in re.sub(rgx, '', teamcounts.lower())), None)
+        pkmn_match = pokedex.search(teamcounts.lower())
     if pkmn_match and guild_dict[ctx.guild.id]['raidchannel_dict'][ctx.channel.id]['type'] == "egg":
         entered_interest = []
         unmatched_mons = False
         for word in re.split(' |,', teamcounts.lower()):
-            if word.lower() in pkmn_info['pokemon_list']:
+            if word.lower() in pokedex:
                 if word.lower() not in entered_interest:
                     entered_interest.append(word.lower())
                     if not get_number(word.lower()) in raid_info['raid_eggs'][egglevel]['pokemon']:
@@ -6277,7 +6529,6 @@ async def _coming(channel, author, count, party, entered_interest=None):
     allred = 0
     allyellow = 0
     allunknown = 0
-    trainer_dict = guild_dict[channel.guild.id]['raidchannel_dict'][channel.id]['trainer_dict']
     if (not party):
         for role in author.roles:
             if role.name.lower() == 'mystic':
@@ -6302,17 +6553,11 @@ async def _coming(channel, author, count, party, entered_interest=None):
     else:
         msg = _('Meowth! {member} is on the way with a total of {trainer_count} trainers!').format(member=author.mention, trainer_count=count)
         await channel.send('{msg} {blue_emoji}: {mystic} | {red_emoji}: {valor} | {yellow_emoji}: {instinct} | ❔: {unknown}'.format(msg=msg, blue_emoji=parse_emoji(channel.guild, config['team_dict']['mystic']), mystic=party['mystic'], red_emoji=parse_emoji(channel.guild, config['team_dict']['valor']), valor=party['valor'], instinct=party['instinct'], yellow_emoji=parse_emoji(channel.guild, config['team_dict']['instinct']), unknown=party['unknown']))
-    if author.id not in trainer_dict:
-        trainer_dict[author.id] = {
-
-        }
-    trainer_dict[author.id]['status'] = {'maybe':0, 'coming':count, 'here':0, 'lobby':0}
-    trainer_dict[author.id]['count'] = count
-    trainer_dict[author.id]['party'] = party
+    rsvp = {'status': {'maybe':0, 'coming':count, 'here':0, 'lobby':0}, 'count': count, 'party': party}
     if entered_interest:
-        trainer_dict[author.id]['interest'] = entered_interest
+        rsvp['interest'] = entered_interest
+    get_raid_state(channel).set_trainer(author.id, **rsvp)
     await _edit_party(channel, author)
-    guild_dict[channel.guild.id]['raidchannel_dict'][channel.id]['trainer_dict'] = trainer_dict
 
 @Meowth.command(aliases=['h'])
 @checks.activechannel()
@@ -6328,7 +6573,6 @@ async def here(ctx, *, teamcounts: str=None):
 
     Party is also optional. Format is #m #v #i #u to tell your party's teams."""
     trainer_dict = guild_dict[ctx.guild.id]['raidchannel_dict'][ctx.channel.id]['trainer_dict']
-    rgx = '[^a-zA-Z0-9]'
     entered_interest = trainer_dict.get(ctx.author.id, {}).get('interest', [])
     egglevel = guild_dict[ctx.guild.id]['raidchannel_dict'][ctx.channel.id]['egglevel']
     pkmn_match = None
@@ -6336,11 +6580,11 @@ async def here(ctx, *, teamcounts: str=None):
         if "all" in teamcounts.lower():
             teamcounts = "{teamcounts} {bosslist}".format(teamcounts=teamcounts,bosslist=" ".join([get_name(s).title() for s in raid_info['raid_eggs'][egglevel]['pokemon']]))
             teamcounts = teamcounts.lower().replace("all","").strip()
-        pkmn_match = next((p for p in pkmn_info['pokemon_list'] if re.sub(rgx, '', p) in re.sub(rgx, '', teamcounts.lower())), None)
+        pkmn_match = pokedex.search(teamcounts.lower())
     if pkmn_match and guild_dict[ctx.guild.id]['raidchannel_dict'][ctx.channel.id]['type'] == "egg":
         entered_interest = []
         for word in re.split(' |,', teamcounts.lower()):
-            if word.lower() in pkmn_info['pokemon_list']:
+            if word.lower() in pokedex:
                 if get_number(word.lower()) in raid_info['raid_eggs'][egglevel]['pokemon']:
                     if word.lower() not in entered_interest:
                         entered_interest.append(word.lower())
@@ -6381,7 +6625,6 @@ async def _here(channel, author, count, party, entered_interest=None):
     allred = 0
     allyellow = 0
     allunknown = 0
-    trainer_dict = guild_dict[channel.guild.id]['raidchannel_dict'][channel.id]['trainer_dict']
     raidtype = _("event") if guild_dict[channel.guild.id]['raidchannel_dict'][channel.id].get('meetup',False) else _("raid")
     try:
         if guild_dict[channel.guild.id]['raidchannel_dict'][channel.id]['lobby']:
@@ -6414,17 +6657,11 @@ async def _here(channel, author, count, party, entered_interest=None):
         msg = _('Meowth! {member} is at the {raidtype} with a total of {trainer_count} trainers!').format(member=author.mention, trainer_count=count, raidtype=raidtype)
         msg += ' {blue_emoji}: {mystic} | {red_emoji}: {valor} | {yellow_emoji}: {instinct} | ❔: {unknown}'.format(blue_emoji=parse_emoji(channel.guild, config['team_dict']['mystic']), mystic=party['mystic'], red_emoji=parse_emoji(channel.guild, config['team_dict']['valor']), valor=party['valor'], instinct=party['instinct'], yellow_emoji=parse_emoji(channel.guild, config['team_dict']['instinct']), unknown=party['unknown'])
         await channel.send(msg + lobbymsg)
-    if author.id not in trainer_dict:
-        trainer_dict[author.id] = {
-
-        }
-    trainer_dict[author.id]['status'] = {'maybe':0, 'coming':0, 'here':count, 'lobby':0}
-    trainer_dict[author.id]['count'] = count
-    trainer_dict[author.id]['party'] = party
+    rsvp = {'status': {'maybe':0, 'coming':0, 'here':count, 'lobby':0}, 'count': count, 'party': party}
     if entered_interest:
-        trainer_dict[author.id]['interest'] = entered_interest
+        rsvp['interest'] = entered_interest
+    get_raid_state(channel).set_trainer(author.id, **rsvp)
     await _edit_party(channel, author)
-    guild_dict[channel.guild.id]['raidchannel_dict'][channel.id]['trainer_dict'] = trainer_dict
 
 async def _party_status(ctx, total, teamcounts):
     channel = ctx.channel
@@ -6508,7 +6745,20 @@ async def _party_status(ctx, total, teamcounts):
     result = [total, partylist]
     return result
 
+def _location_embed(guild, newloc, oldembed):
+    newembed = discord.Embed(title=oldembed.title, url=newloc, colour=guild.me.colour)
+    for field in oldembed.fields:
+        newembed.add_field(name=field.name, value=field.value, inline=field.inline)
+    newembed.set_footer(text=oldembed.footer.text, icon_url=oldembed.footer.icon_url)
+    newembed.set_thumbnail(url=oldembed.thumbnail.url)
+    return newembed
+
 async def _edit_party(channel, author=None):
+    raid_editor.queue(channel, 'party', functools.partial(_party_embed, channel))
+
+def _party_embed(channel, reportembed):
+    if channel.id not in guild_dict[channel.guild.id]['raidchannel_dict']:
+        return reportembed
     egglevel = guild_dict[channel.guild.id]['raidchannel_dict'][channel.id]['egglevel']
     if egglevel != "0":
         boss_dict = {}
@@ -6519,21 +6769,12 @@ async def _edit_party(channel, author=None):
             boss_list.append(p_name.lower())
             p_type = get_type(channel.guild,p)
             boss_dict[p_name.lower()] = {"type": "{}".format(''.join(p_type)), "total": 0}
-    channel_dict = {"mystic":0,"valor":0,"instinct":0,"unknown":0,"maybe":0,"coming":0,"here":0,"total":0,"boss":0}
-    team_list = ["mystic","valor","instinct","unknown"]
-    status_list = ["maybe","coming","here"]
-    trainer_dict = copy.deepcopy(guild_dict[channel.guild.id]['raidchannel_dict'][channel.id]['trainer_dict'])
-    for trainer in trainer_dict:
-        for team in team_list:
-            channel_dict[team] += int(trainer_dict[trainer]['party'][team])
-        for status in status_list:
-            if trainer_dict[trainer]['status'][status]:
-                channel_dict[status] += int(trainer_dict[trainer]['count'])
-        if egglevel != "0":
-            for boss in boss_list:
-                if boss.lower() in trainer_dict[trainer].get('interest',[]):
-                    boss_dict[boss]['total'] += int(trainer_dict[trainer]['count'])
-                    channel_dict["boss"] += int(trainer_dict[trainer]['count'])
+    totals = get_raid_state(channel).totals
+    channel_dict = dict(totals['team'], maybe=totals['status']['maybe'], coming=totals['status']['coming'], here=totals['status']['here'], total=0, boss=0)
+    if egglevel != "0":
+        for boss in boss_list:
+            boss_dict[boss]['total'] = totals['boss'].get(boss, 0)
+            channel_dict["boss"] += boss_dict[boss]['total']
     if egglevel != "0":
         for boss in boss_list:
             if boss_dict[boss]['total'] > 0:
@@ -6543,22 +6784,6 @@ async def _edit_party(channel, author=None):
                 bossstr = "{name} ({number}) {types}".format(name=boss.title(),number=get_number(boss),types=boss_dict[boss]['type'])
                 display_list.append(bossstr)
     channel_dict["total"] = channel_dict["maybe"] + channel_dict["coming"] + channel_dict["here"]
-    reportchannel = Meowth.get_channel(guild_dict[channel.guild.id]['raidchannel_dict'][channel.id]['reportcity'])
-    try:
-        reportmsg = await reportchannel.get_message(guild_dict[channel.guild.id]['raidchannel_dict'][channel.id]['raidreport'])
-    except:
-        pass
-    try:
-        raidmsg = await channel.get_message(guild_dict[channel.guild.id]['raidchannel_dict'][channel.id]['raidmessage'])
-    except:
-        async for message in channel.history(limit=500, reverse=True):
-            if author and message.author.id == channel.guild.me.id:
-                c = _('Coordinate here')
-                if c in message.content:
-                    reportchannel = message.raw_channel_mentions[0]
-                    raidmsg = message
-                    break
-    reportembed = raidmsg.embeds[0]
     newembed = discord.Embed(title=reportembed.title, url=reportembed.url, colour=channel.guild.me.colour)
     for field in reportembed.fields:
         t = _('team')
@@ -6577,14 +6802,7 @@ async def _edit_party(channel, author=None):
         newembed.add_field(name=_('**Team List**'), value='{blue_emoji}: **{channelblue}** | {red_emoji}: **{channelred}** | {yellow_emoji}: **{channelyellow}** | ❔: **{channelunknown}**'.format(blue_emoji=parse_emoji(channel.guild, config['team_dict']['mystic']), channelblue=channel_dict["mystic"], red_emoji=parse_emoji(channel.guild, config['team_dict']['valor']), channelred=channel_dict["valor"], yellow_emoji=parse_emoji(channel.guild, config['team_dict']['instinct']), channelyellow=channel_dict["instinct"], channelunknown=channel_dict["unknown"]), inline=True)
     newembed.set_footer(text=reportembed.footer.text, icon_url=reportembed.footer.icon_url)
     newembed.set_thumbnail(url=reportembed.thumbnail.url)
-    try:
-        await reportmsg.edit(embed=newembed)
-    except:
-        pass
-    try:
-        await raidmsg.edit(embed=newembed)
-    except:
-        pass
+    return newembed
 
 @Meowth.command(aliases=['l'])
 @checks.activeraidchannel()
@@ -6621,18 +6839,11 @@ async def _lobby(message, count):
     if 'lobby' not in guild_dict[message.guild.id]['raidchannel_dict'][message.channel.id]:
         await message.channel.send(_('Meowth! There is no group in the lobby for you to join! Use **!starting** if the group waiting at the raid is entering the lobby!'))
         return
-    trainer_dict = guild_dict[message.guild.id]['raidchannel_dict'][message.channel.id]['trainer_dict']
     if count == 1:
         await message.channel.send(_('Meowth! {member} is entering the lobby!').format(member=message.author.mention))
     else:
         await message.channel.send(_('Meowth! {member} is entering the lobby with a total of {trainer_count} trainers!').format(member=message.author.mention, trainer_count=count))
-    if message.author.id not in trainer_dict:
-        trainer_dict[message.author.id] = {
-
-        }
-    trainer_dict[message.author.id]['status'] = {'maybe':0, 'coming':0, 'here':0, 'lobby':count}
-    trainer_dict[message.author.id]['count'] = count
-    guild_dict[message.guild.id]['raidchannel_dict'][message.channel.id]['trainer_dict'] = trainer_dict
+    get_raid_state(message.channel).set_trainer(message.author.id, status={'maybe':0, 'coming':0, 'here':0, 'lobby':count}, count=count)
 
 @Meowth.command(aliases=['x'])
 @checks.raidchannel()
@@ -6672,10 +6883,7 @@ async def _cancel(channel, author):
             await channel.send(_('Meowth! {member} has backed out of the lobby!').format(member=author.mention))
         else:
             await channel.send(_('Meowth! {member} and their total of {trainer_count} trainers have backed out of the lobby!').format(member=author.mention, trainer_count=t_dict['count']))
-    t_dict['status'] = {'maybe':0, 'coming':0, 'here':0, 'lobby':0}
-    t_dict['party'] = {'mystic':0, 'valor':0, 'instinct':0, 'unknown':0}
-    t_dict['interest'] = []
-    t_dict['count'] = 1
+    get_raid_state(channel).set_trainer(author.id, status={'maybe':0, 'coming':0, 'here':0, 'lobby':0}, party={'mystic':0, 'valor':0, 'instinct':0, 'unknown':0}, interest=[], count=1)
     await _edit_party(channel, author)
 
 async def lobby_countdown(ctx):
@@ -6701,8 +6909,9 @@ async def lobby_countdown(ctx):
         del guild_dict[ctx.guild.id]['raidchannel_dict'][ctx.channel.id]['lobby']
     except KeyError:
         pass
-    await _edit_party(ctx.channel, ctx.author)
     guild_dict[ctx.guild.id]['raidchannel_dict'][ctx.channel.id]['trainer_dict'] = ctx.trainer_dict
+    get_raid_state(ctx.channel).invalidate()
+    await _edit_party(ctx.channel, ctx.author)
 
 @Meowth.command()
 @checks.activeraidchannel()
@@ -6762,19 +6971,7 @@ async def starting(ctx, team: str = ''):
     guild_dict[ctx.guild.id]['raidchannel_dict'][ctx.channel.id]['lobby'] = {"exp":time.time() + 120, "team":team}
     if starttime:
         starting_str += '\n\nThe start time has also been cleared, new groups can set a new start time wtih **!starttime HH:MM AM/PM** (You can also omit AM/PM and use 24-hour time!).'
-        report_channel = Meowth.get_channel(guild_dict[ctx.guild.id]['raidchannel_dict'][ctx.channel.id]['reportcity'])
-        raidmsg = await ctx.channel.get_message(guild_dict[ctx.guild.id]['raidchannel_dict'][ctx.channel.id]['raidmessage'])
-        reportmsg = await report_channel.get_message(guild_dict[ctx.guild.id]['raidchannel_dict'][ctx.channel.id]['raidreport'])
-        embed = raidmsg.embeds[0]
-        embed.set_field_at(2, name=_("**Next Group**"), value=_("Set with **!starttime**"), inline=True)
-        try:
-            await raidmsg.edit(content=raidmsg.content,embed=embed)
-        except discord.errors.NotFound:
-            pass
-        try:
-            await reportmsg.edit(content=reportmsg.content,embed=embed)
-        except discord.errors.NotFound:
-            pass
+        raid_editor.queue(ctx.channel, 'nextgroup', functools.partial(_field_embed, 2, _("Set with **!starttime**"), name=_("**Next Group**")))
     await ctx.channel.send(starting_str)
     ctx.bot.loop.create_task(lobby_countdown(ctx))
 
@@ -6789,17 +6986,17 @@ async def backout(ctx):
     channel = message.channel
     author = message.author
     guild = channel.guild
-    trainer_dict = guild_dict[guild.id]['raidchannel_dict'][channel.id]['trainer_dict']
+    raid_state = get_raid_state(channel)
+    trainer_dict = raid_state.trainers
     if (author.id in trainer_dict) and (trainer_dict[author.id]['status']['lobby']):
         count = trainer_dict[author.id]['count']
-        trainer_dict[author.id]['status'] = {'maybe':0, 'coming':0,'here':count,'lobby':0}
+        raid_state.set_trainer(author.id, status={'maybe':0, 'coming':0,'here':count,'lobby':0})
         lobby_list = []
-        for trainer in trainer_dict:
+        for trainer in raid_state.with_status('lobby'):
             count = trainer_dict[trainer]['count']
-            if trainer_dict[trainer]['status']['lobby']:
-                user = guild.get_member(trainer)
-                lobby_list.append(user.mention)
-                trainer_dict[trainer]['status'] = {'maybe':0, 'coming':0, 'here':count, 'lobby':0}
+            user = guild.get_member(trainer)
+            lobby_list.append(user.mention)
+            raid_state.set_trainer(trainer, status={'maybe':0, 'coming':0, 'here':count, 'lobby':0})
         if (not lobby_list):
             await channel.send(_("Meowth! There's no one else in the lobby for this raid!"))
             try:
@@ -6815,11 +7012,10 @@ async def backout(ctx):
     else:
         lobby_list = []
         trainer_list = []
-        for trainer in trainer_dict:
-            if trainer_dict[trainer]['status']['lobby']:
-                user = guild.get_member(trainer)
-                lobby_list.append(user.mention)
-                trainer_list.append(trainer)
+        for trainer in raid_state.with_status('lobby'):
+            user = guild.get_member(trainer)
+            lobby_list.append(user.mention)
+            trainer_list.append(trainer)
         if (not lobby_list):
             await channel.send(_("Meowth! There's no one in the lobby for this raid!"))
             return
@@ -6831,10 +7027,12 @@ async def backout(ctx):
         except TypeError:
             timeout = True
         if not timeout and res.emoji == '✅':
+            raid_state = get_raid_state(channel)
+            trainer_dict = raid_state.trainers
             for trainer in trainer_list:
                 count = trainer_dict[trainer]['count']
                 if trainer in trainer_dict:
-                    trainer_dict[trainer]['status'] = {'maybe':0, 'coming':0, 'here':count, 'lobby':0}
+                    raid_state.set_trainer(trainer, status={'maybe':0, 'coming':0, 'here':count, 'lobby':0})
             await channel.send(_('Meowth! {user} confirmed the group is backing out!').format(user=reactuser.mention))
             try:
                 del guild_dict[guild.id]['raidchannel_dict'][channel.id]['lobby']
@@ -7039,11 +7237,12 @@ async def interested(ctx, tags: str = ''):
 async def _interest(ctx, tag=False, team=False):
     ctx_maybecount = 0
     now = datetime.datetime.utcnow() + datetime.timedelta(hours=guild_dict[ctx.channel.guild.id]['configure_dict']['settings']['offset'])
-    trainer_dict = copy.deepcopy(guild_dict[ctx.guild.id]['raidchannel_dict'][ctx.channel.id]['trainer_dict'])
+    raid_state = get_raid_state(ctx.channel)
+    trainer_dict = raid_state.trainers
     maybe_exstr = ''
     maybe_list = []
     name_list = []
-    for trainer in trainer_dict.keys():
+    for trainer in raid_state.with_status('maybe'):
         user = ctx.guild.get_member(trainer)
         if (trainer_dict[trainer]['status']['maybe']) and user and team == False:
             ctx_maybecount += trainer_dict[trainer]['status']['maybe']
@@ -7086,11 +7285,12 @@ async def coming(ctx, tags: str = ''):
 async def _otw(ctx, tag=False, team=False):
     ctx_comingcount = 0
     now = datetime.datetime.utcnow() + datetime.timedelta(hours=guild_dict[ctx.channel.guild.id]['configure_dict']['settings']['offset'])
-    trainer_dict = copy.deepcopy(guild_dict[ctx.guild.id]['raidchannel_dict'][ctx.channel.id]['trainer_dict'])
+    raid_state = get_raid_state(ctx.channel)
+    trainer_dict = raid_state.trainers
     otw_exstr = ''
     otw_list = []
     name_list = []
-    for trainer in trainer_dict.keys():
+    for trainer in raid_state.with_status('coming'):
         user = ctx.guild.get_member(trainer)
         if (trainer_dict[trainer]['status']['coming']) and user and team == False:
             ctx_comingcount += trainer_dict[trainer]['status']['coming']
@@ -7133,12 +7333,13 @@ async def here(ctx, tags: str = ''):
 async def _waiting(ctx, tag=False, team=False):
     ctx_herecount = 0
     now = datetime.datetime.utcnow() + datetime.timedelta(hours=guild_dict[ctx.channel.guild.id]['configure_dict']['settings']['offset'])
-    raid_dict = copy.deepcopy(guild_dict[ctx.guild.id]['raidchannel_dict'][ctx.channel.id])
-    trainer_dict = copy.deepcopy(guild_dict[ctx.guild.id]['raidchannel_dict'][ctx.channel.id]['trainer_dict'])
+    raid_dict = guild_dict[ctx.guild.id]['raidchannel_dict'][ctx.channel.id]
+    raid_state = get_raid_state(ctx.channel)
+    trainer_dict = raid_state.trainers
     here_exstr = ''
     here_list = []
     name_list = []
-    for trainer in trainer_dict.keys():
+    for trainer in raid_state.with_status('here'):
         user = ctx.guild.get_member(trainer)
         if (trainer_dict[trainer]['status']['here']) and user and team == False:
             ctx_herecount += trainer_dict[trainer]['status']['here']
@@ -7181,12 +7382,13 @@ async def lobby(ctx, tag=False):
 async def _lobbylist(ctx, tag=False, team=False):
     ctx_lobbycount = 0
     now = datetime.datetime.utcnow() + datetime.timedelta(hours=guild_dict[ctx.channel.guild.id]['configure_dict']['settings']['offset'])
-    raid_dict = copy.deepcopy(guild_dict[ctx.guild.id]['raidchannel_dict'][ctx.channel.id])
-    trainer_dict = copy.deepcopy(guild_dict[ctx.guild.id]['raidchannel_dict'][ctx.channel.id]['trainer_dict'])
+    raid_dict = guild_dict[ctx.guild.id]['raidchannel_dict'][ctx.channel.id]
+    raid_state = get_raid_state(ctx.channel)
+    trainer_dict = raid_state.trainers
     lobby_exstr = ''
     lobby_list = []
     name_list = []
-    for trainer in trainer_dict.keys():
+    for trainer in raid_state.with_status('lobby'):
         user = ctx.guild.get_member(trainer)
         if (trainer_dict[trainer]['status']['lobby']) and user and team == False:
             ctx_lobbycount += trainer_dict[trainer]['status']['lobby']
@@ -7251,16 +7453,12 @@ async def _bosslist(ctx):
         p_type = get_type(message.guild,p)
         boss_dict[p_name.lower()] = {"type": "{}".format(''.join(p_type)), "total": 0, "maybe": 0, "coming": 0, "here": 0}
     boss_list.append('unspecified')
-    trainer_dict = copy.deepcopy(guild_dict[message.guild.id]['raidchannel_dict'][channel.id]['trainer_dict'])
-    for trainer in trainer_dict:
-        if not ctx.guild.get_member(trainer):
-            continue
-        interest = trainer_dict[trainer].get('interest', ['unspecified'])
-        for item in interest:
-            status = max(trainer_dict[trainer]['status'], key=lambda key: trainer_dict[trainer]['status'][key])
-            count = trainer_dict[trainer]['count']
-            boss_dict[item][status] += count
-            boss_dict[item]['total'] += count
+    raid_state = get_raid_state(channel)
+    departed = [t for t in raid_state.trainers if not ctx.guild.get_member(t)]
+    totals = raid_state.totals_without(departed) if departed else raid_state.totals
+    for boss in boss_list:
+        boss_dict[boss].update(totals['boss_status'].get(boss, {}))
+        boss_dict[boss]['total'] = totals['boss'].get(boss, 0)
     bossliststr = ''
     for boss in boss_list:
         if boss_dict[boss]['total'] > 0:
@@ -7292,15 +7490,13 @@ async def _teamlist(ctx):
     status_list = ["here","coming","maybe"]
     team_list = ["mystic","valor","instinct","unknown"]
     teamliststr = ''
-    trainer_dict = copy.deepcopy(guild_dict[message.guild.id]['raidchannel_dict'][message.channel.id]['trainer_dict'])
-    for trainer in trainer_dict.keys():
-        if not ctx.guild.get_member(trainer):
-            continue
-        for team in team_list:
-            team_dict[team]["total"] += int(trainer_dict[trainer]['party'][team])
-            for status in status_list:
-                if max(trainer_dict[trainer]['status'], key=lambda key: trainer_dict[trainer]['status'][key]) == status:
-                    team_dict[team][status] += int(trainer_dict[trainer]['party'][team])
+    raid_state = get_raid_state(message.channel)
+    departed = [t for t in raid_state.trainers if not ctx.guild.get_member(t)]
+    totals = raid_state.totals_without(departed) if departed else raid_state.totals
+    for team in team_list:
+        team_dict[team]["total"] = totals['team'][team]
+        for status in status_list:
+            team_dict[team][status] = totals['team_status'][team][status]
     for team in team_list[:-1]:
         if team_dict[team]['total'] > 0:
             teamliststr += _('{emoji} **{total} total,** {interested} interested, {coming} coming, {here} waiting {emoji}\n').format(emoji=parse_emoji(ctx.guild, config['team_dict'][team]), total=team_dict[team]['total'], interested=team_dict[team]['maybe'], coming=team_dict[team]['coming'], here=team_dict[team]['here'])
@@ -7329,7 +7525,7 @@ async def wants(ctx):
 async def _wantlist(ctx):
     wantlist = []
     for role in ctx.author.roles:
-        if role.name in pkmn_info['pokemon_list']:
+        if role.name in pokedex:
             wantlist.append(role.name.title())
     if len(wantlist) > 0:
         listmsg = _(' Your current **!want** list is: ```{wantlist}```').format(wantlist=', '.join(wantlist))
@@ -7353,7 +7549,7 @@ async def _researchlist(ctx):
     for questid in research_dict:
         if research_dict[questid]['reportchannel'] == ctx.message.channel.id:
             try:
-                questreportmsg = await ctx.message.channel.get_message(questid)
+                questreportmsg = await Meowth.messages.fetch(ctx.message.channel, questid)
                 questauthor = ctx.channel.guild.get_member(research_dict[questid]['reportauthor'])
                 if questauthor:
                     if len(questmsg) < 1500:
@@ -7384,25 +7580,24 @@ async def wilds(ctx):
     await ctx.channel.send(embed=discord.Embed(colour=ctx.guild.me.colour, description=listmsg))
 
 async def _wildlist(ctx):
-    wild_dict = copy.deepcopy(guild_dict[ctx.guild.id].get('wildreport_dict',{}))
+    wild_dict = dict(wild_reports.by_channel(ctx.guild.id, ctx.channel.id))
     wildmsg = ""
     for wildid in wild_dict:
-        if wild_dict[wildid]['reportchannel'] == ctx.message.channel.id:
-            try:
-                wildreportmsg = await ctx.message.channel.get_message(wildid)
-                wildauthor = ctx.channel.guild.get_member(wild_dict[wildid]['reportauthor'])
-                if wildauthor:
-                    if len(wildmsg) < 1500:
-                        wildmsg += ('\n🔹')
-                        wildmsg += _("**Pokemon**: {pokemon}, **Location**: [{location}]({url}), **Reported By**: {author}").format(pokemon=wild_dict[wildid]['pokemon'].title(),location=wild_dict[wildid]['location'].title(),author=wildauthor.display_name,url=wild_dict[wildid].get('url',None))
-                    else:
-                        listmsg = _('Meowth! **Here\'s the current wild reports for {channel}**\n{wildmsg}').format(channel=ctx.message.channel.name.capitalize(),wildmsg=wildmsg)
-                        await ctx.channel.send(embed=discord.Embed(colour=ctx.guild.me.colour, description=listmsg))
-                        wildmsg = ""
-                        wildmsg += ('\n🔹')
-                        wildmsg += _("**Pokemon**: {pokemon}, **Location**: [{location}]({url}), **Reported By**: {author}\n**Location**: <{url}>").format(pokemon=wild_dict[wildid]['pokemon'].title(),location=wild_dict[wildid]['location'].title(),author=wildauthor.display_name,url=wild_dict[wildid].get('url',None))
-            except discord.errors.NotFound:
-                continue
+        try:
+            wildreportmsg = await Meowth.messages.fetch(ctx.message.channel, wildid)
+            wildauthor = ctx.channel.guild.get_member(wild_dict[wildid]['reportauthor'])
+            if wildauthor:
+                if len(wildmsg) < 1500:
+                    wildmsg += ('\n🔹')
+                    wildmsg += _("**Pokemon**: {pokemon}, **Location**: [{location}]({url}), **Reported By**: {author}").format(pokemon=wild_dict[wildid]['pokemon'].title(),location=wild_dict[wildid]['location'].title(),author=wildauthor.display_name,url=wild_dict[wildid].get('url',None))
+                else:
+                    listmsg = _('Meowth! **Here\'s the current wild reports for {channel}**\n{wildmsg}').format(channel=ctx.message.channel.name.capitalize(),wildmsg=wildmsg)
+                    await ctx.channel.send(embed=discord.Embed(colour=ctx.guild.me.colour, description=listmsg))
+                    wildmsg = ""
+                    wildmsg += ('\n🔹')
+                    wildmsg += _("**Pokemon**: {pokemon}, **Location**: [{location}]({url}), **Reported By**: {author}\n**Location**: <{url}>").format(pokemon=wild_dict[wildid]['pokemon'].title(),location=wild_dict[wildid]['location'].title(),author=wildauthor.display_name,url=wild_dict[wildid].get('url',None))
+        except discord.errors.NotFound:
+            continue
     if wildmsg:
         listmsg = _(' **Here\'s the current wild reports for {channel}**\n{wildmsg}').format(channel=ctx.message.channel.name.capitalize(),wildmsg=wildmsg)
     else:
@@ -7423,5 +7618,8 @@ except Exception as e:
     logger.critical('Fatal exception', exc_info=e)
     event_loop.run_until_complete(Meowth.logout())
 finally:
-    pass
+    event_loop.run_until_complete(Meowth.pokebattler.close())
+    event_loop.run_until_complete(Meowth.cluster_link.close())
+    Meowth.lag_monitor.stop()
+    Meowth.executors.shutdown()
 sys.exit(Meowth._shutdown_mode)
@@ -0,0 +1,119 @@
+import logging
+
+import discord
+
+logger = logging.getLogger("meowth")
+
+# Discord's embed limits
+FIELD_NAME_LIMIT = 256
+FIELD_VALUE_LIMIT = 1024
+FIELD_COUNT_LIMIT = 25
+EMBED_LIMIT = 6000
+
+def _entry_fields(entry):
+    """Returns the ``(name, value)`` fields showing one log entry. Content
+    longer than a field continues in unnamed ones."""
+    name = entry['author_str']
+    if entry.get('author_nick'):
+        name = f"{name} [{entry['author_nick']}]"
+    created_at = entry.get('created_at')
+    if created_at:
+        name = f"{name} • {created_at.strftime('%Y-%m-%d %H:%M:%S')} UTC"
+    name = name[:FIELD_NAME_LIMIT]
+    content = entry.get('content') or '\u200b'
+    fields = []
+    for i in range(0, len(content), FIELD_VALUE_LIMIT):
+        fields.append((name if i == 0 else '\u200b', content[i:i + FIELD_VALUE_LIMIT]))
+    return fields
+
+def pack_logs(logs):
+    """Groups the entries of ``logs`` into as few embeds as Discord's
+    limits allow, oldest message first.
+
+    Returns a list of ``(embed, message_ids)`` pairs.
+    """
+    packed = []
+    embed = message_ids = None
+    size = 0
+    for message_id in sorted(logs):
+        entry = logs[message_id]
+        fields = _entry_fields(entry)
+        entry_size = sum(len(name) + len(value) for name, value in fields)
+        if (embed is None or len(embed.fields) + len(fields) > FIELD_COUNT_LIMIT
+                or size + entry_size > EMBED_LIMIT):
+            embed = discord.Embed(colour=entry.get('color_int', 0))
+            if entry.get('created_at'):
+                embed.timestamp = entry['created_at']
+            message_ids = []
+            packed.append((embed, message_ids))
+            size = 0
+        for name, value in fields:
+            embed.add_field(name=name, value=value, inline=False)
+        message_ids.append(message_id)
+        size += entry_size
+    return packed
+
+class LogReplayer:
+    """Posts the messages deleted from archived raid channels.
+
+    The log is sorted once and packed into a few embeds, each sent by a
+    background task per channel. Progress is kept in the channel's save
+    data: entries are removed from ``logs`` once the message holding
+    them is out, and ``replaying`` stays set until the log is empty, so
+    a replay cut short by a restart resumes from the next entry. A
+    replay Meowth isn't allowed to post, or that fails ``MAX_ATTEMPTS``
+    times, is given up. ``finished(channel)`` is called when a
+    channel's replay is done or given up.
+    """
+
+    MAX_ATTEMPTS = 5
+
+    def __init__(self, bot, finished=None):
+        self.bot = bot
+        self.finished = finished
+        self._tasks = {}
+        self.sent = 0
+        self.replayed = 0
+
+    def __contains__(self, channel_id):
+        return channel_id in self._tasks
+
+    def start(self, channel):
+        """Starts replaying the log of ``channel``, unless it already is."""
+        task = self._tasks.get(channel.id)
+        if task is None:
+            task = self._tasks[channel.id] = self.bot.loop.create_task(self._replay(channel))
+            task.add_done_callback(lambda t: self._tasks.pop(channel.id, None))
+        return task
+
+    async def _replay(self, channel):
+        guild_id = channel.guild.id
+        guild_dict = self.bot.guild_dict
+        raid_dict = guild_dict.peek(guild_id, {}).get('raidchannel_dict', {}).get(channel.id)
+        if raid_dict is None:
+            return
+        logs = raid_dict.setdefault('logs', {})
+        try:
+            # deletions logged while replaying go out in another pass
+            while logs:
+                for embed, message_ids in pack_logs(logs):
+                    await channel.send(embed=embed)
+                    for message_id in message_ids:
+                        logs.pop(message_id, None)
+                    guild_dict.mark_dirty(guild_id)
+                    self.sent += 1
+                    self.replayed += len(message_ids)
+            logger.info(f'Log_Replay - {channel.id} - Finished')
+        except discord.errors.HTTPException as e:
+            attempts = raid_dict.get('replay_attempts', 0) + 1
+            raid_dict['replay_attempts'] = attempts
+            guild_dict.mark_dirty(guild_id)
+            if not isinstance(e, discord.errors.Forbidden) and attempts < self.MAX_ATTEMPTS:
+                # channel_cleanup starts it again
+                logger.info(f'Log_Replay - {channel.id} - Stopped with {len(logs)} left - {type(e).__name__}: {e}')
+                return
+            logger.info(f'Log_Replay - {channel.id} - Gave up with {len(logs)} left - {type(e).__name__}: {e}')
+        raid_dict['replaying'] = False
+        guild_dict.mark_dirty(guild_id)
+        if self.finished:
+            self.finished(channel)
@@ -1,9 +1,31 @@
 from discord.ext import commands
 from meowth.context import Context
+from meowth.dispatch import MessageInfoCache, Prefixes
+from meowth.executors import LoopLagMonitor, executors
+from meowth.metrics import metrics
 
 class MeowthBot(commands.AutoShardedBot):
     """Custom Discord Bot class for Meowth"""
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.executors = executors
+        self.lag_monitor = LoopLagMonitor(self.loop)
+        self.metrics = metrics
+        self.metrics.instrument(self.http)
+        self.prefixes = Prefixes(self)
+        self._message_info = MessageInfoCache()
+
+    def message_info(self, message):
+        """Returns the :class:`MessageInfo` shared by the listeners of
+        ``message``."""
+        return self._message_info.get_info(self, message)
+
+    async def run_blocking(self, func, *args, **kwargs):
+        """Runs a blocking function in the thread pool, off the event
+        loop."""
+        return await self.executors.run(func, *args, **kwargs)
+
     async def process_commands(self, message):
         """Processes commands that are registed with the bot and it's groups.
 
@@ -12,7 +34,18 @@ class MeowthBot(commands.AutoShardedBot):
         """
         if message.author.bot:
             return
+        # chatter without a prefix never needs a Context
+        if not self.message_info(message).prefix:
+            return
         ctx = await self.get_context(message, cls=Context)
         if not ctx.command:
             return
         await self.invoke(ctx)
+
+    async def invoke(self, ctx):
+        """Invokes the command of ``ctx``, timing it and counting its
+        REST calls."""
+        if not ctx.command:
+            return await super().invoke(ctx)
+        with self.metrics.command(ctx.command.qualified_name):
+            await super().invoke(ctx)
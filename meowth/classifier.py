@@ -0,0 +1,46 @@
+import re
+
+class MessageClassifier:
+    """Per-guild lookups ``on_message`` makes for raid channel messages.
+
+    The archive phrases of a guild are compiled into one regex, rebuilt
+    whenever the configured phrase list is replaced. The omw and here
+    emoji strings are resolved once per guild and dropped when the
+    guild's emojis change.
+    """
+
+    def __init__(self, parse_emoji):
+        self.parse_emoji = parse_emoji
+        self._archive = {}
+        self._emojis = {}
+
+    def archive_matches(self, guild_id, phrases, content):
+        """Returns the archive ``phrases`` found as whole words in
+        ``content``."""
+        if not phrases:
+            return []
+        cached = self._archive.get(guild_id)
+        if not cached or cached[0] is not phrases:
+            alternatives = '|'.join(re.escape(p) for p in sorted(phrases, key=len, reverse=True) if p)
+            pattern = re.compile(f'(?<!\\S)(?:{alternatives})(?!\\S)', re.I) if alternatives else None
+            cached = self._archive[guild_id] = (phrases, pattern)
+        pattern = cached[1]
+        if not pattern:
+            return []
+        return [m.group(0) for m in pattern.finditer(content)]
+
+    def status_emojis(self, guild, omw_id, here_id):
+        """Returns the resolved ``(omw, here)`` emoji strings of ``guild``."""
+        cached = self._emojis.get(guild.id)
+        if not cached or cached[0] != (omw_id, here_id):
+            cached = self._emojis[guild.id] = (
+                (omw_id, here_id),
+                (self.parse_emoji(guild, omw_id), self.parse_emoji(guild, here_id)))
+        return cached[1]
+
+    def emojis_changed(self, guild):
+        self._emojis.pop(guild.id, None)
+
+    def forget(self, guild_id):
+        self._archive.pop(guild_id, None)
+        self._emojis.pop(guild_id, None)
@@ -0,0 +1,220 @@
+import asyncio
+import json
+import logging
+import os
+
+logger = logging.getLogger("meowth")
+
+def shard_ranges(shard_count, workers):
+    """Splits ``shard_count`` shards into ``workers`` contiguous ranges."""
+    size, extra = divmod(shard_count, workers)
+    ranges = []
+    start = 0
+    for i in range(workers):
+        end = start + size + (1 if i < extra else 0)
+        ranges.append(list(range(start, end)))
+        start = end
+    return ranges
+
+def shard_id(guild_id, shard_count):
+    """Returns the shard Discord assigns ``guild_id`` to."""
+    return (guild_id >> 22) % shard_count
+
+class ClusterConfig:
+    """Where this process sits in a multi-process deployment.
+
+    The launcher passes it to each worker through the environment. A
+    process started without it runs every shard, as before.
+    """
+
+    def __init__(self, worker=None, shard_ids=None, shard_count=None, address=None):
+        self.worker = worker
+        self.shard_ids = shard_ids
+        self.shard_count = shard_count
+        self.address = address
+
+    @classmethod
+    def from_env(cls, environ=os.environ):
+        if 'MEOWTH_WORKER' not in environ:
+            return cls()
+        return cls(
+            worker=int(environ['MEOWTH_WORKER']),
+            shard_ids=[int(s) for s in environ['MEOWTH_SHARDS'].split(',')],
+            shard_count=int(environ['MEOWTH_SHARD_COUNT']),
+            address=environ.get('MEOWTH_COORDINATOR'))
+
+    def to_env(self):
+        env = {
+            'MEOWTH_WORKER': str(self.worker),
+            'MEOWTH_SHARDS': ','.join(str(s) for s in self.shard_ids),
+            'MEOWTH_SHARD_COUNT': str(self.shard_count),
+        }
+        if self.address:
+            env['MEOWTH_COORDINATOR'] = self.address
+        return env
+
+    @property
+    def enabled(self):
+        return self.worker is not None
+
+    def bot_options(self):
+        """Returns the sharding keyword arguments for the bot."""
+        if not self.enabled:
+            return {}
+        return {'shard_ids': self.shard_ids, 'shard_count': self.shard_count}
+
+    def owns(self, guild_id):
+        """Returns whether this process handles ``guild_id``."""
+        if not self.enabled:
+            return True
+        return shard_id(guild_id, self.shard_count) in self.shard_ids
+
+def _split_address(address):
+    host, port = address.rsplit(':', 1)
+    return (host, int(port))
+
+async def _send(writer, message):
+    writer.write(json.dumps(message).encode() + b'\n')
+    await writer.drain()
+
+class Coordinator:
+    """Relays owner commands between the workers of a deployment.
+
+    Workers connect over a local socket and exchange JSON lines. A
+    command one worker broadcasts is sent to every other connected
+    worker, the sender has already run it itself.
+    """
+
+    def __init__(self, host='127.0.0.1', port=0):
+        self.host = host
+        self.port = port
+        self.workers = {}
+        self._server = None
+
+    @property
+    def address(self):
+        return f'{self.host}:{self.port}'
+
+    async def start(self):
+        self._server = await asyncio.start_server(self._handle, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+        logger.info(f'Coordinator - Listening on {self.address}')
+        return self.address
+
+    async def _handle(self, reader, writer):
+        worker = None
+        try:
+            hello = json.loads(await reader.readline())
+            worker = hello['worker']
+            self.workers[worker] = writer
+            logger.info(f'Coordinator - Worker {worker} connected')
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                message = json.loads(line)
+                if message.get('op') == 'broadcast':
+                    await self.broadcast(
+                        message['command'], message.get('args', {}), exclude=worker)
+        except (ValueError, KeyError, ConnectionError) as e:
+            logger.info(f'Coordinator - Worker {worker} - {type(e).__name__}: {e}')
+        finally:
+            if self.workers.get(worker) is writer:
+                del self.workers[worker]
+            writer.close()
+            logger.info(f'Coordinator - Worker {worker} disconnected')
+
+    async def broadcast(self, command, args=None, exclude=None):
+        """Sends ``command`` to every worker but ``exclude``. Returns the
+        number of workers it was sent to."""
+        sent = 0
+        for worker, writer in list(self.workers.items()):
+            if worker == exclude:
+                continue
+            try:
+                await _send(writer, {'op': 'command', 'command': command, 'args': args or {}})
+                sent += 1
+            except ConnectionError:
+                self.workers.pop(worker, None)
+        logger.info(f'Coordinator - {command} from worker {exclude} sent to {sent} workers')
+        return sent
+
+    async def close(self):
+        if self._server:
+            self._server.close()
+            await self._server.wait_closed()
+        for writer in self.workers.values():
+            writer.close()
+        self.workers.clear()
+
+class WorkerLink:
+    """A worker's connection to the :class:`Coordinator`.
+
+    Handlers are coroutine functions registered per command name with
+    :meth:`on`, they're called with the arguments of commands other
+    workers broadcast.
+    """
+
+    def __init__(self, config, loop=None):
+        self.config = config
+        self.loop = loop or asyncio.get_event_loop()
+        self._handlers = {}
+        self._writer = None
+        self._listener = None
+
+    @property
+    def connected(self):
+        return self._writer is not None
+
+    def on(self, command, handler):
+        self._handlers[command] = handler
+
+    async def connect(self):
+        """Connects to the coordinator, returning whether it worked."""
+        if not self.config.address:
+            return False
+        try:
+            reader, self._writer = await asyncio.open_connection(
+                *_split_address(self.config.address))
+            await _send(self._writer, {'op': 'hello', 'worker': self.config.worker})
+        except OSError as e:
+            logger.warning(f'Cluster - Coordinator unreachable - {type(e).__name__}: {e}')
+            self._writer = None
+            return False
+        self._listener = self.loop.create_task(self._listen(reader))
+        return True
+
+    async def broadcast(self, command, **args):
+        """Asks the coordinator to run ``command`` on the other workers.
+        Returns whether it was sent."""
+        if not self._writer:
+            return False
+        try:
+            await _send(self._writer, {'op': 'broadcast', 'command': command, 'args': args})
+        except ConnectionError:
+            self._writer = None
+            return False
+        return True
+
+    async def _listen(self, reader):
+        while True:
+            line = await reader.readline()
+            if not line:
+                break
+            message = json.loads(line)
+            handler = self._handlers.get(message.get('command'))
+            if not handler:
+                continue
+            try:
+                await handler(**message.get('args', {}))
+            except Exception:
+                logger.exception(f"Cluster - Command {message['command']} failed")
+        self._writer = None
+        logger.warning('Cluster - Lost the coordinator connection')
+
+    async def close(self):
+        if self._listener:
+            self._listener.cancel()
+        if self._writer:
+            self._writer.close()
+            self._writer = None
@@ -0,0 +1,85 @@
+from collections import OrderedDict
+
+class Prefixes:
+    """Command prefixes of each guild, with the bot's mentions.
+
+    Built once per guild and kept until the guild's prefix is changed,
+    so resolving them is one dict lookup per message.
+    """
+
+    def __init__(self, bot):
+        self.bot = bot
+        self._guilds = {}
+
+    def get(self, guild):
+        """Returns the prefixes for messages in ``guild``, which can be
+        ``None`` for direct messages."""
+        guild_id = guild.id if guild else None
+        prefixes = self._guilds.get(guild_id)
+        if prefixes is None:
+            prefix = None
+            if guild:
+                guild_data = self.bot.guild_dict.peek(guild.id, {})
+                prefix = guild_data.get('configure_dict', {}).get('settings', {}).get('prefix')
+            prefix = prefix or self.bot.config['default_prefix']
+            user_id = self.bot.user.id
+            # same order as commands.when_mentioned_or
+            prefixes = self._guilds[guild_id] = [f'<@{user_id}> ', f'<@!{user_id}> ', prefix]
+        return prefixes
+
+    def match(self, message):
+        """Returns the prefix ``message`` starts with, or ``None``."""
+        for prefix in self.get(message.guild):
+            if message.content.startswith(prefix):
+                return prefix
+        return None
+
+    def forget(self, guild_id):
+        self._guilds.pop(guild_id, None)
+
+    def clear(self):
+        self._guilds.clear()
+
+class MessageInfo:
+    """What's worked out about a message before it's dispatched.
+
+    One is made per message and shared by every ``on_message`` listener
+    through :meth:`MeowthBot.message_info`. Guild data is read without
+    marking the guild for saving.
+    """
+
+    __slots__ = ('message', 'guild_data', 'prefix')
+
+    def __init__(self, bot, message):
+        self.message = message
+        if message.guild:
+            self.guild_data = bot.guild_dict.peek(message.guild.id, {})
+        else:
+            self.guild_data = {}
+        self.prefix = bot.prefixes.match(message)
+
+    @property
+    def raid_status(self):
+        """The raid channel data if the message is in one, else ``None``."""
+        return self.guild_data.get('raidchannel_dict', {}).get(self.message.channel.id)
+
+    @property
+    def trade_report(self):
+        """Whether the message is in a trade report channel."""
+        trade = self.guild_data.get('configure_dict', {}).get('trade', {})
+        return self.message.channel.id in trade.get('report_channels', [])
+
+class MessageInfoCache(OrderedDict):
+    """The :class:`MessageInfo` of the most recent messages."""
+
+    def __init__(self, size=64):
+        super().__init__()
+        self.size = size
+
+    def get_info(self, bot, message):
+        info = self.get(message.id)
+        if info is None or info.message is not message:
+            info = self[message.id] = MessageInfo(bot, message)
+            if len(self) > self.size:
+                self.popitem(last=False)
+        return info
@@ -0,0 +1,97 @@
+import asyncio
+import logging
+
+import discord
+
+from meowth.messages import MessageCache
+
+logger = logging.getLogger("meowth")
+
+class MessageEditor:
+    """Batches embed updates to the messages that mirror a raid.
+
+    Updates are queued per raid channel under a key and applied together
+    after ``delay`` seconds, so a burst of RSVPs results in one edit per
+    message. Queuing an update under a key that's already pending
+    replaces it. ``locate`` is a coroutine function returning the
+    messages to edit for a raid channel, the first one found with an
+    embed is used as the base for the updates. Messages are looked up
+    through ``messages``, a :class:`MessageCache`.
+    """
+
+    def __init__(self, locate, loop=None, delay=2, messages=None):
+        self.locate = locate
+        self.loop = loop or asyncio.get_event_loop()
+        self.delay = delay
+        self.messages = messages if messages is not None else MessageCache()
+        self._pending = {}
+        self._tasks = {}
+        self._locks = {}
+        self.edits = 0
+        self.coalesced = 0
+
+    async def fetch(self, channel, message_id):
+        """Returns message ``message_id`` in ``channel``, or ``None`` if
+        it's missing."""
+        if not channel or not message_id:
+            return None
+        try:
+            return await self.messages.fetch(channel, message_id)
+        except (discord.errors.NotFound, discord.errors.Forbidden, discord.errors.HTTPException):
+            return None
+
+    def queue(self, raid_channel, key, update):
+        """Queues ``update(embed)`` for the raid's messages.
+
+        ``update`` receives the current embed and returns the new one.
+        """
+        pending = self._pending.setdefault(raid_channel.id, {})
+        if pending:
+            self.coalesced += 1
+        pending[key] = update
+        task = self._tasks.get(raid_channel.id)
+        if not task or task.done():
+            self._tasks[raid_channel.id] = self.loop.create_task(
+                self._flush_later(raid_channel))
+
+    async def _flush_later(self, raid_channel):
+        await asyncio.sleep(self.delay)
+        try:
+            await self.flush(raid_channel)
+        except Exception:
+            logger.exception(f'Editor - Flush Failed - {raid_channel.id}')
+
+    async def flush(self, raid_channel):
+        """Applies the pending updates right away and returns the
+        resulting embed, or ``None`` if there was nothing to edit."""
+        lock = self._locks.setdefault(raid_channel.id, asyncio.Lock())
+        async with lock:
+            pending = self._pending.pop(raid_channel.id, None)
+            if not pending:
+                return None
+            messages = [m for m in await self.locate(raid_channel) if m]
+            base = next((m for m in messages if m.embeds), None)
+            if not base:
+                return None
+            # updates change the embed in place, so work on a copy and
+            # leave the cached message as Discord has it until an edit lands
+            embed = discord.Embed.from_data(base.embeds[0].to_dict())
+            for update in pending.values():
+                embed = update(embed)
+            for message in messages:
+                try:
+                    await message.edit(content=message.content, embed=embed)
+                    self.edits += 1
+                except discord.errors.NotFound:
+                    self.messages.remove(message.id)
+                except (discord.errors.Forbidden, discord.errors.HTTPException):
+                    pass
+            return embed
+
+    def forget(self, raid_channel_id):
+        """Drops everything held for a raid channel that's gone."""
+        self._pending.pop(raid_channel_id, None)
+        task = self._tasks.pop(raid_channel_id, None)
+        if task:
+            task.cancel()
+        self._locks.pop(raid_channel_id, None)
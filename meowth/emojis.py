@@ -0,0 +1,57 @@
+class EmojiCache:
+    """Per-guild custom emoji lookups and the strings built from them.
+
+    Each guild's emojis are indexed by name the first time one is looked
+    up and dropped on ``on_guild_emojis_update``. The type and weakness
+    lines of Pokemon are kept per guild under a key chosen by the
+    caller, they're dropped along with the guild's emojis and all of
+    them are dropped when ``type_ids`` changes after a config reload.
+    """
+
+    def __init__(self):
+        self._names = {}
+        self._strings = {}
+        self._type_ids = None
+
+    def _names_for(self, guild):
+        names = self._names.get(guild.id)
+        if names is None:
+            names = {}
+            # same pick as discord.utils.get when names clash
+            for emoji in guild.emojis:
+                names.setdefault(emoji.name, emoji)
+            self._names[guild.id] = names
+        return names
+
+    def get(self, guild, name):
+        """Returns the custom emoji of ``guild`` called ``name`` or
+        ``None``."""
+        return self._names_for(guild).get(name)
+
+    def parse(self, guild, emoji_string):
+        """Returns ``<:name:id>`` for an emoji string like ``:name:``
+        that names one of the guild's emojis, else the string as is."""
+        if emoji_string[0] == ':' and emoji_string[-1] == ':':
+            emoji = self.get(guild, emoji_string.strip(':'))
+            if emoji:
+                return '<:{0}:{1}>'.format(emoji.name, emoji.id)
+        return emoji_string
+
+    def string(self, guild, type_ids, key, build):
+        """Returns the string cached for ``guild`` under ``key``, calling
+        ``build()`` to make it the first time."""
+        if type_ids is not self._type_ids:
+            self._strings.clear()
+            self._type_ids = type_ids
+        strings = self._strings.setdefault(guild.id, {})
+        value = strings.get(key)
+        if value is None:
+            value = strings[key] = build()
+        return value
+
+    def emojis_changed(self, guild):
+        self.forget(guild.id)
+
+    def forget(self, guild_id):
+        self._names.pop(guild_id, None)
+        self._strings.pop(guild_id, None)
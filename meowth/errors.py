@@ -3,7 +3,6 @@ import discord
 from discord.ext import commands
 from discord.ext.commands.errors import CommandError
 from inspect import signature, getfullargspec
-import asyncio
 
 class TeamSetCheckFail(CommandError):
     'Exception raised checks.teamset fails'
@@ -109,16 +108,6 @@ class TradeSetCheckFail(CommandError):
     'Exception raised checks.tradeset fails'
     pass
 
-async def delete_error(message, error):
-    try:
-        await message.delete()
-    except (discord.errors.Forbidden, discord.errors.HTTPException):
-        pass
-    try:
-        await error.delete()
-    except (discord.errors.Forbidden, discord.errors.HTTPException):
-        pass
-
 def missing_arg_msg(ctx):
     prefix = ctx.prefix.replace(ctx.bot.user.mention, '@' + ctx.bot.user.name)
     command = ctx.invoked_with
@@ -157,14 +146,12 @@ def custom_error_handling(bot, logger):
         prefix = ctx.prefix.replace(ctx.bot.user.mention, '@' + ctx.bot.user.name)
         if isinstance(error, commands.MissingRequiredArgument):
             error = await ctx.channel.send(missing_arg_msg(ctx))
-            await asyncio.sleep(10)
-            await delete_error(ctx.message, error)
+            bot.reaper.add(10, ctx.message, error)
         elif isinstance(error, commands.BadArgument):
             formatter = commands.formatter.HelpFormatter()
             page = await formatter.format_help_for(ctx, ctx.command)
             error = await ctx.channel.send(page[0])
-            await asyncio.sleep(20)
-            await delete_error(ctx.message, error)
+            bot.reaper.add(20, ctx.message, error)
         elif isinstance(error, commands.CommandNotFound):
             pass
         elif isinstance(error, commands.CheckFailure):
@@ -172,53 +159,43 @@ def custom_error_handling(bot, logger):
         elif isinstance(error, TeamSetCheckFail):
             msg = _('Meowth! Team Management is not enabled on this server. **{prefix}{cmd_name}** is unable to be used.').format(cmd_name=ctx.invoked_with, prefix=prefix)
             error = await ctx.channel.send(msg)
-            await asyncio.sleep(10)
-            await delete_error(ctx.message, error)
+            bot.reaper.add(10, ctx.message, error)
         elif isinstance(error, WantSetCheckFail):
             msg = _('Meowth! Pokemon Notifications are not enabled on this server. **{prefix}{cmd_name}** is unable to be used.').format(cmd_name=ctx.invoked_with, prefix=prefix)
             error = await ctx.channel.send(msg)
-            await asyncio.sleep(10)
-            await delete_error(ctx.message, error)
+            bot.reaper.add(10, ctx.message, error)
         elif isinstance(error, WildSetCheckFail):
             msg = _('Meowth! Wild Reporting is not enabled on this server. **{prefix}{cmd_name}** is unable to be used.').format(cmd_name=ctx.invoked_with, prefix=prefix)
             error = await ctx.channel.send(msg)
-            await asyncio.sleep(10)
-            await delete_error(ctx.message, error)
+            bot.reaper.add(10, ctx.message, error)
         elif isinstance(error, ReportCheckFail):
             msg = _('Meowth! Reporting is not enabled for this channel. **{prefix}{cmd_name}** is unable to be used.').format(cmd_name=ctx.invoked_with, prefix=prefix)
             error = await ctx.channel.send(msg)
-            await asyncio.sleep(10)
-            await delete_error(ctx.message, error)
+            bot.reaper.add(10, ctx.message, error)
         elif isinstance(error, RaidSetCheckFail):
             msg = _('Meowth! Raid Management is not enabled on this server. **{prefix}{cmd_name}** is unable to be used.').format(cmd_name=ctx.invoked_with, prefix=prefix)
             error = await ctx.channel.send(msg)
-            await asyncio.sleep(10)
-            await delete_error(ctx.message, error)
+            bot.reaper.add(10, ctx.message, error)
         elif isinstance(error, EXRaidSetCheckFail):
             msg = _('Meowth! EX Raid Management is not enabled on this server. **{prefix}{cmd_name}** is unable to be used.').format(cmd_name=ctx.invoked_with, prefix=prefix)
             error = await ctx.channel.send(msg)
-            await asyncio.sleep(10)
-            await delete_error(ctx.message, error)
+            bot.reaper.add(10, ctx.message, error)
         elif isinstance(error, ResearchSetCheckFail):
             msg = _('Meowth! Research Reporting is not enabled on this server. **{prefix}{cmd_name}** is unable to be used.').format(cmd_name=ctx.invoked_with, prefix=prefix)
             error = await ctx.channel.send(msg)
-            await asyncio.sleep(10)
-            await delete_error(ctx.message, error)
+            bot.reaper.add(10, ctx.message, error)
         elif isinstance(error, MeetupSetCheckFail):
             msg = _('Meowth! Meetup Reporting is not enabled on this server. **{prefix}{cmd_name}** is unable to be used.').format(cmd_name=ctx.invoked_with, prefix=prefix)
             error = await ctx.channel.send(msg)
-            await asyncio.sleep(10)
-            await delete_error(ctx.message, error)
+            bot.reaper.add(10, ctx.message, error)
         elif isinstance(error, ArchiveSetCheckFail):
             msg = _('Meowth! Channel Archiving is not enabled on this server. **{prefix}{cmd_name}** is unable to be used.').format(cmd_name=ctx.invoked_with, prefix=prefix)
             error = await ctx.channel.send(msg)
-            await asyncio.sleep(10)
-            await delete_error(ctx.message, error)
+            bot.reaper.add(10, ctx.message, error)
         elif isinstance(error, InviteSetCheckFail):
             msg = _('Meowth! EX Raid Invite is not enabled on this server. **{prefix}{cmd_name}** is unable to be used.').format(cmd_name=ctx.invoked_with, prefix=prefix)
             error = await ctx.channel.send(msg)
-            await asyncio.sleep(10)
-            await delete_error(ctx.message, error)
+            bot.reaper.add(10, ctx.message, error)
         elif isinstance(error, CityChannelCheckFail):
             guild = ctx.guild
             msg = _('Meowth! Please use **{prefix}{cmd_name}** in ').format(cmd_name=ctx.invoked_with, prefix=prefix)
@@ -234,8 +211,7 @@ def custom_error_handling(bot, logger):
                     else:
                         msg += '\n#deleted-channel'
             error = await ctx.channel.send(msg)
-            await asyncio.sleep(10)
-            await delete_error(ctx.message, error)
+            bot.reaper.add(10, ctx.message, error)
         elif isinstance(error, WantChannelCheckFail):
             guild = ctx.guild
             msg = _('Meowth! Please use **{prefix}{cmd_name}** in the following channel').format(cmd_name=ctx.invoked_with, prefix=prefix)
@@ -255,8 +231,7 @@ def custom_error_handling(bot, logger):
                     msg += '\n#deleted-channel'
                 counter += 1
             error = await ctx.channel.send(msg)
-            await asyncio.sleep(10)
-            await delete_error(ctx.message, error)
+            bot.reaper.add(10, ctx.message, error)
         elif isinstance(error, RaidChannelCheckFail):
             guild = ctx.guild
             msg = _('Meowth! Please use **{prefix}{cmd_name}** in a Raid channel. Use **{prefix}list** in any ').format(cmd_name=ctx.invoked_with, prefix=prefix)
@@ -272,8 +247,7 @@ def custom_error_handling(bot, logger):
                     else:
                         msg += '\n#deleted-channel'
             error = await ctx.channel.send(msg)
-            await asyncio.sleep(10)
-            await delete_error(ctx.message, error)
+            bot.reaper.add(10, ctx.message, error)
         elif isinstance(error, EggChannelCheckFail):
             guild = ctx.guild
             msg = _('Meowth! Please use **{prefix}{cmd_name}** in an Egg channel. Use **{prefix}list** in any ').format(cmd_name=ctx.invoked_with, prefix=prefix)
@@ -289,13 +263,11 @@ def custom_error_handling(bot, logger):
                     else:
                         msg += '\n#deleted-channel'
             error = await ctx.channel.send(msg)
-            await asyncio.sleep(10)
-            await delete_error(ctx.message, error)
+            bot.reaper.add(10, ctx.message, error)
         elif isinstance(error, NonRaidChannelCheckFail):
             msg = _("Meowth! **{prefix}{cmd_name}** can't be used in a Raid channel.").format(cmd_name=ctx.invoked_with, prefix=prefix)
             error = await ctx.channel.send(msg)
-            await asyncio.sleep(10)
-            await delete_error(ctx.message, error)
+            bot.reaper.add(10, ctx.message, error)
         elif isinstance(error, ActiveRaidChannelCheckFail):
             guild = ctx.guild
             msg = _('Meowth! Please use **{prefix}{cmd_name}** in an Active Raid channel. Use **{prefix}list** in any ').format(cmd_name=ctx.invoked_with, prefix=prefix)
@@ -319,8 +291,7 @@ def custom_error_handling(bot, logger):
             if egg_check == "egg" and not meetup:
                 msg += _('\nThis is an egg channel. The channel needs to be activated with **{prefix}raid <pokemon>** before I accept commands!').format(prefix=prefix)
             error = await ctx.channel.send(msg)
-            await asyncio.sleep(10)
-            await delete_error(ctx.message, error)
+            bot.reaper.add(10, ctx.message, error)
         elif isinstance(error, ActiveChannelCheckFail):
             guild = ctx.guild
             msg = _('Meowth! Please use **{prefix}{cmd_name}** in an Active channel. Use **{prefix}list** in any ').format(cmd_name=ctx.invoked_with, prefix=prefix)
@@ -344,8 +315,7 @@ def custom_error_handling(bot, logger):
             if egg_check == "egg" and not meetup:
                 msg += _('\nThis is an egg channel. The channel needs to be activated with **{prefix}raid <pokemon>** before I accept commands!').format(prefix=prefix)
             error = await ctx.channel.send(msg)
-            await asyncio.sleep(10)
-            await delete_error(ctx.message, error)
+            bot.reaper.add(10, ctx.message, error)
         elif isinstance(error, CityRaidChannelCheckFail):
             guild = ctx.guild
             msg = _('Meowth! Please use **{prefix}{cmd_name}** in either a Raid channel or ').format(cmd_name=ctx.invoked_with, prefix=prefix)
@@ -361,8 +331,7 @@ def custom_error_handling(bot, logger):
                     else:
                         msg += '\n#deleted-channel'
             error = await ctx.channel.send(msg)
-            await asyncio.sleep(10)
-            await delete_error(ctx.message, error)
+            bot.reaper.add(10, ctx.message, error)
         elif isinstance(error, RegionEggChannelCheckFail):
             guild = ctx.guild
             msg = _('Meowth! Please use **{prefix}{cmd_name}** in either a Raid Egg channel or ').format(cmd_name=ctx.invoked_with, prefix=prefix)
@@ -378,8 +347,7 @@ def custom_error_handling(bot, logger):
                     else:
                         msg += '\n#deleted-channel'
             error = await ctx.channel.send(msg)
-            await asyncio.sleep(10)
-            await delete_error(ctx.message, error)
+            bot.reaper.add(10, ctx.message, error)
         elif isinstance(error, RegionExRaidChannelCheckFail):
             guild = ctx.guild
             msg = _('Meowth! Please use **{prefix}{cmd_name}** in either a EX Raid channel or one of the following region channels:').format(cmd_name=ctx.invoked_with, prefix=prefix)
@@ -395,8 +363,7 @@ def custom_error_handling(bot, logger):
                     else:
                         msg += '\n#deleted-channel'
             error = await ctx.channel.send(msg)
-            await asyncio.sleep(10)
-            await delete_error(ctx.message, error)
+            bot.reaper.add(10, ctx.message, error)
         elif isinstance(error, ExRaidChannelCheckFail):
             guild = ctx.guild
             msg = _('Meowth! Please use **{prefix}{cmd_name}** in a EX Raid channel. Use **{prefix}list** in any of the following region channels to see active raids:').format(cmd_name=ctx.invoked_with, prefix=prefix)
@@ -412,8 +379,7 @@ def custom_error_handling(bot, logger):
                     else:
                         msg += '\n#deleted-channel'
             error = await ctx.channel.send(msg)
-            await asyncio.sleep(10)
-            await delete_error(ctx.message, error)
+            bot.reaper.add(10, ctx.message, error)
         elif isinstance(error, ResearchReportChannelCheckFail):
             guild = ctx.guild
             msg = _('Meowth! Please use **{prefix}{cmd_name}** in ').format(cmd_name=ctx.invoked_with, prefix=prefix)
@@ -429,8 +395,7 @@ def custom_error_handling(bot, logger):
                     else:
                         msg += '\n#deleted-channel'
             error = await ctx.channel.send(msg)
-            await asyncio.sleep(10)
-            await delete_error(ctx.message, error)
+            bot.reaper.add(10, ctx.message, error)
         elif isinstance(error, MeetupReportChannelCheckFail):
             guild = ctx.guild
             msg = _('Meowth! Please use **{prefix}{cmd_name}** in ').format(cmd_name=ctx.invoked_with, prefix=prefix)
@@ -446,8 +411,7 @@ def custom_error_handling(bot, logger):
                     else:
                         msg += '\n#deleted-channel'
             error = await ctx.channel.send(msg)
-            await asyncio.sleep(10)
-            await delete_error(ctx.message, error)
+            bot.reaper.add(10, ctx.message, error)
         elif isinstance(error,WildReportChannelCheckFail):
             guild = ctx.guild
             msg = _('Meowth! Please use **{prefix}{cmd_name}** in ').format(cmd_name=ctx.invoked_with, prefix=prefix)
@@ -463,7 +427,6 @@ def custom_error_handling(bot, logger):
                     else:
                         msg += '\n#deleted-channel'
             error = await ctx.channel.send(msg)
-            await asyncio.sleep(10)
-            await delete_error(ctx.message, error)
+            bot.reaper.add(10, ctx.message, error)
         else:
             logger.exception(type(error).__name__, exc_info=error)
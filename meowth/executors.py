@@ -0,0 +1,78 @@
+import asyncio
+import functools
+import logging
+from concurrent.futures import ThreadPoolExecutor
+
+logger = logging.getLogger("meowth")
+
+class Executors:
+    """The thread pool blocking work runs in, off the event loop.
+
+    It's for work that waits or releases the GIL, like database writes,
+    and for fuzzy matching, which needs the matchers and their caches
+    that live in this process. Created on first use.
+    """
+
+    def __init__(self, threads=4):
+        self.threads = threads
+        self._thread_pool = None
+
+    @property
+    def thread_pool(self):
+        if self._thread_pool is None:
+            self._thread_pool = ThreadPoolExecutor(
+                max_workers=self.threads, thread_name_prefix='meowth')
+        return self._thread_pool
+
+    async def run(self, func, *args, **kwargs):
+        """Runs ``func(*args, **kwargs)`` in the pool and returns its
+        result."""
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(self.thread_pool, functools.partial(func, *args, **kwargs))
+
+    def shutdown(self, wait=True):
+        if self._thread_pool is not None:
+            self._thread_pool.shutdown(wait=wait)
+        self._thread_pool = None
+
+executors = Executors()
+
+class LoopLagMonitor:
+    """Measures how late the event loop wakes up a sleeping task.
+
+    Anything running longer than ``threshold`` seconds without yielding
+    delays the wake up, so those stalls are logged. With the loop in
+    debug mode asyncio also logs the slow callback itself.
+    """
+
+    def __init__(self, loop=None, interval=0.5, threshold=0.25):
+        self.loop = loop or asyncio.get_event_loop()
+        self.interval = interval
+        self.threshold = threshold
+        self.last = 0.0
+        self.worst = 0.0
+        self.stalls = 0
+        self._task = None
+
+    def start(self):
+        if self._task and not self._task.done():
+            return
+        if self.loop.get_debug():
+            self.loop.slow_callback_duration = self.threshold
+        self._task = self.loop.create_task(self._run())
+
+    def stop(self):
+        if self._task:
+            self._task.cancel()
+            self._task = None
+
+    async def _run(self):
+        while True:
+            started = self.loop.time()
+            await asyncio.sleep(self.interval)
+            lag = self.loop.time() - started - self.interval
+            self.last = lag
+            self.worst = max(self.worst, lag)
+            if lag > self.threshold:
+                self.stalls += 1
+                logger.warning(f'Loop Lag - Blocked for {lag * 1000:.0f}ms')
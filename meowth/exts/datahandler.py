@@ -1,8 +1,6 @@
 import json
-from functools import partial
 
 from discord.ext import commands
-from meowth import utils
 from meowth import checks
 
 class DataHandler:
@@ -12,25 +10,18 @@ class DataHandler:
         self.bot = bot
         self.raid_info = bot.raid_info
         self.pkmn_info = bot.pkmn_info
-        self.pkmn_match = partial(utils.get_match, self.pkmn_info['pokemon_list'])
 
     def __local_check(self, ctx):
         return checks.is_owner_check(ctx) or checks.is_dev_check(ctx)
 
+    def pkmn_match(self, pokemon):
+        return self.bot.pokedex.matcher.match(pokemon)
+
     def get_name(self, pkmn_number):
-        pkmn_number = int(pkmn_number) - 1
-        try:
-            name = self.pkmn_info['pokemon_list'][pkmn_number]
-        except IndexError:
-            name = None
-        return name
+        return self.bot.pokedex.get_name(pkmn_number)
 
     def get_number(self, pkm_name):
-        try:
-            number = self.pkmn_info['pokemon_list'].index(pkm_name) + 1
-        except ValueError:
-            number = None
-        return int(number)
+        return self.bot.pokedex.get_number(pkm_name)
 
     @commands.group(invoke_without_command=True)
     async def raiddata(self, ctx, level=None):
@@ -3,22 +3,53 @@ import json
 
 from discord.ext import commands
 
-from meowth import utils
+from meowth.matcher import Matcher
 
 class GymMatching:
     def __init__(self, bot):
         self.bot = bot
-        self.gym_data = self.init_json()
+        self.gym_data = {}
+        self._combined = None
+        self.matchers = {}
 
     def init_json(self):
-        with open(os.path.join('data', 'gym_data.json')) as fd:
-            return json.load(fd)
+        try:
+            with open(os.path.join('data', 'gym_data.json')) as fd:
+                return json.load(fd)
+        except FileNotFoundError:
+            return {}
+
+    def load_gyms(self, guild_id):
+        """Loads a guild's gyms from ``data/gyms/<guild id>.json``,
+        falling back to its entry in ``data/gym_data.json``."""
+        try:
+            with open(os.path.join('data', 'gyms', f'{guild_id}.json')) as fd:
+                return json.load(fd)
+        except FileNotFoundError:
+            pass
+        if self._combined is None:
+            self._combined = self.init_json()
+        return self._combined.get(str(guild_id))
 
     def get_gyms(self, guild_id):
-        return self.gym_data.get(str(guild_id))
+        if guild_id not in self.gym_data:
+            self.gym_data[guild_id] = self.load_gyms(guild_id)
+        return self.gym_data[guild_id]
+
+    def get_matcher(self, guild_id):
+        matcher = self.matchers.get(guild_id)
+        if not matcher:
+            gyms = self.get_gyms(guild_id)
+            if not gyms:
+                return None
+            matcher = self.matchers[guild_id] = Matcher(gyms.keys())
+        return matcher
 
-    def gym_match(self, gym_name, gyms):
-        return utils.get_match(list(gyms.keys()), gym_name)
+    def gym_match(self, gym_name, guild_id):
+        matcher = self.get_matcher(guild_id)
+        if not matcher:
+            return (None, None)
+        return matcher.match(gym_name)
 
     @commands.command(hidden=True)
     async def gym_match_test(self, ctx, gym_name):
@@ -26,7 +57,7 @@ class GymMatching:
         if not gyms:
             await ctx.send('Gym matching has not been set up for this server.')
             return
-        match, score = self.gym_match(gym_name, gyms)
+        match, score = self.gym_match(gym_name, ctx.guild.id)
         if match:
             gym_info = gyms[match]
             coords = gym_info['coordinates']
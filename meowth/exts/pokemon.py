@@ -1,6 +1,5 @@
 from string import ascii_lowercase
 
-import discord
 from discord.ext import commands
 from discord.ext.commands import CommandError
 
@@ -89,35 +88,20 @@ class Pokemon():
         alolan_list = [19, 20, 26, 27, 28, 37, 38, 
             50, 51, 52, 53, 74, 75, 76, 88, 89, 103, 105]
 
-        form_dict = {
-            7: ['sunglasses'],
-            8: ['sunglasses'],
-            9: ['sunglasses'],
-            25:  ['ash', 'party', 'witch', 'santa', 'summer'],
-            26:  ['ash', 'party', 'witch', 'santa', 'summer'],
-            172:  ['ash', 'party', 'witch', 'santa', 'summer'],
-            201: list(ascii_lowercase) + ['!', '?'],
-            327: ['1', '2', '3', '4', '5', '6', '7', '8'],
-            351: ['normal', 'rainy', 'snowy', 'sunny'],
-            386: ['defense', 'normal', 'attack', 'speed']
-        }
-
+        pokedex = bot.pokedex
         if pkmn.isdigit():
-            try:
-                pkmn = self.pkmn_list[int(pkmn)-1]
-            except IndexError:
-                pass
+            pkmn = pokedex.get_name(pkmn) or pkmn
 
         self.name = pkmn
-        if pkmn not in self.pkmn_list:
+        self.id = pokedex.get_number(pkmn)
+        if not self.id:
             raise PokemonNotFound(pkmn)
-        self.id = self.pkmn_list.index(pkmn)+1
         self.types = self._get_type()
         self.pb_raid = None
         self.weather = attribs.get('weather', None)
         self.moveset = attribs.get('moveset', [])
         self.form = attribs.get('form', '')
-        if self.form not in form_dict.get(self.id, []):
+        if self.form not in pokedex.get_forms(self.id):
             self.form = None
         self.shiny = attribs.get('shiny', False)
         if self.id not in shiny_list:
@@ -270,7 +254,7 @@ class Pokemon():
             guild = self.guild
         if not guild:
             return None
-        return discord.utils.get(guild.roles, name=self.name)
+        return self.bot.role_index.get(guild, self.name)
 
     def set_guild(self, guild):
         """:class:`discord.Guild` or :obj:`None` : Sets the relevant Guild"""
@@ -307,13 +291,7 @@ class Pokemon():
         """:class:`dict` : Returns a dict of all Pokemon types and their
         relative effectiveness as values.
         """
-        type_eff = {}
-        for _type in self.types:
-            for atk_type in self.bot.type_chart[_type]:
-                if atk_type not in type_eff:
-                    type_eff[atk_type] = 1
-                type_eff[atk_type] *= self.bot.type_chart[_type][atk_type]
-        return type_eff
+        return self.bot.type_matrix.effects(self.id)
 
     @property
     def type_effects_grouped(self):
@@ -389,15 +367,13 @@ class Pokemon():
         else:
             form = None
         if argument.isdigit():
-            try:
-                match = ctx.bot.pkmn_info['pokemon_list'][int(argument)-1]
-                score = 100
-            except IndexError:
+            match = ctx.bot.pokedex.get_name(argument)
+            score = 100
+            if not match:
                 raise commands.errors.BadArgument(
                     'Pokemon ID "{}" not valid'.format(argument))
         else:
-            pkmn_list = ctx.bot.pkmn_info['pokemon_list']
-            match, score = utils.get_match(pkmn_list, argument)
+            match, score = ctx.bot.pokedex.matcher.match(argument)
         if match:
             if score >= 80:
                 result = cls(ctx.bot, str(match), ctx.guild, shiny=shiny, alolan=alolan, form=form)
@@ -440,13 +416,9 @@ class Pokemon():
         else:
             form = None
         if argument.isdigit():
-            try:
-                match = ctx.bot.pkmn_info['pokemon_list'][int(argument)-1]
-            except IndexError:
-                return None
+            match = ctx.bot.pokedex.get_name(argument)
         else:
-            pkmn_list = ctx.bot.pkmn_info['pokemon_list']
-            match = utils.get_match(pkmn_list, argument)[0]
+            match = ctx.bot.pokedex.matcher.match(argument)[0]
 
         if not match:
             return None
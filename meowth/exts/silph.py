@@ -5,6 +5,7 @@ import aiohttp
 import discord
 from discord.ext import commands
 from meowth import utils
+from meowth.metrics import metrics
 
 class SilphBadge:
 
@@ -253,9 +254,10 @@ class SilphCard:
     @classmethod
     async def get_trainer_card(cls, silph_user):
         url = f'https://sil.ph/{silph_user}.json'
-        async with aiohttp.ClientSession() as sess:
-            async with sess.get(url) as resp:
-                data = await resp.json()
+        with metrics.timed('silph'):
+            async with aiohttp.ClientSession() as sess:
+                async with sess.get(url) as resp:
+                    data = await resp.json()
         if data.get('error', None):
             return None
         return cls(silph_user, data)
@@ -137,17 +137,18 @@ class Trade:
         trade_msg = await ctx.send(
             f"{offer_str}\n\n{instructions}\n\n{cancel_inst}",
             embed=trade_embed)
+        ctx.bot.messages.add(trade_msg)
 
-        for i in range(len(wanted_pokemon)):
-            await trade_msg.add_reaction(f'{i+1}\u20e3')
-        await trade_msg.add_reaction('\u23f9')
+        ctx.bot.reactions.add(
+            trade_msg,
+            [f'{i+1}\u20e3' for i in range(len(wanted_pokemon))] + ['\u23f9'])
 
         trade = cls(
             ctx.bot, ctx.author.id, trade_msg.id, ctx.channel.id, ctx.guild.id,
             wanted_pokemon, offered_pokemon
         )
 
-        ctx.bot.add_listener(trade.on_raw_reaction_add)
+        ctx.bot.reaction_router.register(trade.listing_id, trade.on_raw_reaction_add)
 
         return trade
 
@@ -158,12 +159,12 @@ class Trade:
             data['guild_id'], data['wanted_pokemon'], data['offered_pokemon']
         )
 
-        bot.add_listener(trade.on_raw_reaction_add)
+        bot.reaction_router.register(trade.listing_id, trade.on_raw_reaction_add)
 
         return trade
 
     async def get_listmsg(self):
-        return await self.listing_channel.get_message(self.listing_id)
+        return await self.bot.messages.fetch(self.listing_channel, self.listing_id)
 
     async def offered_pokemon(self):
         listingmsg = await self.get_listmsg()
@@ -235,10 +236,8 @@ class Trade:
         tradermsg = await trader.send(acceptedmsg)
         listermsg = await lister.send(acceptedmsg)
 
-        await tradermsg.add_reaction('\u2611')
-        await tradermsg.add_reaction('\u23f9')
-        await listermsg.add_reaction('\u2611')
-        await listermsg.add_reaction('\u23f9')
+        self.bot.reactions.add(tradermsg, ['\u2611', '\u23f9'])
+        self.bot.reactions.add(listermsg, ['\u2611', '\u23f9'])
 
         for offerid in self.offers.keys():
             if offerid != offer_id:
@@ -317,10 +316,9 @@ class Trade:
             content=f"{offer_str}\n\n{instructions}\n\n{cancel_inst}",
             )
 
-        for i in range(len(wanted_pokemon)):
-            await listingmsg.add_reaction(f'{i+1}\u20e3')
-
-        await listingmsg.add_reaction('\u23f9')
+        self.bot.reactions.add(
+            listingmsg,
+            [f'{i+1}\u20e3' for i in range(len(wanted_pokemon))] + ['\u23f9'])
         del self.offers[offer_id]
 
     async def reject_offer(self, offer_id):
@@ -344,10 +342,9 @@ class Trade:
             content=f"{offer_str}\n\n{instructions}\n\n{cancel_inst}",
             )
 
-        for i in range(len(wanted_pokemon)):
-            await listingmsg.add_reaction(f'{i+1}\u20e3')
-
-        await listingmsg.add_reaction('\u23f9')
+        self.bot.reactions.add(
+            listingmsg,
+            [f'{i+1}\u20e3' for i in range(len(wanted_pokemon))] + ['\u23f9'])
 
         del self.offers[offer_id]
 
@@ -374,9 +371,9 @@ class Trade:
     async def close_trade(self):
         listingmsg = await self.get_listmsg()
         await listingmsg.delete()
-        self.bot.remove_listener(self.on_raw_reaction_add)
+        self.bot.reaction_router.unregister(self.listing_id)
         try:
-            guild_trades = self.bot.guild_dict[self.guild_id]
+            guild_trades = self.bot.guild_dict[self.guild_id]['trade_dict']
             del guild_trades[self.report_channel_id][self.listing_id]
             await listingmsg.delete()
         except (KeyError, discord.HTTPException):
@@ -385,19 +382,29 @@ class Trade:
 class Trading:
     def __init__(self, bot):
         self.bot = bot
-        for guild_id in self.bot.guild_dict:
-            trade_dict = self.bot.guild_dict[guild_id].setdefault('trade_dict', {})
-            for channel_id in trade_dict:
-                trade_channel_data = trade_dict[channel_id]
-                for message_id in trade_channel_data:
-                    Trade.from_data(
-                        self.bot, message_id, trade_channel_data[message_id])
+        # saved listings are restored on their first reaction, so loading
+        # the cog doesn't unpickle every guild before connecting
+        self.bot.reaction_router.add_resolver(self._resolve_trade)
+
+    def __unload(self):
+        self.bot.reaction_router.remove_resolver(self._resolve_trade)
+
+    def _resolve_trade(self, payload):
+        channel = self.bot.get_channel(payload.channel_id)
+        guild = getattr(channel, 'guild', None)
+        if not guild:
+            return None
+        guild_data = self.bot.guild_dict.peek(guild.id, {})
+        data = guild_data.get('trade_dict', {}).get(payload.channel_id, {}).get(payload.message_id)
+        if not data:
+            return None
+        return Trade.from_data(self.bot, payload.message_id, data).on_raw_reaction_add
 
     async def on_message(self, message):
-        ctx = await self.bot.get_context(message)
-        if not ctx.guild:
+        if not message.guild:
             return
-        if checks.check_tradereport(ctx) and message.author != ctx.guild.me:
+        info = self.bot.message_info(message)
+        if info.trade_report and message.author != message.guild.me:
             await asyncio.sleep(1)
             try:
                 await message.delete()
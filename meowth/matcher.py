@@ -0,0 +1,91 @@
+import re
+from collections import Counter
+from functools import lru_cache
+
+try:
+    from rapidfuzz.fuzz import ratio as _ratio
+except ImportError:
+    from fuzzywuzzy.fuzz import ratio as _ratio
+
+_NON_WORD = re.compile(r'(?ui)\W')
+
+def _process(text):
+    """Same cleanup fuzzywuzzy's ``full_process`` applies to both sides."""
+    return _NON_WORD.sub(' ', str(text)).lower().strip()
+
+class Matcher:
+    """Fuzzy matcher over a fixed list of choices.
+
+    Gives the same results as ``utils.get_match`` with the ``ratio``
+    scorer, but bounds each choice by its shared characters first and
+    only scores the most promising ones, stopping once no remaining
+    choice can beat the best score. Build one per corpus and keep it
+    around, recent queries are answered from an LRU.
+    """
+
+    def __init__(self, choices, score_cutoff=60, cache_size=256):
+        self.choices = list(choices)
+        self.score_cutoff = score_cutoff
+        self._processed = [_process(c) for c in self.choices]
+        self._counts = [Counter(p) for p in self._processed]
+        self._exact = {}
+        for i, processed in enumerate(self._processed):
+            self._exact.setdefault(processed, i)
+        self._extract = lru_cache(maxsize=cache_size)(self._extract)
+
+    def __len__(self):
+        return len(self.choices)
+
+    def cache_info(self):
+        return self._extract.cache_info()
+
+    def _bounds(self, query):
+        """Yields ``(bound, index)`` for every choice that could reach the
+        cutoff, where ``bound`` is the best ratio it could possibly score.
+
+        A ratio is ``200 * matches / total length`` and the matching
+        characters can't outnumber the characters both sides share.
+        """
+        q_len = len(query)
+        q_counts = Counter(query).items()
+        cutoff = self.score_cutoff - 0.5
+        for i, counts in enumerate(self._counts):
+            total = q_len + len(self._processed[i])
+            if 200 * min(q_len, total - q_len) < cutoff * total:
+                continue
+            shared = sum(min(n, counts[c]) for c, n in q_counts if c in counts)
+            bound = 200 * shared / total
+            if bound >= cutoff:
+                yield (bound, i)
+
+    def _extract(self, query):
+        query = _process(query)
+        if not query:
+            return (None, None)
+        exact = self._exact.get(query)
+        if exact is not None:
+            return (exact, 100)
+        best, best_score = None, None
+        # most promising first, ties keep list order like extractOne
+        for bound, i in sorted(self._bounds(query), key=lambda x: (-x[0], x[1])):
+            if best is not None and int(round(bound)) < best_score:
+                break
+            if best is not None and int(round(bound)) == best_score and i > best:
+                continue
+            score = int(round(_ratio(query, self._processed[i])))
+            if score < self.score_cutoff:
+                continue
+            if best is None or score > best_score or (score == best_score and i < best):
+                best, best_score = i, score
+        return (best, best_score)
+
+    def match_index(self, query):
+        """Returns a tuple of (INDEX, SCORE) of the best choice."""
+        return self._extract(query)
+
+    def match(self, query):
+        """Returns a tuple of (MATCH, SCORE) like ``utils.get_match``."""
+        index, score = self._extract(query)
+        if index is None:
+            return (None, None)
+        return (self.choices[index], score)
@@ -0,0 +1,58 @@
+from collections import OrderedDict
+
+class MessageCache:
+    """Recently used messages the bot sent, by id.
+
+    The raid, report, wild and trade messages are added when they're
+    sent, and looked up here before asking Discord for them. Editing a
+    cached message through discord.py updates it in place. Messages are
+    dropped when Discord reports them deleted or edited by someone
+    else, and the least recently used ones once there are ``size``.
+    Reaction counts aren't kept current, fetch a fresh copy for those.
+    """
+
+    def __init__(self, size=2048):
+        self.size = size
+        self._messages = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self._messages)
+
+    def __contains__(self, message_id):
+        return message_id in self._messages
+
+    def add(self, message):
+        if message is None:
+            return
+        self._messages[message.id] = message
+        self._messages.move_to_end(message.id)
+        if len(self._messages) > self.size:
+            self._messages.popitem(last=False)
+
+    def get(self, message_id):
+        message = self._messages.get(message_id)
+        if message is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._messages.move_to_end(message_id)
+        return message
+
+    async def fetch(self, channel, message_id):
+        """Returns message ``message_id`` of ``channel``, from the cache
+        or from Discord. Raises like ``channel.get_message``."""
+        message = self.get(message_id)
+        if message is None:
+            message = await channel.get_message(message_id)
+            if message.guild and message.author == message.guild.me:
+                self.add(message)
+        return message
+
+    def remove(self, message_id):
+        self._messages.pop(message_id, None)
+
+    def hit_rate(self):
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
@@ -0,0 +1,248 @@
+import asyncio
+import logging
+import time
+from bisect import bisect_left
+from collections import Counter
+from contextlib import contextmanager
+
+logger = logging.getLogger("meowth")
+
+# upper bounds in seconds, Prometheus style
+BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+_current_task = getattr(asyncio, 'current_task', None) or asyncio.Task.current_task
+
+def _task():
+    try:
+        return _current_task()
+    except RuntimeError:
+        return None
+
+class Histogram:
+    """Counts observations into fixed buckets, with their sum."""
+
+    def __init__(self, buckets=BUCKETS):
+        self.buckets = buckets
+        # the last slot holds everything above the largest bucket
+        self.counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value):
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    @property
+    def mean(self):
+        return self.sum / self.count if self.count else 0.0
+
+    def cumulative(self):
+        """Returns ``(upper_bound, count)`` pairs, ending with ``+Inf``."""
+        total = 0
+        pairs = []
+        for bound, count in zip(self.buckets + (float('inf'),), self.counts):
+            total += count
+            pairs.append((bound, total))
+        return pairs
+
+    def quantile(self, q):
+        """Returns the upper bound of the bucket holding quantile ``q``."""
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        for bound, total in self.cumulative():
+            if total >= rank:
+                return bound
+        return float('inf')
+
+def _labels(labels):
+    if not labels:
+        return ''
+    escaped = []
+    for key, value in labels.items():
+        value = str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+        escaped.append(f'{key}="{value}"')
+    return '{' + ','.join(escaped) + '}'
+
+def _bound(bound):
+    return '+Inf' if bound == float('inf') else repr(bound)
+
+class _RateLimitHandler(logging.Handler):
+    """Counts the rate limit waits discord.py logs."""
+
+    def __init__(self, metrics):
+        super().__init__(logging.WARNING)
+        self.metrics = metrics
+
+    def emit(self, record):
+        if 'rate limit' in record.getMessage().lower():
+            self.metrics.rate_limited()
+
+class Metrics:
+    """Where the bot's time goes.
+
+    Command latency is timed around ``invoke`` and Discord REST calls
+    and rate limit waits are counted against the command whose task
+    made them. Slow outside requests are timed with :meth:`timed`.
+    Anything else, like loop lag or cache hit rates, is read when the
+    metrics are rendered from the callables registered with
+    :meth:`register`.
+    """
+
+    def __init__(self):
+        self.commands = {}
+        self.timings = {}
+        self.routes = Counter()
+        self.command_rest = Counter()
+        self.command_rate_limits = Counter()
+        self.rate_limits = 0
+        self.sources = []
+        self._running = {}
+        self._handler = None
+
+    @contextmanager
+    def command(self, name):
+        """Times the command ``name`` run by the current task."""
+        task = _task()
+        self._running[task] = name
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._running.pop(task, None)
+            self.commands.setdefault(name, Histogram()).observe(time.perf_counter() - start)
+
+    @contextmanager
+    def timed(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.timings.setdefault(name, Histogram()).observe(time.perf_counter() - start)
+
+    def rest_call(self, route):
+        self.routes[f'{route.method} {route.path}'] += 1
+        name = self._running.get(_task())
+        if name:
+            self.command_rest[name] += 1
+
+    def rate_limited(self):
+        self.rate_limits += 1
+        name = self._running.get(_task())
+        if name:
+            self.command_rate_limits[name] += 1
+
+    def instrument(self, http):
+        """Counts the requests made through discord.py's ``http`` client
+        and the rate limits it runs into."""
+        request = http.request
+        async def counted_request(route, **kwargs):
+            self.rest_call(route)
+            return await request(route, **kwargs)
+        http.request = counted_request
+        if self._handler is None:
+            self._handler = _RateLimitHandler(self)
+            logging.getLogger('discord.http').addHandler(self._handler)
+
+    def register(self, name, description, func, label=None, kind='gauge'):
+        """Registers ``func`` as the source of metric ``name``, a gauge or
+        a counter kept elsewhere. It returns a number, or with ``label``
+        set a dict of label values to numbers."""
+        self.sources.append((name, description, func, label, kind))
+
+    def read(self):
+        """Yields ``(name, description, kind, samples)`` for the
+        registered metrics, ``samples`` being ``(labels, value)`` pairs."""
+        for name, description, func, label, kind in self.sources:
+            try:
+                value = func()
+            except Exception:
+                logger.exception(f'Metrics - {name} failed')
+                continue
+            if label:
+                samples = [({label: key}, v) for key, v in value.items()]
+            else:
+                samples = [({}, value)]
+            yield (name, description, kind, samples)
+
+    def render(self):
+        """Returns the metrics in the Prometheus text format."""
+        lines = []
+        def header(name, description, kind):
+            lines.append(f'# HELP meowth_{name} {description}')
+            lines.append(f'# TYPE meowth_{name} {kind}')
+        def histograms(name, description, label, histograms):
+            header(name, description, 'histogram')
+            for key, histogram in sorted(histograms.items()):
+                for bound, count in histogram.cumulative():
+                    lines.append(f'meowth_{name}_bucket{_labels({label: key, "le": _bound(bound)})} {count}')
+                lines.append(f'meowth_{name}_sum{_labels({label: key})} {histogram.sum}')
+                lines.append(f'meowth_{name}_count{_labels({label: key})} {histogram.count}')
+        def counter(name, description, label, counts):
+            header(name, description, 'counter')
+            for key, count in sorted(counts.items()):
+                lines.append(f'meowth_{name}{_labels({label: key})} {count}')
+        histograms('command_seconds', 'Time taken by commands.', 'command', self.commands)
+        counter('command_rest_calls_total', 'Discord REST calls made by commands.',
+                'command', self.command_rest)
+        counter('command_rate_limits_total', 'Rate limit waits hit by commands.',
+                'command', self.command_rate_limits)
+        counter('rest_calls_total', 'Discord REST calls by route.', 'route', self.routes)
+        header('rate_limits_total', 'Rate limit waits.', 'counter')
+        lines.append(f'meowth_rate_limits_total {self.rate_limits}')
+        histograms('request_seconds', 'Time taken by outside requests.', 'name', self.timings)
+        for name, description, kind, samples in self.read():
+            header(name, description, kind)
+            for labels, value in samples:
+                lines.append(f'meowth_{name}{_labels(labels)} {value}')
+        return '\n'.join(lines) + '\n'
+
+metrics = Metrics()
+
+class MetricsServer:
+    """Serves :meth:`Metrics.render` over HTTP at ``/metrics``.
+
+    It's meant for a Prometheus scraper on the same host, so it only
+    understands plain GET requests and binds to localhost by default.
+    """
+
+    def __init__(self, metrics, host='127.0.0.1', port=9100):
+        self.metrics = metrics
+        self.host = host
+        self.port = port
+        self._server = None
+
+    async def start(self):
+        if self._server:
+            return
+        self._server = await asyncio.start_server(self._handle, self.host, self.port)
+        logger.info(f'Metrics - Serving on {self.host}:{self.port}')
+
+    async def _handle(self, reader, writer):
+        try:
+            request = await reader.readline()
+            # skip the headers
+            while (await reader.readline()).strip():
+                pass
+            parts = request.decode('latin-1').split()
+            if len(parts) >= 2 and parts[0] == 'GET' and parts[1].split('?')[0] == '/metrics':
+                status, body = '200 OK', self.metrics.render()
+            else:
+                status, body = '404 Not Found', 'Not Found\n'
+            body = body.encode('utf-8')
+            writer.write(
+                f'HTTP/1.0 {status}\r\n'
+                'Content-Type: text/plain; version=0.0.4; charset=utf-8\r\n'
+                f'Content-Length: {len(body)}\r\n\r\n'.encode('latin-1') + body)
+            await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    async def close(self):
+        if self._server:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
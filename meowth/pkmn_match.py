@@ -1,17 +1,15 @@
-from fuzzywuzzy import fuzz
-from fuzzywuzzy import process
+from meowth.matcher import Matcher
 
-WORDS = None
+MATCHER = None
 
 def set_list(word_list):
-    global WORDS
-    WORDS = word_list
+    global MATCHER
+    MATCHER = Matcher(word_list)
+
+def set_matcher(matcher):
+    global MATCHER
+    MATCHER = matcher
 
 def get_pkmn(word):
-    result = process.extractOne(word, WORDS, scorer=fuzz.ratio, score_cutoff = 60)
-    if result is None:
-        index = None
-    else:
-        pkmn = result[0]
-        index = WORDS.index(pkmn)
+    index, score = MATCHER.match_index(word)
     return(index)
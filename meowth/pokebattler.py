@@ -0,0 +1,148 @@
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import time
+
+import aiohttp
+
+from meowth.metrics import metrics
+
+logger = logging.getLogger("meowth")
+
+DEFAULT_BASE_URL = 'https://fight.pokebattler.com'
+
+class PokebattlerClient:
+    """Fetches raid simulations from Pokebattler.
+
+    Requests go through one pooled session kept open for the lifetime
+    of the bot. Results are cached in memory for ``ttl`` seconds, and in
+    ``cache_dir`` when set so they survive restarts. Concurrent requests
+    for the same raid share a single in-flight fetch.
+    """
+
+    def __init__(self, loop=None, base_url=DEFAULT_BASE_URL, ttl=3600,
+                 cache_dir=None, max_connections=10):
+        self.loop = loop or asyncio.get_event_loop()
+        self.base_url = base_url.rstrip('/')
+        self.ttl = ttl
+        self.cache_dir = cache_dir
+        self.max_connections = max_connections
+        self._session = None
+        self._cache = {}
+        self._pending = {}
+        self.hits = 0
+        self.misses = 0
+        if cache_dir:
+            os.makedirs(cache_dir, exist_ok=True)
+
+    @classmethod
+    def from_config(cls, config, loop=None):
+        return cls(
+            loop=loop,
+            base_url=config.get('pokebattler_url', DEFAULT_BASE_URL),
+            ttl=config.get('pokebattler_cache_ttl', 3600),
+            cache_dir=config.get('pokebattler_cache_dir'))
+
+    @property
+    def session(self):
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.max_connections, keepalive_timeout=60)
+            self._session = aiohttp.ClientSession(connector=connector)
+        return self._session
+
+    def raid_path(self, pkmn, level, weather, user=None):
+        """Returns the simulation path for ``pkmn`` at raid ``level``
+        in ``weather``, using ``user``'s Pokebox if given."""
+        path = "/raids/defenders/{pkmn}/levels/RAID_LEVEL_{level}/attackers/".format(
+            pkmn=pkmn.replace('-','_').upper(), level=level)
+        if user:
+            path += "users/{user}/".format(user=user)
+        else:
+            path += "levels/30/"
+        path += "strategies/CINEMATIC_ATTACK_WHEN_POSSIBLE/DEFENSE_RANDOM_MC?sort=OVERALL&"
+        path += "weatherCondition={weather}&dodgeStrategy=DODGE_REACTION_TIME&aggregation=AVERAGE".format(weather=weather)
+        return path
+
+    def raid_url(self, pkmn, level, weather, user=None):
+        return self.base_url + self.raid_path(pkmn, level, weather, user)
+
+    async def get_raid(self, pkmn, level, weather, user=None):
+        """Returns the decoded simulation for the given raid."""
+        key = (pkmn, str(level), weather, str(user) if user else None)
+        cached = self._cache.get(key)
+        if cached and cached[0] > time.time():
+            self.hits += 1
+            return cached[1]
+        task = self._pending.get(key)
+        if task:
+            self.hits += 1
+        else:
+            self.misses += 1
+            task = self.loop.create_task(self._load(key, self.raid_path(pkmn, level, weather, user)))
+            self._pending[key] = task
+            task.add_done_callback(lambda t: self._pending.pop(key, None))
+        return await asyncio.shield(task)
+
+    async def _load(self, key, path):
+        fetched, data = None, None
+        if self.cache_dir:
+            fetched, data = await self.loop.run_in_executor(None, self._read_disk, path)
+        if data is None:
+            with metrics.timed('pokebattler'):
+                async with self.session.get(self.base_url + path) as resp:
+                    resp.raise_for_status()
+                    data = await resp.json()
+            fetched = time.time()
+            if self.cache_dir:
+                await self.loop.run_in_executor(None, self._write_disk, path, data)
+        self._cache[key] = (fetched + self.ttl, data)
+        self._prune()
+        return data
+
+    def _prune(self):
+        now = time.time()
+        for key in [k for k, (exp, __) in self._cache.items() if exp <= now]:
+            del self._cache[key]
+
+    def _disk_path(self, path):
+        digest = hashlib.sha1(path.encode('utf-8')).hexdigest()
+        return os.path.join(self.cache_dir, f'{digest}.json')
+
+    def _read_disk(self, path):
+        """Returns ``(fetched_at, data)`` from the disk cache, with ``data``
+        being ``None`` when missing or expired."""
+        disk_path = self._disk_path(path)
+        try:
+            fetched = os.path.getmtime(disk_path)
+            if fetched + self.ttl <= time.time():
+                return (None, None)
+            with open(disk_path, 'r') as fd:
+                return (fetched, json.load(fd))
+        except (OSError, ValueError):
+            return (None, None)
+
+    def _write_disk(self, path, data):
+        disk_path = self._disk_path(path)
+        tmp_path = None
+        try:
+            # a temp file of its own, as workers share the cache directory
+            with tempfile.NamedTemporaryFile(
+                    'w', dir=self.cache_dir, suffix='.tmp', delete=False) as fd:
+                tmp_path = fd.name
+                json.dump(data, fd)
+            os.replace(tmp_path, disk_path)
+        except OSError:
+            logger.exception(f'Pokebattler - Cache Write Failed - {path}')
+            if tmp_path:
+                try:
+                    os.remove(tmp_path)
+                except OSError:
+                    pass
+
+    async def close(self):
+        if self._session and not self._session.closed:
+            await self._session.close()
@@ -0,0 +1,97 @@
+import re
+from string import ascii_lowercase
+
+from meowth.matcher import Matcher
+
+_NON_ALNUM = re.compile('[^a-zA-Z0-9]')
+
+# Alternative spellings that normalising alone can't resolve
+ALIASES = {
+    'nidoranf': 'nidoran♀',
+    'nidoranfemale': 'nidoran♀',
+    'nidoranm': 'nidoran♂',
+    'nidoranmale': 'nidoran♂',
+}
+
+FORM_DICT = {
+    7: ['sunglasses'],
+    8: ['sunglasses'],
+    9: ['sunglasses'],
+    25:  ['ash', 'party', 'witch', 'santa', 'summer'],
+    26:  ['ash', 'party', 'witch', 'santa', 'summer'],
+    172:  ['ash', 'party', 'witch', 'santa', 'summer'],
+    201: list(ascii_lowercase) + ['!', '?'],
+    327: ['1', '2', '3', '4', '5', '6', '7', '8'],
+    351: ['normal', 'rainy', 'snowy', 'sunny'],
+    386: ['defense', 'normal', 'attack', 'speed']
+}
+
+def normalize(name):
+    """Strips a Pokemon name down to lowercase alphanumerics."""
+    return _NON_ALNUM.sub('', str(name).lower())
+
+class Pokedex:
+    """Lookup tables for the configured Pokemon list.
+
+    Built once when the Pokemon list is loaded so name and number
+    lookups don't need to scan or regex the whole list each time.
+    """
+
+    def __init__(self, pokemon_list, aliases=ALIASES, forms=FORM_DICT):
+        self.names = list(pokemon_list)
+        self._numbers = {}
+        self._normalized = {}
+        for number, name in enumerate(self.names, 1):
+            self._numbers.setdefault(name, number)
+            # the first of two names normalising the same way wins,
+            # matching the order of the list
+            self._normalized.setdefault(normalize(name), name)
+        self._search_list = [(normalize(name), name) for name in self.names]
+        self.aliases = {
+            alias: name for alias, name in aliases.items()
+            if name in self._numbers}
+        self.forms = forms
+        self.matcher = Matcher(self.names)
+
+    def __contains__(self, name):
+        return name in self._numbers
+
+    def __len__(self):
+        return len(self.names)
+
+    def __iter__(self):
+        return iter(self.names)
+
+    def get_number(self, name):
+        """Returns the dex number of the exact ``name`` or ``None``."""
+        return self._numbers.get(name)
+
+    def get_name(self, number):
+        """Returns the name for dex ``number`` or ``None``."""
+        try:
+            number = int(number)
+        except (TypeError, ValueError):
+            return None
+        if 0 < number <= len(self.names):
+            return self.names[number - 1]
+        return None
+
+    def match(self, entered):
+        """Returns the Pokemon name equal to ``entered`` once both are
+        normalised, or ``None``."""
+        if entered is None:
+            return None
+        key = normalize(entered)
+        name = self._normalized.get(key)
+        if name is None:
+            name = self.aliases.get(key)
+        return name
+
+    def search(self, text):
+        """Returns the first Pokemon whose normalised name appears
+        anywhere in ``text``, or ``None``."""
+        text = normalize(text)
+        return next((name for key, name in self._search_list if key in text), None)
+
+    def get_forms(self, number):
+        return self.forms.get(number, [])
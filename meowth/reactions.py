@@ -0,0 +1,127 @@
+import asyncio
+import logging
+from collections import deque
+
+import discord
+
+logger = logging.getLogger("meowth")
+
+class ReactionScheduler:
+    """Adds reactions and pins to messages in the background.
+
+    Work is queued per channel, as Discord rate limits reactions per
+    channel, and each channel's queue is drained in order by its own
+    task. There are no fixed sleeps between requests, discord.py's HTTP
+    client already waits on the rate limit bucket headers and retries
+    429s, so channels are decorated as fast as Discord allows while
+    other channels proceed concurrently.
+    """
+
+    def __init__(self, loop=None):
+        self.loop = loop or asyncio.get_event_loop()
+        self._queues = {}
+        self._workers = {}
+        self.completed = 0
+        self.failed = 0
+
+    def __len__(self):
+        return sum(len(queue) for queue in self._queues.values())
+
+    def add(self, message, reactions=(), *, pin=False):
+        """Queues ``reactions`` for ``message``, and pins it first if
+        ``pin`` is set.
+
+        Returns a future that's done once the message is decorated, it
+        only needs awaiting when something depends on the reactions.
+        """
+        done = self.loop.create_future()
+        channel_id = message.channel.id
+        queue = self._queues.setdefault(channel_id, deque())
+        queue.append((message, list(reactions), pin, done))
+        if channel_id not in self._workers:
+            self._workers[channel_id] = self.loop.create_task(self._drain(channel_id))
+        return done
+
+    async def _drain(self, channel_id):
+        queue = self._queues[channel_id]
+        try:
+            while queue:
+                message, reactions, pin, done = queue.popleft()
+                try:
+                    if pin:
+                        await message.pin()
+                    for reaction in reactions:
+                        await message.add_reaction(reaction)
+                    self.completed += 1
+                except (discord.errors.NotFound, discord.errors.Forbidden, discord.errors.HTTPException) as e:
+                    self.failed += 1
+                    logger.info(f'Reactions - Failed - {channel_id} - {type(e).__name__}: {e}')
+                except Exception:
+                    # keep draining, the rest of the queue isn't affected
+                    self.failed += 1
+                    logger.exception(f'Reactions - Failed - {channel_id}')
+                finally:
+                    if not done.done():
+                        done.set_result(None)
+        finally:
+            # only left over if the worker was cancelled
+            if queue:
+                logger.info(f'Reactions - Dropped {len(queue)} queued messages - {channel_id}')
+            for __, __, __, done in queue:
+                if not done.done():
+                    done.set_result(None)
+            del self._queues[channel_id]
+            del self._workers[channel_id]
+
+class ReactionRouter:
+    """Routes raw reaction events to the handler of the reacted message.
+
+    Handlers are coroutine functions taking the raw payload, registered
+    by message id. Resolvers cover messages whose ids already live in
+    another index, they take the payload and return a handler or
+    ``None`` using only cached lookups. Reactions to any other message
+    are dropped without a request to Discord.
+    """
+
+    def __init__(self):
+        self._handlers = {}
+        self._resolvers = []
+        self.routed = 0
+        self.ignored = 0
+
+    def __len__(self):
+        return len(self._handlers)
+
+    def register(self, message_id, handler):
+        self._handlers[message_id] = handler
+
+    def unregister(self, message_id):
+        self._handlers.pop(message_id, None)
+
+    def add_resolver(self, resolver):
+        self._resolvers.append(resolver)
+
+    def remove_resolver(self, resolver):
+        if resolver in self._resolvers:
+            self._resolvers.remove(resolver)
+
+    def get(self, payload):
+        """Returns the handler for the message of ``payload`` or ``None``."""
+        handler = self._handlers.get(payload.message_id)
+        if handler is None:
+            for resolver in self._resolvers:
+                handler = resolver(payload)
+                if handler is not None:
+                    break
+        return handler
+
+    async def dispatch(self, payload):
+        """Runs the handler for ``payload``, returning whether there was
+        one."""
+        handler = self.get(payload)
+        if handler is None:
+            self.ignored += 1
+            return False
+        self.routed += 1
+        await handler(payload)
+        return True
@@ -0,0 +1,179 @@
+import logging
+import time
+
+import discord
+
+logger = logging.getLogger("meowth")
+
+class MessageReaper:
+    """Deletes short lived messages once their time is up.
+
+    Messages are grouped by channel and each channel has one deadline
+    on the bot's :class:`DeadlineScheduler`, when it comes up everything
+    due in the channel is removed with bulk deletes. Pending deletions
+    in guild channels are saved with the guild store, so they still
+    happen after a restart.
+    """
+
+    # deletions due this close together go out in the same request
+    SLACK = 2
+    # most messages Discord deletes in one request
+    BULK_LIMIT = 100
+
+    def __init__(self, bot, store, scheduler):
+        self.bot = bot
+        self.scheduler = scheduler
+        self._conn = store._conn
+        self._conn.execute(
+            'CREATE TABLE IF NOT EXISTS pending_deletions ('
+            'message_id INTEGER PRIMARY KEY, channel_id INTEGER NOT NULL, '
+            'guild_id INTEGER NOT NULL, due REAL NOT NULL)')
+        self._conn.commit()
+        self._pending = {}
+        self._messages = {}
+        self._dirty = {}
+        self._deleted = set()
+        self.reaped = 0
+        self.requests = 0
+
+    def __len__(self):
+        return sum(len(due) for due in self._pending.values())
+
+    def load(self, keep=None):
+        """Reads the saved deletions, or those of the guilds
+        ``keep(guild_id)`` is true for. Returns the number loaded."""
+        count = 0
+        for message_id, channel_id, guild_id, due in self._conn.execute(
+                'SELECT message_id, channel_id, guild_id, due FROM pending_deletions'):
+            if keep and not keep(guild_id):
+                continue
+            self._queue(channel_id, message_id, due)
+            count += 1
+        return count
+
+    def add(self, ttl, *messages):
+        """Deletes ``messages`` in ``ttl`` seconds. ``None`` entries are
+        skipped, so optional replies can be passed as they are."""
+        due = time.time() + ttl
+        for message in messages:
+            if message is None:
+                continue
+            channel = message.channel
+            self._messages[message.id] = message
+            self._queue(channel.id, message.id, due)
+            if isinstance(channel, discord.abc.GuildChannel):
+                self._dirty[message.id] = (channel.id, channel.guild.id)
+                self._deleted.discard(message.id)
+
+    def _queue(self, channel_id, message_id, due):
+        self._pending.setdefault(channel_id, {})[message_id] = due
+        key = ('reap', channel_id)
+        current = self.scheduler.when(key)
+        if current is None or due < current:
+            self.scheduler.schedule(key, due, self._reap, channel_id)
+
+    def _forget(self, message_ids):
+        for message_id in message_ids:
+            self._messages.pop(message_id, None)
+            self._dirty.pop(message_id, None)
+            self._deleted.add(message_id)
+
+    async def _reap(self, channel_id):
+        pending = self._pending.get(channel_id, {})
+        cutoff = time.time() + self.SLACK
+        due = [message_id for message_id, when in pending.items() if when <= cutoff]
+        for message_id in due:
+            del pending[message_id]
+        if pending:
+            self.scheduler.schedule(
+                ('reap', channel_id), min(pending.values()), self._reap, channel_id)
+        else:
+            self._pending.pop(channel_id, None)
+        if not due:
+            return
+        channel = self.bot.get_channel(channel_id)
+        try:
+            if isinstance(channel, discord.TextChannel):
+                await self._delete_bulk(channel, due)
+            else:
+                await self._delete_each(due)
+        finally:
+            self._forget(due)
+
+    async def _delete_bulk(self, channel, message_ids):
+        for i in range(0, len(message_ids), self.BULK_LIMIT):
+            chunk = message_ids[i:i + self.BULK_LIMIT]
+            try:
+                self.requests += 1
+                await channel.delete_messages([discord.Object(id=m) for m in chunk])
+                self.reaped += len(chunk)
+            except discord.errors.Forbidden:
+                # without Manage Messages only the bot's own go one by one
+                for message_id in chunk:
+                    try:
+                        self.requests += 1
+                        await channel.delete_messages([discord.Object(id=message_id)])
+                        self.reaped += 1
+                    except discord.errors.HTTPException:
+                        pass
+            except discord.errors.HTTPException:
+                # a message in the chunk was already gone
+                await self._delete_each(chunk, channel)
+
+    async def _delete_each(self, message_ids, channel=None):
+        for message_id in message_ids:
+            message = self._messages.get(message_id)
+            try:
+                self.requests += 1
+                if message:
+                    await message.delete()
+                elif channel:
+                    await channel.delete_messages([discord.Object(id=message_id)])
+                else:
+                    continue
+                self.reaped += 1
+            except discord.errors.HTTPException:
+                pass
+
+    def snapshot(self):
+        """Takes the changed pending deletions, on the event loop that
+        changes them. Returns the ``(rows, deleted)`` for :meth:`write`."""
+        dirty, deleted = self._dirty, self._deleted
+        self._dirty, self._deleted = {}, set()
+        rows = []
+        for message_id, (channel_id, guild_id) in dirty.items():
+            due = self._pending.get(channel_id, {}).get(message_id)
+            if due is not None:
+                rows.append((message_id, channel_id, guild_id, due))
+        return (rows, deleted)
+
+    def write(self, snapshot):
+        """Writes a :meth:`snapshot`, returning the number of rows written
+        or removed."""
+        rows, deleted = snapshot
+        with self._conn:
+            self._conn.executemany(
+                'INSERT OR REPLACE INTO pending_deletions '
+                '(message_id, channel_id, guild_id, due) VALUES (?, ?, ?, ?)', rows)
+            self._conn.executemany(
+                'DELETE FROM pending_deletions WHERE message_id = ?',
+                [(m,) for m in deleted])
+        return len(rows) + len(deleted)
+
+    def restore(self, snapshot):
+        rows, deleted = snapshot
+        for message_id, channel_id, guild_id, __ in rows:
+            self._dirty.setdefault(message_id, (channel_id, guild_id))
+        self._deleted.update(deleted)
+
+    def save(self):
+        """Writes the changed pending deletions.
+
+        Returns the number of rows written or removed.
+        """
+        snapshot = self.snapshot()
+        try:
+            return self.write(snapshot)
+        except Exception:
+            self.restore(snapshot)
+            raise
@@ -0,0 +1,87 @@
+from collections import Counter
+
+class RoleIndex:
+    """Per-guild lookup of roles by name, with member counts.
+
+    Guilds are indexed the first time they're looked up and kept current
+    by the role and member events, so mention lookups don't scan the
+    role list and counting a role's members doesn't scan every member.
+    """
+
+    def __init__(self):
+        self._names = {}
+        self._counts = {}
+
+    def _names_for(self, guild):
+        names = self._names.get(guild.id)
+        if names is None:
+            names = {}
+            # same pick as discord.utils.get when names clash
+            for role in guild.roles:
+                names.setdefault(role.name, role)
+            self._names[guild.id] = names
+        return names
+
+    def _counts_for(self, guild):
+        counts = self._counts.get(guild.id)
+        if counts is None:
+            counts = Counter()
+            for member in guild.members:
+                counts.update(role.id for role in member.roles)
+            self._counts[guild.id] = counts
+        return counts
+
+    def get(self, guild, name):
+        """Returns the role of ``guild`` called ``name`` or ``None``."""
+        return self._names_for(guild).get(name)
+
+    def member_count(self, guild, role):
+        return self._counts_for(guild)[role.id]
+
+    def empty_roles(self, guild):
+        """Returns the roles of ``guild`` nobody has, going by the counts.
+
+        The counts miss members that aren't cached yet and events lost
+        while a shard reconnects, so check ``role.members`` again before
+        doing anything that can't be undone.
+        """
+        counts = self._counts_for(guild)
+        return [role for role in guild.roles if not counts[role.id]]
+
+    def roles_changed(self, guild):
+        """Drops the name lookup of a guild after any role change."""
+        self._names.pop(guild.id, None)
+
+    def role_deleted(self, role):
+        self.roles_changed(role.guild)
+        counts = self._counts.get(role.guild.id)
+        if counts is not None:
+            counts.pop(role.id, None)
+
+    def member_roles_changed(self, member, added=(), removed=()):
+        counts = self._counts.get(member.guild.id)
+        if counts is None:
+            return
+        counts.update(role.id for role in added)
+        counts.subtract(role.id for role in removed)
+
+    def member_updated(self, before, after):
+        if before.roles != after.roles:
+            before_roles, after_roles = set(before.roles), set(after.roles)
+            self.member_roles_changed(
+                after, added=after_roles - before_roles,
+                removed=before_roles - after_roles)
+
+    def member_joined(self, member):
+        self.member_roles_changed(member, added=member.roles)
+
+    def member_removed(self, member):
+        self.member_roles_changed(member, removed=member.roles)
+
+    def forget(self, guild_id):
+        self._names.pop(guild_id, None)
+        self._counts.pop(guild_id, None)
+
+    def clear(self):
+        self._names.clear()
+        self._counts.clear()
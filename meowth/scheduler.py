@@ -0,0 +1,117 @@
+import asyncio
+import heapq
+import itertools
+import logging
+import time
+
+logger = logging.getLogger("meowth")
+
+class DeadlineScheduler:
+    """Runs callbacks at wall-clock deadlines from a single sleeping task.
+
+    Entries are keyed so rescheduling a key replaces its previous
+    deadline. Replaced and cancelled entries are left in the heap and
+    skipped when they surface, keeping both operations O(log n).
+    """
+
+    def __init__(self, loop=None):
+        self.loop = loop or asyncio.get_event_loop()
+        self._heap = []
+        self._entries = {}
+        self._counter = itertools.count()
+        self._wakeup = asyncio.Event()
+        self._task = None
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def __len__(self):
+        return len(self._entries)
+
+    def when(self, key):
+        """Returns the deadline timestamp of ``key`` or ``None``."""
+        entry = self._entries.get(key)
+        return entry[0] if entry else None
+
+    def schedule(self, key, deadline, callback, *args):
+        """Schedules ``callback(*args)`` to be awaited at ``deadline``.
+
+        ``deadline`` is a :func:`time.time` timestamp. Any existing
+        deadline for ``key`` is replaced.
+        """
+        seq = next(self._counter)
+        self._entries[key] = (deadline, seq, callback, args)
+        heapq.heappush(self._heap, (deadline, seq, key))
+        if self._heap[0][1] == seq:
+            self._wakeup.set()
+        if len(self._heap) > 64 and len(self._heap) > 2 * len(self._entries):
+            self._compact()
+
+    def cancel(self, key):
+        return self._entries.pop(key, None) is not None
+
+    def start(self):
+        if not self._task or self._task.done():
+            self._task = self.loop.create_task(self._run())
+
+    def stop(self):
+        if self._task:
+            self._task.cancel()
+
+    def _compact(self):
+        self._heap = [(d, s, k) for k, (d, s, __, __) in self._entries.items()]
+        heapq.heapify(self._heap)
+
+    async def _fire(self, key, callback, args):
+        try:
+            await callback(*args)
+        except Exception:
+            logger.exception(f'Scheduler - Callback Failed - {key}')
+
+    async def _run(self):
+        while True:
+            self._wakeup.clear()
+            now = time.time()
+            while self._heap and self._heap[0][0] <= now:
+                __, seq, key = heapq.heappop(self._heap)
+                entry = self._entries.get(key)
+                if not entry or entry[1] != seq:
+                    continue
+                del self._entries[key]
+                self.loop.create_task(self._fire(key, entry[2], entry[3]))
+            timeout = self._heap[0][0] - now if self._heap else None
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+
+class ExpiryIndex:
+    """Min-heap of ``(exp, key)`` pairs for periodic expiry passes.
+
+    The index only narrows down candidates, callers are expected to
+    re-check the expiry of whatever ``key`` refers to, since reports may
+    have been removed or extended after they were added.
+    """
+
+    def __init__(self):
+        self._heap = []
+        self._counter = itertools.count()
+        self.built = False
+
+    def __len__(self):
+        return len(self._heap)
+
+    def add(self, exp, key):
+        heapq.heappush(self._heap, (exp, next(self._counter), key))
+
+    def pop_due(self, now=None):
+        """Removes and returns the keys of every entry due by ``now``."""
+        now = time.time() if now is None else now
+        due = []
+        while self._heap and self._heap[0][0] <= now:
+            due.append(heapq.heappop(self._heap)[2])
+        return due
+
+    def clear(self):
+        self._heap = []
+        self.built = False
@@ -1,3 +1,5 @@
+import copy
+
 class GuildConfig:
     def __init__(self, data):
         self._data = data
@@ -11,8 +13,106 @@ class GuildConfig:
         return self._data['prefix']
 
 class RaidData:
+    """Raid channel data with running RSVP totals.
+
+    The totals are built from the channel's trainer dict the first time
+    they're needed and kept current by :meth:`set_trainer`, so RSVPs
+    don't rescan every trainer. They're rebuilt whenever the trainer
+    dict is replaced; call :meth:`invalidate` after changing entries in
+    place without going through :meth:`set_trainer`.
+    """
+
+    statuses = ('maybe', 'coming', 'here', 'lobby')
+    teams = ('mystic', 'valor', 'instinct', 'unknown')
+
     def __init__(self, data):
         self._data = data
+        self._built_from = None
+        self._totals = None
+
+    @property
+    def data(self):
+        return self._data
+
+    @property
+    def trainers(self):
+        return self._data['trainer_dict']
+
+    def invalidate(self):
+        self._built_from = None
+
+    @property
+    def totals(self):
+        """Running totals, rebuilt if the trainer dict was replaced.
+
+        ``status``, ``team`` and ``boss`` hold trainer counts. ``team_status``
+        and ``boss_status`` split them by each trainer's main status and
+        ``by_status`` holds the ids of trainers with each status set.
+        """
+        trainers = self.trainers
+        if self._built_from is not trainers:
+            totals = {
+                'status': dict.fromkeys(self.statuses, 0),
+                'team': dict.fromkeys(self.teams, 0),
+                'team_status': {t: dict.fromkeys(self.statuses, 0) for t in self.teams},
+                'boss': {},
+                'boss_status': {},
+                'by_status': {s: {} for s in self.statuses},
+            }
+            for trainer_id, trainer in trainers.items():
+                self._apply(totals, trainer_id, trainer, 1)
+            self._totals = totals
+            self._built_from = trainers
+        return self._totals
+
+    def _apply(self, totals, trainer_id, trainer, sign):
+        status = trainer.get('status', {})
+        party = trainer.get('party', {})
+        count = int(trainer.get('count', 1))
+        # lists count a trainer under the status with the most trainers
+        main_status = max(status, key=lambda key: status[key]) if status else None
+        for key in self.statuses:
+            if status.get(key):
+                totals['status'][key] += sign * count
+                if sign > 0:
+                    totals['by_status'][key][trainer_id] = None
+                else:
+                    totals['by_status'][key].pop(trainer_id, None)
+        for team in self.teams:
+            team_count = int(party.get(team, 0))
+            totals['team'][team] += sign * team_count
+            if main_status:
+                totals['team_status'][team][main_status] += sign * team_count
+        for boss in trainer.get('interest', ['unspecified']):
+            totals['boss'][boss] = totals['boss'].get(boss, 0) + sign * count
+            boss_status = totals['boss_status'].setdefault(boss, dict.fromkeys(self.statuses, 0))
+            if main_status:
+                boss_status[main_status] += sign * count
+
+    def set_trainer(self, trainer_id, **fields):
+        """Updates a trainer's RSVP fields, adding them if needed."""
+        totals = self.totals
+        trainer = self.trainers.get(trainer_id)
+        if trainer is None:
+            trainer = self.trainers[trainer_id] = {}
+        else:
+            self._apply(totals, trainer_id, trainer, -1)
+        trainer.update(fields)
+        self._apply(totals, trainer_id, trainer, 1)
+        return trainer
+
+    def with_status(self, status):
+        """Returns the ids of trainers with ``status`` set."""
+        return list(self.totals['by_status'][status])
+
+    def totals_without(self, trainer_ids):
+        """Returns a copy of the totals leaving out ``trainer_ids``."""
+        totals = copy.deepcopy(self.totals)
+        for trainer_id in trainer_ids:
+            trainer = self.trainers.get(trainer_id)
+            if trainer:
+                self._apply(totals, trainer_id, trainer, -1)
+        return totals
 
 class WildData:
     def __init__(self, data):
@@ -0,0 +1,418 @@
+import os
+import pickle
+import sqlite3
+import logging
+import time
+
+from meowth.scheduler import ExpiryIndex
+
+logger = logging.getLogger("meowth")
+
+class _Packed:
+    """A guild record that hasn't been unpickled yet."""
+
+    __slots__ = ('data',)
+
+    def __init__(self, data):
+        self.data = data
+
+class GuildDict(dict):
+    """Guild save data that keeps track of which guilds need saving.
+
+    Any guild whose data is looked up through item access, ``get`` or
+    ``setdefault`` is assumed to have been changed and is marked dirty,
+    as the nested dicts handed out are mutated in place all over the bot.
+    Use :meth:`peek` for read-only lookups that shouldn't trigger a write.
+
+    Records loaded lazily from the store are unpickled the first time
+    they're looked up.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._dirty = set(self.keys())
+        self._deleted = set()
+        self.packed = 0
+
+    def _unpack(self, guild_id, value):
+        if isinstance(value, _Packed):
+            value = pickle.loads(value.data)
+            super().__setitem__(guild_id, value)
+            self.packed -= 1
+        return value
+
+    def __getitem__(self, guild_id):
+        value = self._unpack(guild_id, super().__getitem__(guild_id))
+        self._dirty.add(guild_id)
+        return value
+
+    def __setitem__(self, guild_id, value):
+        super().__setitem__(guild_id, value)
+        self._dirty.add(guild_id)
+        self._deleted.discard(guild_id)
+
+    def __delitem__(self, guild_id):
+        if isinstance(super().__getitem__(guild_id), _Packed):
+            self.packed -= 1
+        super().__delitem__(guild_id)
+        self._dirty.discard(guild_id)
+        self._deleted.add(guild_id)
+
+    def get(self, guild_id, default=None):
+        if guild_id in self:
+            return self[guild_id]
+        return default
+
+    def setdefault(self, guild_id, default=None):
+        if guild_id not in self:
+            self[guild_id] = default
+        return self[guild_id]
+
+    def pop(self, guild_id, *default):
+        if guild_id in self:
+            value = self._unpack(guild_id, super().__getitem__(guild_id))
+            del self[guild_id]
+            return value
+        if default:
+            return default[0]
+        raise KeyError(guild_id)
+
+    def items(self):
+        self.unpack_all()
+        self._dirty.update(self.keys())
+        return super().items()
+
+    def values(self):
+        self.unpack_all()
+        self._dirty.update(self.keys())
+        return super().values()
+
+    def peek(self, guild_id, default=None):
+        """Returns guild data without marking it for saving."""
+        if guild_id not in self:
+            return default
+        return self._unpack(guild_id, super().__getitem__(guild_id))
+
+    def unpack_all(self):
+        """Unpickles every record that's still packed."""
+        if self.packed:
+            for guild_id, value in list(super().items()):
+                self._unpack(guild_id, value)
+
+    def mark_dirty(self, guild_id):
+        if guild_id in self:
+            self._dirty.add(guild_id)
+
+    def drain(self):
+        """Returns and resets the ``(dirty, deleted)`` guild id sets."""
+        dirty, deleted = self._dirty, self._deleted
+        self._dirty, self._deleted = set(), set()
+        return (dirty, deleted)
+
+class GuildStore:
+    """SQLite backed store holding one pickled record per guild.
+
+    The database runs in WAL mode so a save only appends the records of
+    the guilds that changed since the last save, keeping save latency
+    bounded by the change set rather than the total amount of state.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        # saves run in the bot's thread pool, one at a time
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+        self._conn.execute(
+            'CREATE TABLE IF NOT EXISTS guilds ('
+            'guild_id INTEGER PRIMARY KEY, data BLOB NOT NULL)')
+        self._conn.commit()
+
+    def __len__(self):
+        return self._conn.execute('SELECT COUNT(*) FROM guilds').fetchone()[0]
+
+    def load(self, lazy=False, keep=None):
+        """Returns a :class:`GuildDict` with every stored guild, or the
+        ones ``keep(guild_id)`` is true for.
+
+        With ``lazy`` set the records are only read, each guild is
+        unpickled when it's first looked up.
+        """
+        guild_dict = GuildDict()
+        for guild_id, data in self._conn.execute('SELECT guild_id, data FROM guilds'):
+            if keep and not keep(guild_id):
+                continue
+            if lazy:
+                dict.__setitem__(guild_dict, guild_id, _Packed(data))
+                guild_dict.packed += 1
+            else:
+                dict.__setitem__(guild_dict, guild_id, pickle.loads(data))
+        return guild_dict
+
+    def import_pickle(self, path):
+        """Imports a whole-file serverdict pickle into the store.
+
+        Returns the number of guilds imported.
+        """
+        with open(path, 'rb') as fd:
+            data = pickle.load(fd)
+        guild_dict = GuildDict(data)
+        return self.save(guild_dict)
+
+    def snapshot(self, guild_dict):
+        """Pickles the dirty guilds of ``guild_dict`` and takes its change
+        sets. Returns the ``(rows, deleted)`` for :meth:`write`.
+
+        The records are mutated in place by the event loop, so this runs
+        on the loop, only the write goes to a thread.
+        """
+        dirty, deleted = guild_dict.drain()
+        try:
+            rows = []
+            for guild_id in dirty:
+                data = guild_dict.peek(guild_id)
+                if data is None:
+                    continue
+                rows.append((guild_id, pickle.dumps(data, -1)))
+        except Exception:
+            guild_dict._dirty.update(dirty)
+            guild_dict._deleted.update(deleted)
+            raise
+        return (rows, deleted)
+
+    def write(self, snapshot):
+        """Writes a :meth:`snapshot`, returning the number of guild
+        records written or removed."""
+        rows, deleted = snapshot
+        with self._conn:
+            self._conn.executemany(
+                'INSERT OR REPLACE INTO guilds (guild_id, data) VALUES (?, ?)', rows)
+            self._conn.executemany(
+                'DELETE FROM guilds WHERE guild_id = ?', [(g,) for g in deleted])
+        return len(rows) + len(deleted)
+
+    def restore(self, snapshot, guild_dict):
+        """Marks the changes of a snapshot that failed to write again, so
+        the next save retries them."""
+        rows, deleted = snapshot
+        guild_dict._dirty.update(guild_id for guild_id, __ in rows)
+        guild_dict._deleted.update(deleted)
+
+    def save(self, guild_dict):
+        """Writes the dirty and deleted guilds of ``guild_dict``.
+
+        Returns the number of guild records written or removed.
+        """
+        snapshot = self.snapshot(guild_dict)
+        try:
+            return self.write(snapshot)
+        except Exception:
+            self.restore(snapshot, guild_dict)
+            raise
+
+    def close(self):
+        self._conn.close()
+
+def open_store(data_dir='data'):
+    """Opens the guild store, importing the legacy serverdict pickle if
+    the store is still empty."""
+    store = GuildStore(os.path.join(data_dir, 'serverdict.db'))
+    if not len(store):
+        for name in ('serverdict', 'serverdict_backup'):
+            path = os.path.join(data_dir, name)
+            try:
+                count = store.import_pickle(path)
+            except OSError:
+                continue
+            logger.info(f'Imported {count} guilds from {name}')
+            break
+    return store
+
+def migrate(data_dir='data'):
+    """Runs the one-off imports into the store up front, so several
+    workers opening it at once don't each import part of the data."""
+    store = open_store(data_dir)
+    try:
+        wild_reports = WildReportStore(store)
+        if wild_reports.needs_import:
+            guild_dict = store.load()
+            count = wild_reports.import_guilds(guild_dict)
+            logger.info(f'Moved {count} wild reports out of the serverdict')
+    finally:
+        store.close()
+
+class WildReportStore:
+    """Wild reports of every guild, kept out of the guild records.
+
+    Reports are indexed by channel, and by expiry for the cleanup
+    passes. Changes are written row by row on :meth:`save`, so a
+    report costs one small write instead of re-pickling its guild.
+    Reports edited in place need :meth:`touch` to be saved.
+    """
+
+    def __init__(self, store):
+        self._conn = store._conn
+        self._conn.execute(
+            'CREATE TABLE IF NOT EXISTS wild_reports ('
+            'message_id INTEGER PRIMARY KEY, guild_id INTEGER NOT NULL, '
+            'data BLOB NOT NULL)')
+        self._conn.execute(
+            'CREATE TABLE IF NOT EXISTS migrations (name TEXT PRIMARY KEY)')
+        self._conn.commit()
+        # reports are still in the guild records until the import commits
+        self.needs_import = not self._conn.execute(
+            "SELECT 1 FROM migrations WHERE name = 'wild_reports'").fetchone()
+        self._reports = {}
+        self._channels = {}
+        self.expiry = ExpiryIndex()
+        self._dirty = set()
+        self._deleted = set()
+
+    def __len__(self):
+        return sum(len(reports) for reports in self._reports.values())
+
+    def load(self, keep=None):
+        """Reads every stored report, or those of the guilds
+        ``keep(guild_id)`` is true for. Returns the number loaded."""
+        count = 0
+        for message_id, guild_id, data in self._conn.execute(
+                'SELECT message_id, guild_id, data FROM wild_reports'):
+            if keep and not keep(guild_id):
+                continue
+            self._index(guild_id, message_id, pickle.loads(data))
+            count += 1
+        return count
+
+    def import_guilds(self, guild_dict):
+        """Moves the reports still saved in guild records into the store.
+
+        The reports, the guild records without them and the finished
+        migration are written in one transaction, so an import cut short
+        is simply run again. Returns the number of reports imported.
+        """
+        rows = []
+        guild_rows = []
+        for guild_id in list(guild_dict.keys()):
+            data = guild_dict.peek(guild_id)
+            if 'wildreport_dict' not in data:
+                continue
+            for message_id, report in data.pop('wildreport_dict').items():
+                self._index(guild_id, message_id, report)
+                rows.append((message_id, guild_id, pickle.dumps(report, -1)))
+            guild_rows.append((guild_id, pickle.dumps(data, -1)))
+        with self._conn:
+            self._conn.executemany(
+                'INSERT OR REPLACE INTO wild_reports (message_id, guild_id, data) '
+                'VALUES (?, ?, ?)', rows)
+            self._conn.executemany(
+                'INSERT OR REPLACE INTO guilds (guild_id, data) VALUES (?, ?)', guild_rows)
+            self._conn.execute("INSERT OR IGNORE INTO migrations (name) VALUES ('wild_reports')")
+        self.needs_import = False
+        return len(rows)
+
+    def _index(self, guild_id, message_id, report):
+        self._reports.setdefault(guild_id, {})[message_id] = report
+        self._channels.setdefault((guild_id, report.get('reportchannel')), {})[message_id] = None
+        self.expiry.add(report.get('exp', 0), (guild_id, message_id))
+
+    def add(self, guild_id, message_id, report):
+        self.remove(guild_id, message_id)
+        self._index(guild_id, message_id, report)
+        self._dirty.add((guild_id, message_id))
+        self._deleted.discard(message_id)
+
+    def get(self, guild_id, message_id):
+        return self._reports.get(guild_id, {}).get(message_id)
+
+    def touch(self, guild_id, message_id):
+        """Marks a report edited in place as needing a save."""
+        if self.get(guild_id, message_id) is not None:
+            self._dirty.add((guild_id, message_id))
+
+    def remove(self, guild_id, message_id):
+        """Removes and returns a report, or ``None`` if there isn't one."""
+        report = self._reports.get(guild_id, {}).pop(message_id, None)
+        if report is None:
+            return None
+        key = (guild_id, report.get('reportchannel'))
+        ids = self._channels.get(key)
+        if ids is not None:
+            ids.pop(message_id, None)
+            if not ids:
+                del self._channels[key]
+        self._dirty.discard((guild_id, message_id))
+        self._deleted.add(message_id)
+        return report
+
+    def reports(self, guild_id):
+        """Returns the ``{message_id: report}`` dict of a guild."""
+        return self._reports.get(guild_id, {})
+
+    def by_channel(self, guild_id, channel_id):
+        """Returns ``(message_id, report)`` pairs reported in a channel,
+        oldest first."""
+        reports = self.reports(guild_id)
+        return [(i, reports[i]) for i in self._channels.get((guild_id, channel_id), ())]
+
+    def pop_due(self, now=None):
+        """Returns the ``(guild_id, message_id)`` of every report due to
+        expire by ``now``. The reports themselves aren't removed."""
+        now = time.time() if now is None else now
+        due = []
+        for guild_id, message_id in self.expiry.pop_due(now):
+            report = self.get(guild_id, message_id)
+            if report is None:
+                continue
+            if report.get('exp', 0) > now:
+                # extended since it was indexed
+                self.expiry.add(report['exp'], (guild_id, message_id))
+                continue
+            due.append((guild_id, message_id))
+        return due
+
+    def snapshot(self):
+        """Pickles the changed reports and takes the change sets, on the
+        event loop like :meth:`GuildStore.snapshot`. Returns the
+        ``(rows, deleted)`` for :meth:`write`."""
+        dirty, deleted = self._dirty, self._deleted
+        self._dirty, self._deleted = set(), set()
+        try:
+            rows = []
+            for guild_id, message_id in dirty:
+                report = self.get(guild_id, message_id)
+                if report is not None:
+                    rows.append((message_id, guild_id, pickle.dumps(report, -1)))
+        except Exception:
+            self._dirty.update(dirty)
+            self._deleted.update(deleted)
+            raise
+        return (rows, deleted)
+
+    def write(self, snapshot):
+        """Writes a :meth:`snapshot`, returning the number of rows written
+        or removed."""
+        rows, deleted = snapshot
+        with self._conn:
+            self._conn.executemany(
+                'INSERT OR REPLACE INTO wild_reports (message_id, guild_id, data) '
+                'VALUES (?, ?, ?)', rows)
+            self._conn.executemany(
+                'DELETE FROM wild_reports WHERE message_id = ?', [(m,) for m in deleted])
+        return len(rows) + len(deleted)
+
+    def restore(self, snapshot):
+        rows, deleted = snapshot
+        self._dirty.update((guild_id, message_id) for message_id, guild_id, __ in rows)
+        self._deleted.update(deleted)
+
+    def save(self):
+        """Writes the changed and removed reports.
+
+        Returns the number of rows written or removed.
+        """
+        snapshot = self.snapshot()
+        try:
+            return self.write(snapshot)
+        except Exception:
+            self.restore(snapshot)
+            raise
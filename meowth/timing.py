@@ -0,0 +1,54 @@
+import logging
+import time
+from contextlib import contextmanager
+
+logger = logging.getLogger("meowth")
+
+class StageTimer:
+    """Records how long each stage of a multi step job takes.
+
+    Stages are timed with :meth:`stage`, :meth:`run` for coroutines that
+    may run concurrently, or :meth:`mark` for the time since the previous
+    stage ended, such as waiting on the gateway.
+    """
+
+    def __init__(self, label):
+        self.label = label
+        self.started = time.perf_counter()
+        self._last = self.started
+        self.stages = []
+        self.reported = False
+
+    @contextmanager
+    def stage(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._last = time.perf_counter()
+            self.stages.append((name, self._last - start))
+
+    async def run(self, name, coro):
+        with self.stage(name):
+            return await coro
+
+    def mark(self, name):
+        now = time.perf_counter()
+        self.stages.append((name, now - self._last))
+        self._last = now
+
+    @property
+    def total(self):
+        return self._last - self.started
+
+    def breakdown(self):
+        lines = [f'{name}: {seconds * 1000:.0f}ms' for name, seconds in self.stages]
+        lines.append(f'total: {self.total * 1000:.0f}ms')
+        return '\n'.join(lines)
+
+    def report(self):
+        """Logs the breakdown, once."""
+        if self.reported:
+            return
+        self.reported = True
+        logger.info(f'{self.label} - ' + ' | '.join(self.breakdown().splitlines()))
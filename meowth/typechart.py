@@ -0,0 +1,60 @@
+from array import array
+
+# damage multiplier per step of effectiveness in Pokemon Go
+STEP = 1.6
+
+class TypeMatrix:
+    """The type chart compiled for lookups by species.
+
+    ``chart`` maps a defending type to the attacking types that are
+    super effective (1), not very effective (-1) or barely effective
+    (-2) against it. It's stored as a dense matrix of those steps, and
+    the summed steps of every species in ``type_list`` are stored by
+    attacking type, so a species' weaknesses and the species weak to a
+    type are both read from one contiguous array.
+    """
+
+    def __init__(self, chart, type_list):
+        self.types = sorted(set(chart) | {t for row in chart.values() for t in row})
+        self.index = {name: i for i, name in enumerate(self.types)}
+        size = len(self.types)
+        self.matrix = array('b', bytes(size * size))
+        for defender, row in chart.items():
+            offset = self.index[defender] * size
+            for attacker, steps in row.items():
+                self.matrix[offset + self.index[attacker]] = steps
+        self.species = len(type_list)
+        self._columns = [array('b', bytes(self.species)) for _ in self.types]
+        for number, types in enumerate(type_list):
+            for defender in types:
+                offset = self.index[defender] * size
+                for attacker, column in enumerate(self._columns):
+                    column[number] += self.matrix[offset + attacker]
+
+    def steps(self, number):
+        """Returns ``{type: steps}`` of the types that aren't neutral
+        against species ``number``."""
+        number = int(number) - 1
+        ret = {}
+        for name, column in zip(self.types, self._columns):
+            if column[number]:
+                ret[name] = column[number]
+        return ret
+
+    def effects(self, number):
+        """Returns ``{type: multiplier}`` of the types that aren't
+        neutral against species ``number``."""
+        return {name: STEP ** steps for name, steps in self.steps(number).items()}
+
+    def weaknesses(self, number):
+        """Returns the types super effective against species ``number``,
+        strongest first, as ``(type, steps)`` pairs."""
+        weak = [(name, steps) for name, steps in self.steps(number).items() if steps > 0]
+        weak.sort(key=lambda x: x[1], reverse=True)
+        return weak
+
+    def weak_to(self, attacker, steps=1):
+        """Returns the numbers of the species that take at least
+        ``steps`` super effective steps from ``attacker``."""
+        column = self._columns[self.index[attacker.title()]]
+        return [number for number, value in enumerate(column, 1) if value >= steps]
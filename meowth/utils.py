@@ -192,26 +192,17 @@ async def get_raid_help(prefix, avatar, user=None):
     await user.send(embed=helpembed)
 
 def get_number(bot, pkm_name):
-    try:
-        number = bot.pkmn_info['pokemon_list'].index(pkm_name) + 1
-    except ValueError:
-        number = None
-    return number
+    return bot.pokedex.get_number(pkm_name)
 
 def get_name(bot, pkmn_number):
-    pkmn_number = int(pkmn_number) - 1
-    try:
-        name = bot.pkmn_info['pokemon_list'][pkmn_number]
-    except IndexError:
-        name = None
-    return name
+    return bot.pokedex.get_name(pkmn_number)
 
 def get_raidlist(bot):
     raidlist = []
     for level in bot.raid_info['raid_eggs']:
         for pokemon in bot.raid_info['raid_eggs'][level]['pokemon']:
             raidlist.append(pokemon)
-            raidlist.append(get_name(pokemon).lower())
+            raidlist.append(get_name(bot, pokemon).lower())
     return raidlist
 
 def get_level(bot, pkmn):
@@ -232,9 +223,7 @@ async def ask(bot, message, user_list=None, timeout=60, *, react_list=['✅', '
             return (user.id in user_list) and (reaction.message.id == message.id) and (reaction.emoji in react_list)
         elif not user_list:
             return (user.id != message.author.id) and (reaction.message.id == message.id) and (reaction.emoji in react_list)
-    for r in react_list:
-        await asyncio.sleep(0.25)
-        await message.add_reaction(r)
+    bot.reactions.add(message, react_list)
     try:
         reaction, user = await bot.wait_for('reaction_add', check=check, timeout=timeout)
         return reaction, user